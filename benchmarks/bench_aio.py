@@ -0,0 +1,57 @@
+import asyncio
+from time import perf_counter
+from typing import Awaitable, Callable
+from .models import Record, make_record
+
+
+async def watch(stalls: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started: float = perf_counter()
+        await asyncio.sleep(0)
+        stalls.append(perf_counter() - started)
+
+
+async def profile(label: str, decode: Callable[[], Awaitable[int]]) -> None:
+    stalls: list[float] = []
+    stop: asyncio.Event = asyncio.Event()
+    watcher: asyncio.Task = asyncio.create_task(watch(stalls, stop))
+    await asyncio.sleep(0)
+    started: float = perf_counter()
+    count: int = await decode()
+    elapsed: float = perf_counter() - started
+    stop.set()
+    await watcher
+    stalls.sort()
+    print(
+        f"{label:<32} {count / elapsed:>10.0f} records/s"
+        f" {stalls[int(len(stalls) * 0.99)] * 1e3:>10.2f} ms p99 stall"
+        f" {stalls[-1] * 1e3:>10.2f} ms max stall"
+    )
+
+
+def reader_for(data: bytes) -> asyncio.StreamReader:
+    reader: asyncio.StreamReader = asyncio.StreamReader(limit=len(data) + 1)
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+async def main() -> None:
+    records: list[Record] = [make_record(i) for i in range(100000)]
+    data: bytes = Record.to_json_array(records).encode()
+    lines: bytes = "".join([f"{x.json}\n" for x in records]).encode()
+
+    async def inline() -> int:
+        body: bytes = await reader_for(data).read()
+        return len(Record.from_json_array(body.decode()))
+
+    async def chunked() -> int:
+        reader: asyncio.StreamReader = reader_for(lines)
+        return len([x async for x in Record.aiter_json_lines(reader)])
+
+    await profile("from_json_array inline", inline)
+    await profile("aiter_json_lines", chunked)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
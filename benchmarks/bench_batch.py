@@ -0,0 +1,34 @@
+from typing import Any
+from .models import Student, make_student, make_student_payload
+from .timing import compare, measure
+
+
+def main() -> None:
+    rows: list[dict[str, Any]] = [make_student_payload(i) for i in range(1000)]
+    students: list[Student] = [make_student(i) for i in range(1000)]
+    single: float = measure(
+        "[from_dict(x) for x in rows] (1000 rows)",
+        lambda: [Student.from_dict(x) for x in rows],
+        number=100,
+    )
+    batch: float = measure(
+        "from_dicts(rows) (1000 rows)",
+        lambda: Student.from_dicts(rows),
+        number=100,
+    )
+    compare("speedup (decode)", single, batch)
+    single = measure(
+        "[x.dict for x in objects] (1000 rows)",
+        lambda: [x.dict for x in students],
+        number=100,
+    )
+    batch = measure(
+        "to_dicts(objects) (1000 rows)",
+        lambda: Student.to_dicts(students),
+        number=100,
+    )
+    compare("speedup (encode)", single, batch)
+
+
+if __name__ == "__main__":
+    main()
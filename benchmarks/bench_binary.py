@@ -0,0 +1,32 @@
+from .models import Record, make_record
+from .timing import compare, measure
+
+
+def main() -> None:
+    records: list[Record] = [make_record(i) for i in range(10000)]
+    texts: list[str] = [x.json for x in records]
+    blobs: list[bytes] = [x.to_bytes() for x in records]
+    print(f"{'json size':<48} {sum(map(len, texts)):>12} bytes")
+    print(f"{'binary size':<48} {sum(map(len, blobs)):>12} bytes")
+    before: float = measure(
+        "json encode (10000)", lambda: [x.json for x in records], 10
+    )
+    after: float = measure(
+        "binary encode (10000)", lambda: [x.to_bytes() for x in records], 10
+    )
+    compare("speedup (encode)", before, after)
+    before = measure(
+        "json decode (10000)",
+        lambda: [Record.from_json(x) for x in texts],
+        10,
+    )
+    after = measure(
+        "binary decode (10000)",
+        lambda: [Record.from_bytes(x) for x in blobs],
+        10,
+    )
+    compare("speedup (decode)", before, after)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+from datetime import datetime
+from uuid import UUID, uuid4
+from python_classy import Classy, immutable
+from .timing import compare, measure
+
+
+@immutable
+class Country(Classy):
+    id: UUID
+    code: str
+    name: str
+    currencies: tuple[str, ...]
+    updated_at: datetime
+
+
+@immutable(cache_encoding=True)
+class CachedCountry(Classy):
+    id: UUID
+    code: str
+    name: str
+    currencies: tuple[str, ...]
+    updated_at: datetime
+
+
+@immutable
+class Order(Classy):
+    id: UUID
+    country: Country
+
+
+@immutable
+class CachedOrder(Classy):
+    id: UUID
+    country: CachedCountry
+
+
+def main() -> None:
+    fields: dict = {
+        "id": uuid4(),
+        "code": "KR",
+        "name": "Republic of Korea",
+        "currencies": ("KRW",),
+        "updated_at": datetime(2023, 1, 1, 9, 30),
+    }
+    country: Country = Country(**fields)
+    cached: CachedCountry = CachedCountry(**fields)
+    before: float = measure(".dict (uncached)", lambda: country.dict)
+    after: float = measure(".dict (cache_encoding)", lambda: cached.dict)
+    compare("speedup", before, after)
+    before = measure(".json (uncached)", lambda: country.json)
+    after = measure(".json (cache_encoding)", lambda: cached.json)
+    compare("speedup", before, after)
+    orders: list[Order] = [
+        Order(id=uuid4(), country=country) for _ in range(1000)
+    ]
+    cached_orders: list[CachedOrder] = [
+        CachedOrder(id=uuid4(), country=cached) for _ in range(1000)
+    ]
+    before = measure(
+        "to_dicts() of 1000 orders (uncached)",
+        lambda: Order.to_dicts(orders),
+        100,
+    )
+    after = measure(
+        "to_dicts() of 1000 orders (cached country)",
+        lambda: CachedOrder.to_dicts(cached_orders),
+        100,
+    )
+    compare("speedup", before, after)
+
+
+if __name__ == "__main__":
+    main()
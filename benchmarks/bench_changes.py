@@ -0,0 +1,55 @@
+import json
+from uuid import UUID, uuid4
+from python_classy import Classy, mutable
+from .timing import compare, measure
+
+
+@mutable(track_changes=True)
+class Member(Classy):
+    id: UUID
+    name: str
+    score: float
+    tags: list[str]
+
+
+@mutable(track_changes=True)
+class Roster(Classy):
+    title: str
+    leader: Member
+    members: list[Member]
+
+
+def make_roster(size: int) -> Roster:
+    members: list[Member] = [
+        Member(id=uuid4(), name=f"member-{i}", score=i / 7, tags=["a", "b"])
+        for i in range(size)
+    ]
+    return Roster(title="Roster", leader=members[0], members=members)
+
+
+def main() -> None:
+    for size in [10, 1000]:
+        roster: Roster = make_roster(size)
+        roster.title = "Renamed"
+        roster.leader.score = 1.0
+        full: str = roster.json
+        delta: str = json.dumps(roster.changes())
+        print(
+            f"{f'full json size ({size} members)':<48} {len(full):>12} bytes"
+        )
+        print(
+            f"{f'delta json size ({size} members)':<48} {len(delta):>12} bytes"
+        )
+        before: float = measure(
+            f"full .json ({size} members)", lambda: roster.json, 100
+        )
+        after: float = measure(
+            f"json.dumps(changes()) ({size} members)",
+            lambda: json.dumps(roster.changes()),
+            100,
+        )
+        compare("speedup", before, after)
+
+
+if __name__ == "__main__":
+    main()
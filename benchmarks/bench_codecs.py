@@ -0,0 +1,84 @@
+import json
+from base64 import b64decode, b64encode
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any
+from uuid import UUID, uuid4
+from python_classy import Classy, immutable
+from .models import Student, make_student_payload
+from .timing import compare, measure
+
+
+class Status(Enum):
+    ACTIVE = "active"
+    CLOSED = "closed"
+
+
+@immutable
+class Invoice(Classy):
+    id: UUID
+    amount: Decimal
+    status: Status
+    attachment: Path
+    signature: bytes
+    issued_at: datetime
+
+
+def make_invoice_payload(index: int) -> dict[str, Any]:
+    return {
+        "id": str(uuid4()),
+        "amount": f"{index}.25",
+        "status": "active" if index % 2 else "closed",
+        "attachment": f"/invoices/{index}.pdf",
+        "signature": b64encode(index.to_bytes(8, "little")).decode("ascii"),
+        "issued_at": datetime(2023, 1, 1 + index % 28, 9, 30).isoformat(),
+    }
+
+
+def wrapped_from_dict(payload: dict[str, Any]) -> Invoice:
+    # What callers had to write before codecs were pluggable.
+    return Invoice.from_dict(
+        {
+            **payload,
+            "amount": Decimal(payload["amount"]),
+            "status": Status(payload["status"]),
+            "attachment": Path(payload["attachment"]),
+            "signature": b64decode(payload["signature"]),
+        }
+    )
+
+
+def wrapped_json(value: Invoice) -> str:
+    d: dict[str, Any] = value.dict
+    d["amount"] = str(d["amount"])
+    d["status"] = d["status"].value
+    d["attachment"] = str(d["attachment"])
+    d["signature"] = b64encode(d["signature"]).decode("ascii")
+    d["issued_at"] = d["issued_at"].isoformat()
+    return json.dumps(d, default=str)
+
+
+def main() -> None:
+    student: dict[str, Any] = make_student_payload(0)
+    payload: dict[str, Any] = make_invoice_payload(7)
+    value: Invoice = Invoice.from_dict(payload)
+    measure(
+        "from_dict() (native types only)",
+        lambda: Student.from_dict(student),
+    )
+    before: float = measure(
+        "from_dict() (manual wrapper)", lambda: wrapped_from_dict(payload)
+    )
+    after: float = measure(
+        "from_dict() (codecs)", lambda: Invoice.from_dict(payload)
+    )
+    compare("speedup", before, after)
+    before = measure(".json (manual wrapper)", lambda: wrapped_json(value))
+    after = measure(".json (codecs)", lambda: value.json)
+    compare("speedup", before, after)
+
+
+if __name__ == "__main__":
+    main()
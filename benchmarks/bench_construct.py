@@ -0,0 +1,57 @@
+from dataclasses import dataclass
+from python_classy import Classy, immutable, mutable
+from .timing import compare, measure
+
+
+@dataclass(eq=False, kw_only=True, frozen=True)
+class PlainFrozen:
+    name: str
+    age: int
+
+
+@dataclass(eq=False, kw_only=True)
+class PlainMutable:
+    name: str
+    age: int
+
+
+@immutable
+class ClassyFrozen(Classy):
+    name: str
+    age: int
+
+
+@mutable
+class ClassyMutable(Classy):
+    name: str
+    age: int
+
+
+def main() -> None:
+    number: int = 200000
+    plain: float = measure(
+        "dataclass(frozen=True)",
+        lambda: PlainFrozen(name="John", age=29),
+        number=number,
+    )
+    classy: float = measure(
+        "@immutable Classy",
+        lambda: ClassyFrozen(name="John", age=29),
+        number=number,
+    )
+    compare("overhead over dataclass (frozen)", classy, plain)
+    plain = measure(
+        "dataclass()",
+        lambda: PlainMutable(name="John", age=29),
+        number=number,
+    )
+    classy = measure(
+        "@mutable Classy",
+        lambda: ClassyMutable(name="John", age=29),
+        number=number,
+    )
+    compare("overhead over dataclass (mutable)", classy, plain)
+
+
+if __name__ == "__main__":
+    main()
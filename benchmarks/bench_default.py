@@ -0,0 +1,89 @@
+from datetime import date, datetime, time
+from inspect import FullArgSpec, getfullargspec
+from types import GenericAlias
+from typing import Any, Type, get_args
+from uuid import UUID, uuid4
+from python_classy import Classy, immutable
+from .models import Class
+from .timing import compare, measure
+
+
+def legacy_default(cls: Type[Any]) -> Any:
+    # The uncompiled default() implementation, kept as a baseline.
+    def __get_constructor_args(cls: Type[Any]) -> dict[str, Type[Any]]:
+        argspec: FullArgSpec = getfullargspec(cls.__init__)
+        args: dict[str, Type[Any]] = argspec.annotations
+        args.pop("return", None)
+        return args
+
+    def __default_nested(__type: Type) -> Any:
+        if isinstance(__type, GenericAlias):
+            collection_type: type = __type.__origin__
+            if collection_type == list:
+                return collection_type()
+            if collection_type == tuple:
+                item_types: tuple[Any, ...] = get_args(__type)
+                if len(item_types) == 0:
+                    return tuple()
+                return tuple([__default_nested(t) for t in item_types])
+            if collection_type == dict:
+                return collection_type()
+            raise TypeError(
+                "Unsupported generic type detected in dataclass fields."
+            )
+        if issubclass(__type, Classy):
+            return legacy_default(__type)
+        if __type == UUID:
+            return uuid4()
+        if __type == datetime:
+            return datetime.now()
+        if __type == date:
+            return date.today()
+        if __type == time:
+            return datetime.now().time()
+        return __type()
+
+    init_args: dict[str, type] = __get_constructor_args(cls)
+    default_dict: dict[str, Any] = dict(
+        [(k, __default_nested(t)) for k, t in init_args.items()]
+    )
+    return cls(**default_dict)
+
+
+@immutable
+class Leaf(Classy):
+    name: str
+    value: float
+    flags: tuple[bool, bool]
+
+
+@immutable
+class Branch(Classy):
+    name: str
+    left: Leaf
+    right: Leaf
+
+
+@immutable
+class Tree(Classy):
+    name: str
+    left: Branch
+    right: Branch
+    pair: tuple[Branch, Leaf]
+
+
+def main() -> None:
+    for cls in [Class, Tree]:
+        before: float = measure(
+            f"legacy default() ({cls.__name__})",
+            lambda: legacy_default(cls),
+            10000,
+        )
+        after: float = measure(
+            f"compiled default() ({cls.__name__})", cls.default, 10000
+        )
+        compare("speedup", before, after)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+from dataclasses import asdict
+from typing import Any
+from python_classy import Classy
+from .models import make_class
+from .timing import compare, measure
+
+
+def legacy_dict(value: Any) -> dict[str, Any]:
+    # Reference copy of the asdict based encoder.
+    return dict(
+        [
+            (k, v.dict) if isinstance(v, Classy) else (k, v)
+            for k, v in asdict(value).items()
+            if not k.startswith("_")
+        ]
+    )
+
+
+def main() -> None:
+    for size in [10, 1000]:
+        aggregate = make_class(size)
+        assert legacy_dict(aggregate) == aggregate.dict
+        number: int = 20000 // size
+        legacy: float = measure(
+            f"asdict encoder ({size} students)",
+            lambda: legacy_dict(aggregate),
+            number=number,
+        )
+        compiled: float = measure(
+            f"generated encoder ({size} students)",
+            lambda: aggregate.dict,
+            number=number,
+        )
+        compare(f"speedup ({size} students)", legacy, compiled)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import os
+import tracemalloc
+from time import perf_counter
+from typing import Callable
+from python_classy import Classy, immutable
+from .models import Record, make_record
+
+
+@immutable
+class Catalog(Classy):
+    name: str
+    records: list[Record]
+
+
+def profile(label: str, write: Callable[[], None]) -> None:
+    started: float = perf_counter()
+    write()
+    elapsed: float = perf_counter() - started
+    tracemalloc.start()
+    write()
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:<32} {elapsed:>8.2f} s {peak / 2**20:>10.1f} MB peak")
+
+
+def main() -> None:
+    catalog: Catalog = Catalog(
+        name="catalog", records=[make_record(i) for i in range(200000)]
+    )
+    with open(os.devnull, "w", encoding="utf-8") as fp:
+        profile("fp.write(catalog.json)", lambda: fp.write(catalog.json))
+        profile("catalog.dump(fp)", lambda: catalog.dump(fp))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+from python_classy import Classy, immutable
+from .timing import compare, measure
+
+
+@immutable
+class HandWritten(Classy):
+    row: int
+    column: int
+    label: str
+
+    def compute_hash(self) -> int:
+        return hash(self.row) ^ hash(self.column) ^ hash(self.label)
+
+    def equals(self, __o: object) -> bool:
+        if not isinstance(__o, HandWritten):
+            return False
+        return (
+            self.row == __o.row
+            and self.column == __o.column
+            and self.label == __o.label
+        )
+
+
+@immutable(value_equality=True)
+class Generated(Classy):
+    row: int
+    column: int
+    label: str
+
+
+def make_cells(cls: type[HandWritten] | type[Generated]) -> list[Classy]:
+    return [
+        cls(row=i, column=j, label="cell")
+        for i in range(300)
+        for j in range(300)
+    ]
+
+
+def collision_rate(objects: list[Classy]) -> float:
+    return 1 - len({hash(x) for x in objects}) / len(objects)
+
+
+def main() -> None:
+    hand_written: list[Classy] = make_cells(HandWritten)
+    generated: list[Classy] = make_cells(Generated)
+    print(
+        f"{'hand-written collision rate':<48}"
+        f" {collision_rate(hand_written):>12.2%}"
+    )
+    print(
+        f"{'generated collision rate':<48}"
+        f" {collision_rate(generated):>12.2%}"
+    )
+    before: float = measure(
+        "hand-written set build (90000)", lambda: set(hand_written), 3
+    )
+    after: float = measure(
+        "generated set build (90000)", lambda: set(generated), 3
+    )
+    compare("speedup (set)", before, after)
+    hand_written_pairs: list[tuple[Classy, Classy]] = list(
+        zip(hand_written, hand_written[1:])
+    )
+    generated_pairs: list[tuple[Classy, Classy]] = list(
+        zip(generated, generated[1:])
+    )
+    before = measure(
+        "hand-written equals (90000)",
+        lambda: [a == b for a, b in hand_written_pairs],
+        10,
+    )
+    after = measure(
+        "generated equals (90000)",
+        lambda: [a == b for a, b in generated_pairs],
+        10,
+    )
+    compare("speedup (equals)", before, after)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+from dataclasses import replace
+from .models import Class, make_class
+from .timing import compare, measure
+
+
+def main() -> None:
+    for size in [10, 1000]:
+        value: Class = make_class(size)
+        before: float = measure(
+            f"from_dict(obj.dict | changes) ({size} students)",
+            lambda: Class.from_dict(value.dict | {"name": "Renamed"}),
+            10,
+        )
+        middle: float = measure(
+            f"dataclasses.replace ({size} students)",
+            lambda: replace(value, name="Renamed"),
+            10000,
+        )
+        after: float = measure(
+            f"evolve ({size} students)",
+            lambda: value.evolve(name="Renamed"),
+            10000,
+        )
+        compare("speedup vs dict round trip", before, after)
+        compare("speedup vs dataclasses.replace", middle, after)
+        measure(
+            f"evolve nested path ({size} students)",
+            lambda: value.evolve(**{"leader.name": "Renamed"}),
+            10000,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+from datetime import date, datetime, time
+from inspect import FullArgSpec, getfullargspec
+from types import GenericAlias
+from typing import Any, Dict, Type, get_args
+from uuid import UUID
+from python_classy import Classy
+from .models import Class, Student, make_class_payload
+from .timing import compare, measure
+
+
+def legacy_from_dict(cls: Type[Any], dictionary: Dict[str, Any]) -> Any:
+    # Reference copy of the uncompiled decoder, re-introspecting per call.
+    def __decode_nested(__type: Type, __value: Any) -> Any:
+        if isinstance(__type, GenericAlias):
+            collection_type: type = __type.__origin__
+            item_types: tuple[Any, ...] = get_args(__type)
+            if collection_type == list:
+                return [__decode_nested(item_types[0], x) for x in __value]
+            if collection_type == tuple:
+                return tuple(
+                    [
+                        __decode_nested(item_types[i], x)
+                        for i, x in enumerate(__value)
+                    ]
+                )
+            if collection_type == dict:
+                return {
+                    x: __decode_nested(item_types[1], y)
+                    for x, y in __value.items()
+                    if isinstance(x, item_types[0])
+                }
+        if isinstance(__value, __type):
+            return __value
+        if issubclass(__type, Classy):
+            return legacy_from_dict(__type, __value)
+        if __type == UUID:
+            return UUID(__value)
+        if __type == datetime:
+            return datetime.fromisoformat(__value)
+        if __type == date:
+            return date.fromisoformat(__value)
+        if __type == time:
+            return time.fromisoformat(__value)
+        return __value
+
+    argspec: FullArgSpec = getfullargspec(cls.__init__)
+    init_args: dict[str, Any] = argspec.annotations
+    arg_names: list[str] = list(init_args.keys())
+    return cls(
+        **dict(
+            [
+                (k, __decode_nested(init_args[k], v))
+                for k, v in dictionary.items()
+                if k in arg_names
+            ]
+        )
+    )
+
+
+def main() -> None:
+    student: dict[str, Any] = {
+        "id": "12345678123456781234567812345678",
+        "name": "John",
+        "age": 21,
+        "enrolled_at": "2023-03-01T09:30:00",
+    }
+    aggregate: dict[str, Any] = make_class_payload(50)
+    legacy: float = measure(
+        "legacy from_dict (flat)", lambda: legacy_from_dict(Student, student)
+    )
+    compiled: float = measure(
+        "compiled from_dict (flat)", lambda: Student.from_dict(student)
+    )
+    compare("speedup (flat)", legacy, compiled)
+    legacy = measure(
+        "legacy from_dict (50 nested students)",
+        lambda: legacy_from_dict(Class, aggregate),
+        number=200,
+    )
+    compiled = measure(
+        "compiled from_dict (50 nested students)",
+        lambda: Class.from_dict(aggregate),
+        number=200,
+    )
+    compare("speedup (nested)", legacy, compiled)
+
+
+if __name__ == "__main__":
+    main()
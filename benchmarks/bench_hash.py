@@ -0,0 +1,73 @@
+import sys
+from collections import Counter
+from python_classy import Classy, immutable
+from .timing import compare, measure
+
+
+@immutable
+class Point(Classy):
+    x: int
+    y: int
+
+    def compute_hash(self) -> int:
+        return hash((self.x, self.y))
+
+    def equals(self, __o: object) -> bool:
+        if not isinstance(__o, Point):
+            return False
+        return self.x == __o.x and self.y == __o.y
+
+
+@immutable
+class Shape(Classy):
+    name: str
+    points: tuple[Point, ...]
+
+    def compute_hash(self) -> int:
+        return hash((self.name, self.points))
+
+    def equals(self, __o: object) -> bool:
+        if not isinstance(__o, Shape):
+            return False
+        return self.name == __o.name and self.points == __o.points
+
+
+@immutable(cache_hash=True)
+class CachedPoint(Point):
+    pass
+
+
+@immutable(cache_hash=True)
+class CachedShape(Shape):
+    pass
+
+
+def make_shapes(point: type[Point], shape: type[Shape]) -> list[Shape]:
+    return [
+        shape(
+            name=f"shape-{i}",
+            points=tuple([point(x=i, y=j) for j in range(8)]),
+        )
+        for i in range(50000)
+    ]
+
+
+def dedup(objects: list[Shape]) -> int:
+    return len(set(objects)) + len(Counter(objects))
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    plain: list[Shape] = make_shapes(Point, Shape)
+    cached: list[Shape] = make_shapes(CachedPoint, CachedShape)
+    plain = [plain[i % len(plain)] for i in range(count)]
+    cached = [cached[i % len(cached)] for i in range(count)]
+    before: float = measure(f"dedup ({count})", lambda: dedup(plain), 3)
+    after: float = measure(
+        f"dedup with cache_hash ({count})", lambda: dedup(cached), 3
+    )
+    compare("speedup", before, after)
+
+
+if __name__ == "__main__":
+    main()
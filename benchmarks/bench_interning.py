@@ -0,0 +1,63 @@
+import random
+import sys
+import tracemalloc
+from typing import Any
+from python_classy import Classy, immutable
+from .timing import measure
+
+
+@immutable(value_equality=True)
+class Region(Classy):
+    code: str
+    name: str
+    currency: str
+
+
+@immutable(value_equality=True, interned=True)
+class InternedRegion(Region):
+    pass
+
+
+@immutable(value_equality=True, intern_maxsize=64)
+class BoundedRegion(Region):
+    pass
+
+
+def make_payloads(count: int) -> list[dict[str, Any]]:
+    regions: list[dict[str, Any]] = [
+        {"code": f"R{i:03}", "name": f"region-{i}", "currency": f"C{i % 50}"}
+        for i in range(500)
+    ]
+    weights: list[float] = [1 / (i + 1) for i in range(len(regions))]
+    return [
+        dict(x)
+        for x in random.Random(0).choices(regions, weights=weights, k=count)
+    ]
+
+
+def retained_mb(cls: type[Region], payloads: list[dict[str, Any]]) -> float:
+    tracemalloc.start()
+    objects: list[Region] = cls.from_dicts(payloads)
+    size: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return size / 1024 / 1024
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    payloads: list[dict[str, Any]] = make_payloads(count)
+    for cls in [Region, InternedRegion, BoundedRegion]:
+        print(
+            f"{f'{cls.__name__} retained':<48}"
+            f" {retained_mb(cls, payloads):>12.1f} MB"
+        )
+        measure(
+            f"{cls.__name__}.from_dicts ({count})",
+            lambda: cls.from_dicts(payloads),
+            3,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+from .models import Record, make_record
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def write(path: str, count: int) -> None:
+    started: float = perf_counter()
+    with open(path, "w", encoding="utf-8") as fp:
+        Record.dump_json_lines((make_record(i) for i in range(count)), fp)
+    report("dump_json_lines", count, perf_counter() - started)
+
+
+def read_streaming(path: str) -> None:
+    started: float = perf_counter()
+    with open(path, encoding="utf-8") as fp:
+        count: int = sum(1 for _ in Record.iter_json_lines(fp))
+    report("iter_json_lines", count, perf_counter() - started)
+
+
+def read_eager(path: str) -> None:
+    started: float = perf_counter()
+    with open(path, encoding="utf-8") as fp:
+        records: list[Record] = [Record.from_json(x) for x in fp]
+    report(
+        "[from_json(x) for x in fp]", len(records), perf_counter() - started
+    )
+
+
+def report(label: str, count: int, elapsed: float) -> None:
+    print(
+        f"{label:<32} {count / elapsed:>12.0f} records/s"
+        f" {peak_rss_mb():>10.1f} MB peak RSS"
+    )
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, "records.jsonl")
+        for mode in ["write", "read_streaming", "read_eager"]:
+            subprocess.run(
+                [sys.executable, "-m", __spec__.name, mode, path, str(count)],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4:
+        mode, path, count = sys.argv[1:]
+        if mode == "write":
+            write(path, int(count))
+        else:
+            globals()[mode](path)
+    else:
+        main()
@@ -0,0 +1,44 @@
+from typing import Any
+from .models import Class, make_class_payload
+from .timing import compare, measure
+
+
+def partial(defer: bool, payload: dict[str, Any]) -> Any:
+    value: Class = Class.from_dict(payload, defer=defer)
+    return value.name, value.leader.name
+
+
+def full(defer: bool, payload: dict[str, Any]) -> Any:
+    value: Class = Class.from_dict(payload, defer=defer)
+    return [x.name for x in value.students], value.students_by_name
+
+
+def main() -> None:
+    for size in [10, 100, 1000]:
+        payload: dict[str, Any] = make_class_payload(size)
+        before: float = measure(
+            f"eager, read 2 fields ({size} students)",
+            lambda: partial(False, payload),
+            100,
+        )
+        after: float = measure(
+            f"lazy, read 2 fields ({size} students)",
+            lambda: partial(True, payload),
+            100,
+        )
+        compare("speedup (partial access)", before, after)
+        before = measure(
+            f"eager, read everything ({size} students)",
+            lambda: full(False, payload),
+            100,
+        )
+        after = measure(
+            f"lazy, read everything ({size} students)",
+            lambda: full(True, payload),
+            100,
+        )
+        compare("speedup (full access)", before, after)
+
+
+if __name__ == "__main__":
+    main()
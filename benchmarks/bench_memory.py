@@ -0,0 +1,43 @@
+import gc
+import tracemalloc
+from typing import Any, Callable
+from python_classy import Classy, immutable
+
+
+@immutable
+class Money(Classy):
+    currency: str
+    amount: int
+
+
+@immutable(slots=True)
+class SlottedMoney(Classy):
+    currency: str
+    amount: int
+
+
+def footprint(factory: Callable[[int], Any], count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    values: list[Any] = [factory(i) for i in range(count)]
+    after: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del values
+    return (after - before) / count
+
+
+def main() -> None:
+    count: int = 100000
+    regular: float = footprint(
+        lambda i: Money(currency="KRW", amount=i), count
+    )
+    slotted: float = footprint(
+        lambda i: SlottedMoney(currency="KRW", amount=i), count
+    )
+    print(f"{'@immutable':<48} {regular:>12.1f} bytes/object")
+    print(f"{'@immutable(slots=True)':<48} {slotted:>12.1f} bytes/object")
+
+
+if __name__ == "__main__":
+    main()
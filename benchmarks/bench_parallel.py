@@ -0,0 +1,34 @@
+import os
+from time import perf_counter
+from .models import Student, make_student
+
+
+def rate(payloads: list[str], workers: int | None) -> float:
+    started: float = perf_counter()
+    Student.from_json_many(payloads, workers=workers)
+    return len(payloads) / (perf_counter() - started)
+
+
+def main() -> None:
+    payloads: list[str] = [make_student(i).json for i in range(200000)]
+    print(f"cpu count: {os.cpu_count()}")
+    serial: float = rate(payloads, 1)
+    print(f"{'serial':<24} {serial:>12.0f} records/s")
+    for workers in [2, 4, 8]:
+        parallel: float = rate(payloads, workers)
+        print(
+            f"{f'{workers} workers':<24} {parallel:>12.0f}"
+            f" records/s {parallel / serial:>8.2f} x"
+            + (" (parallel wins)" if parallel > serial else "")
+        )
+    for size in [1000, 5000, 20000, 100000]:
+        serial = rate(payloads[:size], 1)
+        default: float = rate(payloads[:size], None)
+        print(
+            f"{f'{size} records, defaults':<24} {default:>12.0f}"
+            f" records/s {default / serial:>8.2f} x"
+        )
+
+
+if __name__ == "__main__":
+    main()
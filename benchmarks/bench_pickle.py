@@ -0,0 +1,49 @@
+import copyreg
+import io
+import pickle
+from typing import Any
+from python_classy import Classy
+from .models import Student, make_student
+from .timing import compare, measure
+
+
+class LegacyPickler(pickle.Pickler):
+    # Pickles Classy objects the way plain dataclasses are pickled.
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, Classy):
+            return (copyreg.__newobj__, (type(obj),), dict(vars(obj)))
+        return NotImplemented
+
+
+def legacy_dumps(value: Any) -> bytes:
+    buffer: io.BytesIO = io.BytesIO()
+    LegacyPickler(buffer, pickle.HIGHEST_PROTOCOL).dump(value)
+    return buffer.getvalue()
+
+
+def main() -> None:
+    students: list[Student] = [make_student(i) for i in range(10000)]
+    legacy: bytes = legacy_dumps(students)
+    compact: bytes = pickle.dumps(students, pickle.HIGHEST_PROTOCOL)
+    print(f"{'__dict__ state size':<48} {len(legacy):>12} bytes")
+    print(f"{'positional state size':<48} {len(compact):>12} bytes")
+    before: float = measure(
+        "__dict__ state dumps (10000)", lambda: legacy_dumps(students), 10
+    )
+    after: float = measure(
+        "positional state dumps (10000)",
+        lambda: pickle.dumps(students, pickle.HIGHEST_PROTOCOL),
+        10,
+    )
+    compare("speedup (dumps)", before, after)
+    before = measure(
+        "__dict__ state loads (10000)", lambda: pickle.loads(legacy), 10
+    )
+    after = measure(
+        "positional state loads (10000)", lambda: pickle.loads(compact), 10
+    )
+    compare("speedup (loads)", before, after)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+from typing import Any
+from .models import Class, make_class
+from .timing import compare, measure
+
+
+def filtered(value: Class) -> dict[str, Any]:
+    # What callers had to write before projections were supported.
+    d: dict[str, Any] = value.dict
+    return {
+        "name": d["name"],
+        "students": [{"name": x["name"]} for x in d["students"]],
+    }
+
+
+def dropped(value: Class) -> dict[str, Any]:
+    d: dict[str, Any] = value.dict
+    del d["students_by_name"], d["tags"]
+    return d
+
+
+def main() -> None:
+    for size in [10, 100, 1000]:
+        value: Class = make_class(size)
+        number: int = max(10, 10000 // size)
+        before: float = measure(
+            f".dict + filtering ({size} students)",
+            lambda: filtered(value),
+            number,
+        )
+        after: float = measure(
+            f"to_dict(include=...) ({size} students)",
+            lambda: value.to_dict(include=("name", "students.name")),
+            number,
+        )
+        compare("speedup", before, after)
+        before = measure(
+            f".dict + deleting keys ({size} students)",
+            lambda: dropped(value),
+            number,
+        )
+        after = measure(
+            f"to_dict(exclude=...) ({size} students)",
+            lambda: value.to_dict(exclude=("students_by_name", "tags")),
+            number,
+        )
+        compare("speedup", before, after)
+
+
+if __name__ == "__main__":
+    main()
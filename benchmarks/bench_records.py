@@ -0,0 +1,69 @@
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+from typing import Any
+from .models import Record, make_record
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def write(directory: str, count: int) -> None:
+    with open(os.path.join(directory, "records.jsonl"), "w") as fp:
+        Record.dump_json_lines((make_record(i) for i in range(count)), fp)
+    Record.write_records(
+        (make_record(i) for i in range(count)),
+        os.path.join(directory, "records.bin"),
+    )
+
+
+def read_eager(directory: str) -> None:
+    started: float = perf_counter()
+    with open(os.path.join(directory, "records.jsonl")) as fp:
+        records: list[Record] = list(Record.iter_json_lines(fp))
+    report("eager (iter_json_lines)", records, perf_counter() - started)
+
+
+def read_mmap(directory: str) -> None:
+    started: float = perf_counter()
+    records: Any = Record.open_records(os.path.join(directory, "records.bin"))
+    report("mmap (open_records)", records, perf_counter() - started)
+
+
+def report(label: str, records: Any, opened: float) -> None:
+    indexes: list[int] = random.Random(0).choices(range(len(records)), k=10000)
+    started: float = perf_counter()
+    for i in indexes:
+        records[i].name
+    latency: float = (perf_counter() - started) / len(indexes) * 1e6
+    print(
+        f"{label:<28} open {opened * 1e3:>10.1f} ms"
+        f" {latency:>8.2f} us/lookup {peak_rss_mb():>8.1f} MB peak RSS"
+    )
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    with tempfile.TemporaryDirectory() as directory:
+        for mode in ["write", "read_eager", "read_mmap"]:
+            subprocess.run(
+                [sys.executable, "-m", __spec__.name, mode, directory]
+                + [str(count)],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4:
+        mode, directory, count = sys.argv[1:]
+        if mode == "write":
+            write(directory, int(count))
+        else:
+            globals()[mode](directory)
+    else:
+        main()
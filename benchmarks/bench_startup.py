@@ -0,0 +1,120 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import python_classy
+from .timing import compare
+
+_MODELS: int = 300
+_RUNS: int = 5
+_SCRIPT: str = """
+from time import perf_counter
+start = perf_counter()
+import startup_models as m
+for cls, payload in m.MODELS:
+    cls.from_dict(payload).dict
+    cls.default()
+print(perf_counter() - start)
+"""
+
+
+def write_models(path: Path) -> None:
+    lines: list[str] = [
+        "from datetime import datetime",
+        "from uuid import UUID",
+        "from python_classy import Classy, immutable",
+        "",
+        "",
+        "@immutable",
+        "class Tag(Classy):",
+        "    name: str",
+        "    weight: float",
+        "",
+    ]
+    models: list[str] = []
+    for i in range(_MODELS):
+        lines += [
+            "",
+            "@immutable",
+            f"class Model{i}(Classy):",
+            "    id: UUID",
+            "    name: str",
+            "    count: int",
+            "    created_at: datetime",
+            "    tags: list[Tag]",
+            "    labels: dict[str, int]",
+            "    parent: Tag | None",
+            "",
+        ]
+        models += [f"(Model{i}, PAYLOAD)"]
+    lines += [
+        "",
+        "PAYLOAD = {",
+        "    'id': '12345678-1234-5678-1234-567812345678',",
+        "    'name': 'model',",
+        "    'count': 1,",
+        "    'created_at': '2023-01-01T09:30:00',",
+        "    'tags': [{'name': 'a', 'weight': 1.0}],",
+        "    'labels': {'a': 1},",
+        "    'parent': None,",
+        "}",
+        f"MODELS = [{', '.join(models)}]",
+        "",
+    ]
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def cold_start(directory: str) -> float:
+    env: dict[str, str] = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [directory, str(Path(python_classy.__file__).parent.parent)]
+    )
+    timings: list[float] = []
+    for _ in range(_RUNS):
+        output: str = subprocess.run(
+            [sys.executable, "-c", _SCRIPT],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        timings.append(float(output))
+    return min(timings)
+
+
+def main() -> None:
+    with TemporaryDirectory() as directory:
+        write_models(Path(directory) / "startup_models.py")
+        cold_start(directory)
+        before: float = cold_start(directory)
+        print(
+            f"{f'cold start ({_MODELS} models, runtime)':<48} {before * 1e3:>12.3f} ms"
+        )
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "python_classy",
+                "compile",
+                "startup_models",
+            ],
+            cwd=directory,
+            env={
+                **os.environ,
+                "PYTHONPATH": str(Path(python_classy.__file__).parent.parent),
+            },
+            check=True,
+            capture_output=True,
+        )
+        cold_start(directory)
+        after: float = cold_start(directory)
+        print(
+            f"{f'cold start ({_MODELS} models, precompiled)':<48} {after * 1e3:>12.3f} ms"
+        )
+        compare("speedup", before, after)
+
+
+if __name__ == "__main__":
+    main()
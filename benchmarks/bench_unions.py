@@ -0,0 +1,80 @@
+from typing import Any, Literal
+from python_classy import Classy, immutable
+from .timing import compare, measure
+
+
+@immutable
+class Created(Classy):
+    type: Literal["created"]
+    id: int
+    name: str
+
+
+@immutable
+class Renamed(Classy):
+    type: Literal["renamed"]
+    id: int
+    old: str
+    new: str
+
+
+@immutable
+class Moved(Classy):
+    type: Literal["moved"]
+    id: int
+    x: float
+    y: float
+
+
+@immutable
+class Deleted(Classy):
+    type: Literal["deleted"]
+    id: int
+
+
+@immutable
+class Stream(Classy):
+    events: list[Created | Renamed | Moved | Deleted]
+
+
+def make_events(size: int) -> list[dict[str, Any]]:
+    kinds: list[dict[str, Any]] = [
+        {"type": "created", "name": "John"},
+        {"type": "renamed", "old": "John", "new": "Sarah"},
+        {"type": "moved", "x": 1.5, "y": 2.5},
+        {"type": "deleted"},
+    ]
+    return [{**kinds[i % len(kinds)], "id": i} for i in range(size)]
+
+
+def try_each(payload: dict[str, Any]) -> Any:
+    # What callers had to write before unions were supported.
+    for cls in (Created, Renamed, Moved, Deleted):
+        try:
+            event: Any = cls.from_dict(payload)
+        except TypeError:
+            continue
+        if event.type == payload["type"]:
+            return event
+    raise TypeError("Unknown event.")
+
+
+def main() -> None:
+    for size in [100, 10000]:
+        events: list[dict[str, Any]] = make_events(size)
+        number: int = max(1, 100000 // size)
+        before: float = measure(
+            f"try each member ({size} events)",
+            lambda: [try_each(x) for x in events],
+            number,
+        )
+        after: float = measure(
+            f"discriminator table ({size} events)",
+            lambda: Stream.from_dict({"events": events}),
+            number,
+        )
+        compare("speedup", before, after)
+
+
+if __name__ == "__main__":
+    main()
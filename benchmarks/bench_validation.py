@@ -0,0 +1,61 @@
+from typing import Any
+from python_classy import Classy, immutable
+from .timing import compare, measure
+
+
+@immutable
+class Tag(Classy):
+    name: str
+    weight: float
+
+
+@immutable
+class Product(Classy):
+    name: str
+    price: float
+    count: int
+    tags: list[Tag]
+    labels: dict[str, int]
+    parent: Tag | None
+
+
+@immutable(validate=True)
+class CheckedProduct(Classy):
+    name: str
+    price: float
+    count: int
+    tags: list[Tag]
+    labels: dict[str, int]
+    parent: Tag | None
+
+
+def main() -> None:
+    tags: list[Tag] = [Tag(name=str(i), weight=1.0) for i in range(10)]
+    fields: dict[str, Any] = {
+        "name": "pen",
+        "price": 1.5,
+        "count": 3,
+        "tags": tags,
+        "labels": {"a": 1, "b": 2},
+        "parent": None,
+    }
+    payload: dict[str, Any] = Product(**fields).dict
+    before: float = measure(
+        "construct (validation off)", lambda: Product(**fields)
+    )
+    after: float = measure(
+        "construct (validate=True)", lambda: CheckedProduct(**fields)
+    )
+    compare("overhead", after, before)
+    before = measure(
+        "from_dict (validation off)", lambda: Product.from_dict(payload)
+    )
+    after = measure(
+        "from_dict (validate=True)",
+        lambda: CheckedProduct.from_dict(payload),
+    )
+    compare("overhead", after, before)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+from datetime import datetime
+from typing import Any
+from uuid import UUID, uuid4
+from python_classy import Classy, immutable
+
+
+@immutable
+class Student(Classy):
+    id: UUID
+    name: str
+    age: int
+    enrolled_at: datetime
+
+    def compute_hash(self) -> int:
+        return hash(self.id)
+
+    def equals(self, __o: object) -> bool:
+        if not isinstance(__o, Student):
+            return False
+        return self.id == __o.id
+
+
+@immutable
+class Class(Classy):
+    id: UUID
+    name: str
+    leader: Student
+    students: list[Student]
+    students_by_name: dict[str, Student]
+    tags: tuple[str, int, Student]
+
+    def compute_hash(self) -> int:
+        return hash(self.id)
+
+    def equals(self, __o: object) -> bool:
+        if not isinstance(__o, Class):
+            return False
+        return self.id == __o.id
+
+
+def make_student(index: int) -> Student:
+    return Student(
+        id=uuid4(),
+        name=f"student-{index}",
+        age=20 + index % 10,
+        enrolled_at=datetime(2023, 1, 1 + index % 28, 9, 30),
+    )
+
+
+def make_class(size: int) -> Class:
+    students: list[Student] = [make_student(i) for i in range(size)]
+    return Class(
+        id=uuid4(),
+        name="Software Engineering",
+        leader=students[0],
+        students=students,
+        students_by_name={x.name: x for x in students},
+        tags=("tag", size, students[0]),
+    )
+
+
+def make_student_payload(index: int) -> dict[str, Any]:
+    return {
+        "id": uuid4().hex,
+        "name": f"student-{index}",
+        "age": 20 + index % 10,
+        "enrolled_at": datetime(2023, 1, 1 + index % 28, 9, 30).isoformat(),
+    }
+
+
+def make_class_payload(size: int) -> dict[str, Any]:
+    students: list[dict[str, Any]] = [
+        make_student_payload(i) for i in range(size)
+    ]
+    return {
+        "id": uuid4().hex,
+        "name": "Software Engineering",
+        "leader": students[0],
+        "students": students,
+        "students_by_name": {x["name"]: x for x in students},
+        "tags": ["tag", size, students[0]],
+    }
+
+
+@immutable
+class Record(Classy):
+    id: UUID
+    name: str
+    score: float
+    tags: list[str]
+
+    def compute_hash(self) -> int:
+        return hash(self.id)
+
+    def equals(self, __o: object) -> bool:
+        if not isinstance(__o, Record):
+            return False
+        return self.id == __o.id
+
+
+def make_record(index: int) -> Record:
+    return Record(
+        id=uuid4(),
+        name=f"record-{index}",
+        score=index / 7,
+        tags=[f"tag-{index % 5}", f"group-{index % 11}"],
+    )
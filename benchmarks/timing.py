@@ -0,0 +1,12 @@
+from timeit import Timer
+from typing import Any, Callable
+
+
+def measure(label: str, fn: Callable[[], Any], number: int = 10000) -> float:
+    best: float = min(Timer(fn).repeat(repeat=5, number=number)) / number
+    print(f"{label:<48} {best * 1e6:>12.3f} us/op")
+    return best
+
+
+def compare(label: str, baseline: float, candidate: float) -> None:
+    print(f"{label:<48} {baseline / candidate:>12.2f} x")
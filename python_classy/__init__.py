@@ -1,153 +1,459 @@
 from abc import ABC
-from dataclasses import asdict
+from base64 import b64decode, b64encode
+from collections import defaultdict
+from copy import deepcopy
+from dataclasses import MISSING, asdict, fields, is_dataclass
 from datetime import date, datetime, time
-from uuid import UUID, uuid4
-from types import GenericAlias
+from decimal import Decimal
+from enum import Enum
+from pathlib import PurePath
+from uuid import UUID, SafeUUID, uuid4
+from functools import cached_property
+from itertools import islice
+from types import GenericAlias, MemberDescriptorType, UnionType
 from inspect import FullArgSpec, getfullargspec
-from typing import Any, Dict, Hashable, Self, Type, final, get_args
-from .mutability import mutable, immutable
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Dict,
+    Hashable,
+    IO,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Self,
+    Type,
+    Union,
+    final,
+    get_args,
+    get_origin,
+    get_type_hints,
+    overload,
+)
+from .mutability import (
+    _INTERNAL,
+    _defaults,
+    _validating,
+    mutable,
+    immutable,
+    set_default_slots,
+    set_validation,
+)
 import json
+from json.encoder import encode_basestring_ascii
+
+if TYPE_CHECKING:
+    from asyncio import StreamReader, StreamWriter
+    from concurrent.futures import Executor
+    from os import PathLike
+    from .records import RecordFile
+
+_Codec = tuple[Callable[[Any], Any], Callable[[Any], Any] | None]
+_CODECS: dict[type, _Codec] = {}
+_json_encoders: dict[type, Callable[[Any], Any] | None] = {}
+_pending_defaults: set[type] = set()
+
+
+class ValidationError(TypeError):
+    def __init__(self, message: str, errors: List[Dict[str, Any]]) -> None:
+        super().__init__(message)
+        self.errors: List[Dict[str, Any]] = errors
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (type(self), (str(self), self.errors))
 
 
 class Classy(Hashable, ABC):
+    __slots__ = ()
+    __classy_decorated__: ClassVar[type | None] = None
+    __classy_plan__: ClassVar["_ClassyPlan | None"] = None
+    __classy_tag__: ClassVar[str | None] = None
+
     def __new__(cls: type[Self], *args, **kwargs) -> Self:
-        class_name: str = cls.__name__
-        if not (
-            hasattr(cls, f"_{class_name}__mutable_object")
-            or hasattr(cls, f"_{class_name}__immutable_object")
-        ):
+        if cls.__classy_decorated__ is not cls:
             raise TypeError(
-                f"'{class_name}' is not decorated with mutability decorator. Classy Object has to be decorated with @mutable or @immutable."
+                f"'{cls.__name__}' is not decorated with mutability decorator. Classy Object has to be decorated with @mutable or @immutable."
             )
-        this: Self = super().__new__(cls)
-        cls.args: tuple[Any, ...] = args
-        cls.kwargs: dict[str, Any] = kwargs
-        return this
+        return object.__new__(cls)
 
     @property
     def dict(self: Any) -> dict[str, Any]:
-        return dict(
-            [
-                (k, v.dict) if isinstance(v, Classy) else (k, v)
-                for k, v in asdict(self).items()
-                if not k.startswith("_")
-            ]
-        )
+        return _get_plan(type(self)).encode(self)
 
     @property
     def json(self) -> str:
-        return self.serialize(self.dict)
-
-    @classmethod
-    def from_json(cls: Type[Self], json_string: str) -> Self:
-        return cls.from_dict(cls.deserialize(json_string))
-
-    @classmethod
-    def from_dict(cls: Type[Self], dictionary: Dict[str, Any]) -> Self:
-        def __get_constructor_args(cls: Type[Self]) -> dict[str, Type[Any]]:
-            argspec: FullArgSpec = getfullargspec(cls.__init__)
-            args: dict[str, Type[Any]] = argspec.annotations
-            return args
-
-        def __decode_nested(__type: Type, __value: Any) -> Any:
-            if isinstance(__type, GenericAlias):
-                collection_type: type = __type.__origin__
-                item_types: tuple[Any, ...] = get_args(__type)
-                if collection_type == list:
-                    if len(item_types) != 1:
-                        raise TypeError(
-                            "Invalid generic item type args for 'list'."
-                        )
-                    return [__decode_nested(item_types[0], x) for x in __value]
-                if collection_type == tuple:
-                    if len(item_types) != len(__value):
-                        raise TypeError(
-                            "Invalid generic item type args for 'tuple'. number of item args mismatched."
-                        )
-                    return tuple(
-                        [
-                            __decode_nested(item_types[i], x)
-                            for i, x in enumerate(__value)
-                        ]
-                    )
-                if collection_type == dict:
-                    if len(item_types) != 2:
-                        raise TypeError(
-                            "Invalid generic type args for 'dict'."
-                        )
-                    return {
-                        x: __decode_nested(item_types[1], y)
-                        for x, y in __value.items()
-                        if isinstance(x, item_types[0])
-                    }
-                raise TypeError(
-                    "Unsupported generic type detected in dataclass fields."
-                )
-            if isinstance(__value, __type):
-                return __value
-            if issubclass(__type, Classy):
-                return __type.from_dict(__value)
-            if __type == UUID:
-                return UUID(__value)
-            if __type == datetime:
-                return datetime.fromisoformat(__value)
-            if __type == date:
-                return date.fromisoformat(__value)
-            if __type == time:
-                return time.fromisoformat(__value)
-            return __value
-
-        init_args: dict[str, type] = __get_constructor_args(cls)
-        arg_names: list[str] = list(init_args.keys())
-        decoded: dict[str, Any] = dict(
-            [
-                (k, __decode_nested(init_args[k], v))
-                for k, v in dictionary.items()
-                if k in arg_names
-            ]
+        return self.serialize(_get_plan(type(self)).json_encode(self))
+
+    def to_dict(
+        self,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+    ) -> Dict[str, Any]:
+        if include is None and exclude is None:
+            return self.dict
+        return _get_plan(type(self)).projection(
+            _mask(include), _mask(exclude)
+        )(self)
+
+    def to_json(
+        self,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+    ) -> str:
+        if include is None and exclude is None:
+            return self.json
+        plan: _ClassyPlan = _get_plan(type(self))
+        projected: Dict[str, Any] = plan.projection(
+            _mask(include), _mask(exclude)
+        )(self)
+        return self.serialize(_json_value(projected, plan.json_default))
+
+    @classmethod
+    def from_json(
+        cls: Type[Self], json_string: str, defer: bool = False
+    ) -> Self:
+        return cls.from_dict(cls.deserialize(json_string), defer=defer)
+
+    @classmethod
+    def from_dict(
+        cls: Type[Self], dictionary: Dict[str, Any], defer: bool = False
+    ) -> Self:
+        if defer:
+            return _get_plan(cls).lazy_from_dict(dictionary)
+        return _get_plan(cls).from_dict(dictionary)
+
+    @overload
+    @classmethod
+    def from_dicts(
+        cls: Type[Self],
+        dictionaries: Iterable[Dict[str, Any]],
+        lazy: Literal[False] = False,
+        defer: bool = False,
+    ) -> List[Self]: ...
+
+    @overload
+    @classmethod
+    def from_dicts(
+        cls: Type[Self],
+        dictionaries: Iterable[Dict[str, Any]],
+        lazy: Literal[True],
+        defer: bool = False,
+    ) -> Iterator[Self]: ...
+
+    @overload
+    @classmethod
+    def from_dicts(
+        cls: Type[Self],
+        dictionaries: Iterable[Dict[str, Any]],
+        lazy: bool,
+        defer: bool = False,
+    ) -> List[Self] | Iterator[Self]: ...
+
+    @classmethod
+    def from_dicts(
+        cls: Type[Self],
+        dictionaries: Iterable[Dict[str, Any]],
+        lazy: bool = False,
+        defer: bool = False,
+    ) -> List[Self] | Iterator[Self]:
+        plan: _ClassyPlan = _get_plan(cls)
+        decode: Callable[[Dict[str, Any]], Self] = (
+            plan.lazy_from_dict if defer else plan.from_dict
+        )
+        if lazy:
+            return map(decode, dictionaries)
+        return [decode(x) for x in dictionaries]
+
+    @overload
+    @classmethod
+    def to_dicts(
+        cls: Type[Self], objects: Iterable[Self], lazy: Literal[False] = False
+    ) -> List[Dict[str, Any]]: ...
+
+    @overload
+    @classmethod
+    def to_dicts(
+        cls: Type[Self], objects: Iterable[Self], lazy: Literal[True]
+    ) -> Iterator[Dict[str, Any]]: ...
+
+    @overload
+    @classmethod
+    def to_dicts(
+        cls: Type[Self], objects: Iterable[Self], lazy: bool
+    ) -> List[Dict[str, Any]] | Iterator[Dict[str, Any]]: ...
+
+    @classmethod
+    def to_dicts(
+        cls: Type[Self], objects: Iterable[Self], lazy: bool = False
+    ) -> List[Dict[str, Any]] | Iterator[Dict[str, Any]]:
+        encode: Callable[[Self], Dict[str, Any]] = _get_plan(cls).encode
+        encoded: Iterator[Dict[str, Any]] = (
+            encode(x) if type(x) is cls else x.dict for x in objects
+        )
+        return encoded if lazy else list(encoded)
+
+    @overload
+    @classmethod
+    def from_json_array(
+        cls: Type[Self],
+        json_string: str,
+        lazy: Literal[False] = False,
+        defer: bool = False,
+    ) -> List[Self]: ...
+
+    @overload
+    @classmethod
+    def from_json_array(
+        cls: Type[Self],
+        json_string: str,
+        lazy: Literal[True],
+        defer: bool = False,
+    ) -> Iterator[Self]: ...
+
+    @overload
+    @classmethod
+    def from_json_array(
+        cls: Type[Self], json_string: str, lazy: bool, defer: bool = False
+    ) -> List[Self] | Iterator[Self]: ...
+
+    @classmethod
+    def from_json_array(
+        cls: Type[Self],
+        json_string: str,
+        lazy: bool = False,
+        defer: bool = False,
+    ) -> List[Self] | Iterator[Self]:
+        dictionaries: Any = cls.deserialize(json_string)
+        return cls.from_dicts(dictionaries, lazy=lazy, defer=defer)
+
+    @classmethod
+    def to_json_array(cls: Type[Self], objects: Iterable[Self]) -> str:
+        values: List[Self] = list(objects)
+        if not values:
+            return "[]"
+        return values[0].serialize(
+            [_get_plan(type(x)).json_encode(x) for x in values]  # type: ignore
+        )
+
+    @classmethod
+    def from_dict_many(
+        cls: Type[Self],
+        dictionaries: Iterable[Dict[str, Any]],
+        workers: int | None = None,
+        chunk_size: int | None = None,
+        executor: "Executor | None" = None,
+    ) -> List[Self]:
+        from .parallel import decode_dicts, decode_many
+
+        payloads: Any = (
+            dictionaries
+            if isinstance(dictionaries, (list, tuple))
+            else list(dictionaries)
+        )
+        return decode_many(
+            cls, decode_dicts, payloads, workers, chunk_size, executor
         )
-        return cls(**decoded)
+
+    @classmethod
+    def from_json_many(
+        cls: Type[Self],
+        json_strings: Iterable[str],
+        workers: int | None = None,
+        chunk_size: int | None = None,
+        executor: "Executor | None" = None,
+    ) -> List[Self]:
+        from .parallel import decode_json, decode_many
+
+        payloads: Any = (
+            json_strings
+            if isinstance(json_strings, (list, tuple))
+            else list(json_strings)
+        )
+        return decode_many(
+            cls, decode_json, payloads, workers, chunk_size, executor
+        )
+
+    @classmethod
+    def iter_json_lines(cls: Type[Self], fp: Iterable[str]) -> Iterator[Self]:
+        decode: Callable[[Dict[str, Any]], Self] = _get_plan(cls).from_dict
+        for line in fp:
+            if isinstance(line, bytes):
+                line = line.decode()
+            if line.strip():
+                yield decode(cls.deserialize(line))
+
+    @classmethod
+    def dump_json_lines(
+        cls: Type[Self],
+        objects: Iterable[Self],
+        fp: IO[str],
+        buffer_size: int = 1 << 16,
+    ) -> int:
+        encode: Callable[[Self], Dict[str, Any]] = _get_plan(cls).json_encode
+        buffer: List[str] = []
+        buffered: int = 0
+        count: int = 0
+        for x in objects:
+            line: str = x.serialize(
+                encode(x)
+                if type(x) is cls
+                else _get_plan(type(x)).json_encode(x)
+            )
+            buffer.append(line)
+            buffer.append("\n")
+            buffered += len(line) + 1
+            count += 1
+            if buffered >= buffer_size:
+                fp.write("".join(buffer))
+                buffer.clear()
+                buffered = 0
+        if buffer:
+            fp.write("".join(buffer))
+        return count
+
+    @classmethod
+    def aiter_json_lines(
+        cls: Type[Self],
+        reader: "StreamReader",
+        chunk_size: int = 256,
+        executor: "Executor | None" = None,
+    ) -> AsyncIterator[Self]:
+        from .aio import aiter_json_lines
+
+        return aiter_json_lines(cls, reader, chunk_size, executor)
+
+    @classmethod
+    async def adump_json_lines(
+        cls: Type[Self],
+        objects: Iterable[Self] | AsyncIterable[Self],
+        writer: "StreamWriter",
+        chunk_size: int = 256,
+        executor: "Executor | None" = None,
+    ) -> int:
+        from .aio import adump_json_lines
+
+        return await adump_json_lines(
+            cls, objects, writer, chunk_size, executor
+        )
+
+    def iter_encode(self, chunk_size: int = 1 << 16) -> Iterator[str]:
+        buffer: List[str] = []
+        buffered: int = 0
+        default: _JsonDefault = _get_plan(type(self)).json_default
+        for fragment in _iter_json(self, default):
+            buffer.append(fragment)
+            buffered += len(fragment)
+            if buffered >= chunk_size:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered = 0
+        if buffer:
+            yield "".join(buffer)
+
+    def dump(self, fp: IO[str], chunk_size: int = 1 << 16) -> None:
+        for chunk in self.iter_encode(chunk_size):
+            fp.write(chunk)
+
+    @classmethod
+    def register_codec(
+        cls,
+        __type: type,
+        encode: Callable[[Any], Any],
+        decode: Callable[[Any], Any] | None = None,
+    ) -> None:
+        if cls is Classy:
+            _CODECS[__type] = (encode, decode)
+        else:
+            if "__classy_codecs__" not in cls.__dict__:
+                setattr(cls, "__classy_codecs__", {})
+            cls.__dict__["__classy_codecs__"][__type] = (encode, decode)
+        _invalidate_plans(Classy)
 
     @classmethod
     def default(cls: Type[Self]) -> Self:
-        def __get_constructor_args(cls: Type[Self]) -> dict[str, Type[Any]]:
-            argspec: FullArgSpec = getfullargspec(cls.__init__)
-            args: dict[str, Type[Any]] = argspec.annotations
-            args.pop("return", None)
-            return args
-
-        def __default_nested(__type: Type) -> Any:
-            if isinstance(__type, GenericAlias):
-                collection_type: type = __type.__origin__
-                if collection_type == list:
-                    return collection_type()
-                if collection_type == tuple:
-                    item_types: tuple[Any, ...] = get_args(__type)
-                    if len(item_types) == 0:
-                        return tuple()
-                    return tuple([__default_nested(t) for t in item_types])
-                if collection_type == dict:
-                    return collection_type()
+        return _get_plan(cls).default()
+
+    def evolve(self, **changes: Any) -> Self:
+        plan: _ClassyPlan = _get_plan(type(self))
+        nested: dict[str, dict[str, Any]] = {}
+        for path in [k for k in changes if "." in k]:
+            name, _, rest = path.partition(".")
+            nested.setdefault(name, {})[rest] = changes.pop(path)
+        unknown: set[str] = (
+            changes.keys() | nested.keys()
+        ) - plan.init_args.keys()
+        if unknown:
+            raise TypeError(
+                f"'{type(self).__name__}' has no init fields named {sorted(unknown)}."
+            )
+        for name, values in nested.items():
+            if name in changes:
+                raise TypeError(
+                    f"Field '{name}' cannot be replaced and evolved at the same time."
+                )
+            child: Any = getattr(self, name)
+            if not isinstance(child, Classy):
                 raise TypeError(
-                    "Unsupported generic type detected in dataclass fields."
+                    f"Field '{name}' of '{type(self).__name__}' is not a Classy object."
                 )
-            if issubclass(__type, Classy):
-                return __type.default()
-            if __type == UUID:
-                return uuid4()
-            if __type == datetime:
-                return datetime.now()
-            if __type == date:
-                return date.today()
-            if __type == time:
-                return datetime.now().time()
-            return __type()
-
-        init_args: dict[str, type] = __get_constructor_args(cls)
-        default_dict: dict[str, Any] = dict(
-            [(k, __default_nested(t)) for k, t in init_args.items()]
-        )
-        return cls(**default_dict)
+            changes[name] = child.evolve(**values)
+        return plan.evolve(self, changes)
+
+    def changes(self) -> Dict[str, Any]:
+        plan: _ClassyPlan = _get_plan(type(self))
+        if not plan.tracked:
+            raise TypeError(
+                f"'{type(self).__name__}' is not decorated with @mutable(track_changes=True)."
+            )
+        dirty: set[str] = getattr(self, "_classy_dirty") or set()
+        patch: Dict[str, Any] = {}
+        for k in plan.public_fields:
+            if k in dirty:
+                patch[k] = _encode_value(getattr(self, k))
+        for k in plan.classy_fields:
+            child: Any = getattr(self, k)
+            if k in dirty or not isinstance(child, Classy):
+                continue
+            if _get_plan(type(child)).tracked:
+                for path, value in child.changes().items():
+                    patch[f"{k}.{path}"] = value
+        return patch
+
+    def mark_clean(self) -> None:
+        plan: _ClassyPlan = _get_plan(type(self))
+        if plan.tracked:
+            object.__setattr__(self, "_classy_dirty", None)
+        for k in plan.classy_fields:
+            child: Any = getattr(self, k)
+            if isinstance(child, Classy):
+                child.mark_clean()
+
+    @classmethod
+    def apply_patch(cls: Type[Self], obj: Self, patch: Dict[str, Any]) -> Self:
+        if not isinstance(obj, cls):
+            raise TypeError(
+                f"apply_patch() expects a '{cls.__name__}' object, got '{type(obj).__name__}'."
+            )
+        for path, value in patch.items():
+            target: Any = obj
+            *parents, name = path.split(".")
+            for parent in parents:
+                target = getattr(target, parent)
+            decoders: dict[str, Callable[[Any], Any]] = _get_plan(
+                type(target)
+            ).field_decoders
+            if name not in decoders:
+                raise TypeError(
+                    f"'{type(target).__name__}' has no field named '{name}'."
+                )
+            setattr(target, name, decoders[name](value))
+        return obj
 
     @final
     def __eq__(self, __o: object) -> bool:
@@ -171,14 +477,1742 @@ class Classy(Hashable, ABC):
             f"'{type(self).__name__}' does not implement equals(self, __o: object) -> bool."
         )
 
-    def serialize(self, dictionary: Dict[str, Any]) -> str:
-        def default(obj: Any) -> Any:
-            if isinstance(obj, UUID):
-                return str(obj)
-            return obj
+    @classmethod
+    def intern(cls: Type[Self], __value: Self) -> Self:
+        interner: Callable[[Any], Any] | None = _get_plan(cls).interner
+        if interner is None:
+            raise TypeError(
+                f"'{cls.__name__}' is not decorated with @immutable(interned=True)."
+            )
+        return interner(__value)
+
+    def to_bytes(self) -> bytes:
+        return _get_plan(type(self)).binary.encode(self)
+
+    @classmethod
+    def from_bytes(
+        cls: Type[Self], data: bytes | bytearray | memoryview
+    ) -> Self:
+        return _get_plan(cls).binary.decode(data)
 
-        return json.dumps(dictionary, default=default)
+    @classmethod
+    def write_records(
+        cls: Type[Self], objects: Iterable[Self], path: "str | PathLike[str]"
+    ) -> int:
+        from .records import write_records
+
+        return write_records(cls, objects, path)
+
+    @classmethod
+    def open_records(
+        cls: Type[Self], path: "str | PathLike[str]"
+    ) -> "RecordFile[Self]":
+        from .records import RecordFile
+
+        return RecordFile(cls, path)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        plan: _ClassyPlan = _get_plan(type(self))
+        extra: dict[str, Any] | None = _extra_state(self, plan.all_fields)
+        if extra is None:
+            return (_restore, (plan.cls, plan.field_names, plan.state(self)))
+        return (
+            _restore,
+            (plan.cls, plan.field_names, plan.state(self), extra),
+        )
+
+    def serialize(self, dictionary: Dict[str, Any]) -> str:
+        return json.dumps(
+            dictionary, default=_get_plan(type(self)).json_default
+        )
 
     @classmethod
     def deserialize(cls: Type[Self], json_string: str) -> Dict[str, Any]:
         return json.loads(json_string)
+
+
+def _raise_type_error(message: str) -> Any:
+    raise TypeError(message)
+
+
+class _Codegen:
+    def __init__(
+        self, cls: type, scopes: "list[dict[type, _Codec]] | None" = None
+    ) -> None:
+        self.namespace: dict[str, Any] = {
+            "_raise_type_error": _raise_type_error
+        }
+        self.cls: type = cls
+        self.scopes: list[dict[type, _Codec]] | None = scopes
+        self.helpers: list[str] = []
+        self.__symbols: dict[int, str] = {}
+        self.symbol(cls, "cls")
+
+    def symbol(self, obj: Any, hint: str | None = None) -> str:
+        key: int = id(obj)
+        if key not in self.__symbols:
+            name: str = hint or str(getattr(obj, "__name__", ""))
+            if not name.isidentifier() or name.startswith("_"):
+                name = "g"
+            symbol: str = f"_{name}"
+            while symbol in self.namespace:
+                symbol = f"_{name}{len(self.namespace)}"
+            self.__symbols[key] = symbol
+            self.namespace[symbol] = obj
+        return self.__symbols[key]
+
+    def helper(self, params: str, body: list[str]) -> str:
+        name: str = f"__h{len(self.helpers)}"
+        self.helpers.append(
+            "\n".join([f"def {name}({params}):", *[f"    {x}" for x in body]])
+        )
+        return name
+
+    def error(self, message: str) -> str:
+        return f"_raise_type_error({message!r})"
+
+    def build(self, name: str, params: str, body: list[str]) -> Callable:
+        source: str = "\n\n".join(
+            [
+                *self.helpers,
+                "\n".join(
+                    [f"def {name}({params}):", *[f"    {x}" for x in body]]
+                ),
+            ]
+        )
+        exec(compile(source, f"<classy {name}>", "exec"), self.namespace)
+        function: Callable = self.namespace[name]
+        function.__classy_source__ = source  # type: ignore
+        return function
+
+
+class _ClassyPlan:
+    def __init__(self, cls: Type[Classy]) -> None:
+        self.cls: Type[Classy] = cls
+        self.loaded_names: tuple[str, ...] | None = None
+
+    @cached_property
+    def init_args(self) -> dict[str, Any]:
+        argspec: FullArgSpec = getfullargspec(self.cls.__init__)
+        args: dict[str, Any] = dict(argspec.annotations)
+        args.pop("return", None)
+        return self.__resolve(args)
+
+    @cached_property
+    def field_types(self) -> dict[str, Any]:
+        cls: type = self.cls
+        return self.__resolve(
+            {
+                f.name: f.type
+                for f in fields(cls)
+                if not f.metadata.get(_INTERNAL)
+            }
+        )
+
+    @cached_property
+    def interner(self) -> Callable[[Any], Any] | None:
+        return self.cls.__dict__.get("__classy_interner__")
+
+    @cached_property
+    def internal_fields(self) -> dict[str, Any]:
+        cls: type = self.cls
+        return {
+            f.name: f.default for f in fields(cls) if f.metadata.get(_INTERNAL)
+        }
+
+    @cached_property
+    def public_fields(self) -> tuple[str, ...]:
+        return tuple([k for k in self.field_types if not k.startswith("_")])
+
+    @cached_property
+    def flat(self) -> bool:
+        return all(
+            _is_flat_type(self.field_types[k]) for k in self.public_fields
+        )
+
+    @cached_property
+    def precompiled(self) -> dict[str, Any]:
+        from .compiler import load_precompiled
+
+        return load_precompiled(self)
+
+    @cached_property
+    def from_dict(self) -> Callable[[Dict[str, Any]], Any]:
+        if self.cls in _validating:
+            return self.__compile_decoder()
+        return self.precompiled.get("from_dict") or self.__compile_decoder()
+
+    @cached_property
+    def lazy_fields(self) -> list[str]:
+        return [k for k, t in self.init_args.items() if _is_nested_type(t)]
+
+    @cached_property
+    def lazy_cls(self) -> Type[Classy]:
+        from .lazy import lazy_type
+
+        return lazy_type(self.cls, self.lazy_fields)
+
+    @cached_property
+    def lazy_from_dict(self) -> Callable[[Dict[str, Any]], Any]:
+        if not self.lazy_fields:
+            return self.from_dict
+        return self.__compile_decoder(lazy=True)
+
+    @cached_property
+    def encode(self) -> Callable[[Any], Dict[str, Any]]:
+        if "encode" in self.precompiled:
+            return self.precompiled["encode"]
+        encode: Callable[[Any], Dict[str, Any]] = self.__compile_encoder()
+        if "_classy_dict" not in self.internal_fields:
+            return encode
+        gen: _Codegen = _Codegen(self.cls)
+        items: list[str] = [
+            f"{k!r}: {_copy_expr(gen, self.field_types[k], f'__d[{k!r}]')}"
+            for k in self.public_fields
+        ]
+        return gen.build(
+            "encode",
+            "__self",
+            [
+                "__d = __self._classy_dict",
+                "if __d is None:",
+                f"    __d = {gen.symbol(encode, 'encode')}(__self)",
+                f"    {gen.symbol(object.__setattr__, 'set')}"
+                "(__self, '_classy_dict', __d)",
+                f"return {{{', '.join(items)}}}",
+            ],
+        )
+
+    @cached_property
+    def field_names(self) -> tuple[str, ...]:
+        return tuple(self.field_types)
+
+    @cached_property
+    def all_fields(self) -> frozenset[str]:
+        cls: type = self.cls
+        return frozenset([f.name for f in fields(cls)])
+
+    @cached_property
+    def state(self) -> Callable[[Any], tuple[Any, ...]]:
+        gen: _Codegen = _Codegen(self.cls)
+        items: list[str] = []
+        for k, t in self.field_types.items():
+            if t is UUID:
+                uuid: str = gen.symbol(UUID)
+                items += [
+                    f"__self.{k}.bytes if type(__self.{k}) is {uuid}"
+                    f" else __self.{k}, "
+                ]
+            else:
+                items += [f"__self.{k}, "]
+        return gen.build("state", "__self", [f"return ({''.join(items)})"])
+
+    @cached_property
+    def restore(self) -> Callable[[tuple[Any, ...]], Any]:
+        gen: _Codegen = _Codegen(self.cls)
+        names: list[str] = list(self.field_types.keys())
+        body: list[str] = [
+            f"__self = {gen.symbol(object.__new__, 'new')}(_cls)"
+        ]
+        if names:
+            body += [
+                f"{''.join([f'__v{i}, ' for i in range(len(names))])}= __values"
+            ]
+        if any(_slot_descriptor(self.cls, k) is None for k in names):
+            body += ["__d = __self.__dict__"]
+        for i, k in enumerate(names):
+            if self.field_types[k] is UUID:
+                body += [
+                    f"if type(__v{i}) is bytes:",
+                    f"    __v{i} = {gen.symbol(_uuid_from_bytes)}(__v{i})",
+                ]
+            descriptor: Any = _slot_descriptor(self.cls, k)
+            if descriptor is None:
+                body += [f"__d[{k!r}] = __v{i}"]
+            else:
+                setter: str = gen.symbol(descriptor.__set__, f"set_{k}")
+                body += [f"{setter}(__self, __v{i})"]
+        for k, default in self.internal_fields.items():
+            descriptor = _slot_descriptor(self.cls, k)
+            if descriptor is not None:
+                setter = gen.symbol(descriptor.__set__, f"set_{k}")
+                body += [f"{setter}(__self, {gen.symbol(default, k)})"]
+        if self.interner is not None:
+            body += [f"__self = {gen.symbol(self.interner, 'intern')}(__self)"]
+        return gen.build("restore", "__values", [*body, "return __self"])
+
+    @cached_property
+    def codec_scopes(self) -> list[dict[type, _Codec]]:
+        return [
+            c.__dict__["__classy_codecs__"]
+            for c in self.cls.__mro__
+            if "__classy_codecs__" in c.__dict__
+        ] + [_CODECS]
+
+    @cached_property
+    def document_scopes(self) -> list[dict[type, _Codec]]:
+        scopes: list[dict[type, _Codec]] = []
+        for cls in _nested_classy_types(self.cls):
+            scopes += [
+                x
+                for x in _get_plan(cls).codec_scopes[:-1]
+                if all(x is not y for y in scopes)
+            ]
+        return scopes + [_CODECS]
+
+    @cached_property
+    def scoped_decoders(self) -> dict[Any, Callable[[Dict[str, Any]], Any]]:
+        return {}
+
+    def scoped_from_dict(
+        self, scopes: list[dict[type, _Codec]], lazy: bool
+    ) -> Callable[[Dict[str, Any]], Any]:
+        key: tuple[Any, ...] = (*[id(x) for x in scopes], lazy)
+        decoder: Callable[[Dict[str, Any]], Any] | None = (
+            self.scoped_decoders.get(key)
+        )
+        if decoder is None:
+            decoder = self.__compile_decoder(
+                lazy and bool(self.lazy_fields), scopes
+            )
+            self.scoped_decoders[key] = decoder
+        return decoder
+
+    @cached_property
+    def json_default(self) -> "_JsonDefault":
+        scopes: list[dict[type, _Codec]] = self.document_scopes
+        if len(scopes) == 1:
+            return _json_default
+        return _JsonDefault(scopes)
+
+    @cached_property
+    def json_encode(self) -> Callable[[Any], Dict[str, Any]]:
+        return self.json_encoder(self.json_default)
+
+    @cached_property
+    def json_encoders(self) -> dict[Any, Callable[[Any], Dict[str, Any]]]:
+        return {}
+
+    def json_encoder(
+        self, default: "_JsonDefault"
+    ) -> Callable[[Any], Dict[str, Any]]:
+        key: tuple[int, ...] = tuple([id(x) for x in default.scopes])
+        encoder: Callable[[Any], Dict[str, Any]] | None = (
+            self.json_encoders.get(key)
+        )
+        if encoder is None:
+            encoder = self.__compile_json_encoder(default)
+            self.json_encoders[key] = encoder
+        return encoder
+
+    @cached_property
+    def default(self) -> Callable[[], Any]:
+        if not self.shared_default:
+            return self.default_factory
+        gen: _Codegen = _Codegen(self.cls)
+        prototype: str = gen.symbol(self.default_factory(), "prototype")
+        return gen.build("default", "", [f"return {prototype}"])
+
+    @cached_property
+    def default_factory(self) -> Callable[[], Any]:
+        if "default_factory" in self.precompiled:
+            return self.precompiled["default_factory"]
+        gen: _Codegen = _Codegen(self.cls)
+        args: str = ", ".join(
+            [f"{k}={_default_expr(gen, t)}" for k, t in self.init_args.items()]
+        )
+        return gen.build("default", "", [f"return _cls({args})"])
+
+    @cached_property
+    def shared_default(self) -> bool:
+        if "shared_default" in self.precompiled:
+            return self.precompiled["shared_default"]
+        if self.cls in _pending_defaults:
+            return False
+        _pending_defaults.add(self.cls)
+        try:
+            return (
+                getattr(self.cls, "__dataclass_params__").frozen
+                and not hasattr(self.cls, "__post_init__")
+                and self.init_args.keys() == self.field_types.keys()
+                and all(_is_pure_default(t) for t in self.init_args.values())
+            )
+        finally:
+            _pending_defaults.discard(self.cls)
+
+    @cached_property
+    def tracked(self) -> bool:
+        return "_classy_dirty" in self.internal_fields
+
+    @cached_property
+    def classy_fields(self) -> tuple[str, ...]:
+        return tuple(
+            [
+                k
+                for k in self.public_fields
+                if _holds_classy(self.field_types[k])
+            ]
+        )
+
+    @cached_property
+    def field_decoders(self) -> dict[str, Callable[[Any], Any]]:
+        gen: _Codegen = _Codegen(self.cls)
+        decoders: list[str] = []
+        for k, t in self.field_types.items():
+            expr: str | None = _decoder_expr(gen, t, "__value", 0)
+            decoder: str = gen.helper(
+                "__value", [f"return {expr or '__value'}"]
+            )
+            decoders += [f"{k!r}: {decoder}"]
+        return gen.build(
+            "field_decoders", "", [f"return {{{', '.join(decoders)}}}"]
+        )()
+
+    @cached_property
+    def evolve(self) -> Callable[[Any, Dict[str, Any]], Any]:
+        gen: _Codegen = _Codegen(self.cls)
+
+        def changed(k: str) -> str:
+            return f"__changes[{k!r}] if {k!r} in __changes else __self.{k}"
+
+        new: str = "__new"
+        if self.interner is not None:
+            new = f"{gen.symbol(self.interner, 'intern')}(__new)"
+        validate: list[str] = []
+        if self.cls in _validating:
+            validate = [f"{gen.symbol(self.validate, 'validate')}(__changes)"]
+        if hasattr(self.cls, "__post_init__"):
+            args: str = ", ".join(
+                [f"{k}={changed(k)}" for k in self.init_args]
+            )
+            return gen.build(
+                "evolve",
+                "__self, __changes",
+                [f"__new = _cls({args})", f"return {new}"],
+            )
+        names: list[str] = list(self.field_types.keys())
+        body: list[str] = [
+            *validate,
+            f"__new = {gen.symbol(object.__new__, 'new')}(_cls)",
+        ]
+        if any(_slot_descriptor(self.cls, k) is None for k in names):
+            body += ["__d = __new.__dict__"]
+        for k in names:
+            value: str = changed(k) if k in self.init_args else f"__self.{k}"
+            descriptor: Any = _slot_descriptor(self.cls, k)
+            if descriptor is None:
+                body += [f"__d[{k!r}] = {value}"]
+            else:
+                setter: str = gen.symbol(descriptor.__set__, f"set_{k}")
+                body += [f"{setter}(__new, {value})"]
+        for k, default in self.internal_fields.items():
+            descriptor = _slot_descriptor(self.cls, k)
+            if descriptor is not None:
+                setter = gen.symbol(descriptor.__set__, f"set_{k}")
+                body += [f"{setter}(__new, {gen.symbol(default, k)})"]
+        return gen.build(
+            "evolve", "__self, __changes", [*body, f"return {new}"]
+        )
+
+    @cached_property
+    def validate(self) -> Callable[[Dict[str, Any]], None]:
+        from .lazy import Thunk
+
+        gen: _Codegen = _Codegen(self.cls)
+        sample: int | None = _defaults["validation_sample"]
+        body: list[str] = ["__errors = None"]
+        for k, t in self.init_args.items():
+            check: str | None = _check_expr(gen, t, "__v", 0, sample)
+            if check is None:
+                continue
+            if _is_nested_type(t):
+                check = f"type(__v) is {gen.symbol(Thunk)} or {check}"
+            expected: str = _type_name(t)
+            body += [
+                f"if {k!r} in __kwargs:",
+                f"    __v = __kwargs[{k!r}]",
+                f"    if not ({check}):",
+                f"        __errors = {gen.symbol(_validation_error)}"
+                f"(__errors, {k!r}, {expected!r}, __v)",
+            ]
+        body += [
+            "if __errors is not None:",
+            f"    raise {gen.symbol(ValidationError)}("
+            f"{gen.symbol(_validation_message)}(_cls, __errors), __errors)",
+        ]
+        return gen.build("validate", "__kwargs", body)
+
+    @cached_property
+    def binary(self) -> Any:
+        from .binary import BinaryCodec
+
+        return BinaryCodec(self.cls)
+
+    @cached_property
+    def record_view(self) -> type:
+        from .records import record_view_type
+
+        return record_view_type(self.cls)
+
+    @cached_property
+    def projections(self) -> dict[tuple[Any, Any], Callable[[Any], Any]]:
+        return {}
+
+    def projection(
+        self, include: tuple[str, ...] | None, exclude: tuple[str, ...] | None
+    ) -> Callable[[Any], Dict[str, Any]]:
+        project: Callable[[Any], Dict[str, Any]] | None = self.projections.get(
+            (include, exclude)
+        )
+        if project is None:
+            project = self.__compile_projection(include, exclude)
+            self.projections[(include, exclude)] = project
+        return project
+
+    def __resolve(self, types: dict[str, Any]) -> dict[str, Any]:
+        hints: dict[str, Any] = {}
+        if any(isinstance(t, str) for t in types.values()):
+            try:
+                hints = get_type_hints(self.cls)
+            except (NameError, TypeError):
+                pass
+        return {
+            k: _normalize_type(hints.get(k, t) if isinstance(t, str) else t)
+            for k, t in types.items()
+        }
+
+    def __compile_encoder(self) -> Callable[[Any], Dict[str, Any]]:
+        gen: _Codegen = _Codegen(self.cls)
+        encode: str = gen.symbol(_encode_value)
+        items: list[str] = [
+            (
+                f"{k!r}: __self.{k}"
+                if t in _ATOMIC_TYPES
+                else f"{k!r}: {encode}(__self.{k})"
+            )
+            for k, t in self.field_types.items()
+            if k in self.public_fields
+        ]
+        return gen.build(
+            "encode", "__self", [f"return {{{', '.join(items)}}}"]
+        )
+
+    def __compile_json_encoder(
+        self, default: "_JsonDefault"
+    ) -> Callable[[Any], Dict[str, Any]]:
+        gen: _Codegen = _Codegen(self.cls, default.scopes)
+        items: list[str] = []
+        for k in self.public_fields:
+            expr: str | None = _json_expr(
+                gen, default, self.field_types[k], f"__self.{k}", 0
+            )
+            items += [f"{k!r}: {expr or f'__self.{k}'}"]
+        return gen.build(
+            "json_encode", "__self", [f"return {{{', '.join(items)}}}"]
+        )
+
+    def __compile_projection(
+        self, include: tuple[str, ...] | None, exclude: tuple[str, ...] | None
+    ) -> Callable[[Any], Dict[str, Any]]:
+        gen: _Codegen = _Codegen(self.cls)
+        included: dict[str, tuple[str, ...] | None] = _mask_tree(
+            self.cls, self.public_fields, include or ()
+        )
+        excluded: dict[str, tuple[str, ...] | None] = _mask_tree(
+            self.cls, self.public_fields, exclude or ()
+        )
+        encode: str = gen.symbol(_encode_value)
+        items: list[str] = []
+        for k in self.public_fields:
+            if include is not None and k not in included:
+                continue
+            if k in excluded and excluded[k] is None:
+                continue
+            t: Any = self.field_types[k]
+            var: str = f"__self.{k}"
+            if included.get(k) is None and k not in excluded:
+                expr: str = var if t in _ATOMIC_TYPES else f"{encode}({var})"
+            else:
+                expr = _projection_expr(
+                    gen, t, var, 0, included.get(k), excluded.get(k)
+                )
+            items += [f"{k!r}: {expr}"]
+        return gen.build(
+            "project", "__self", [f"return {{{', '.join(items)}}}"]
+        )
+
+    def __compile_decoder(
+        self,
+        lazy: bool = False,
+        scopes: list[dict[type, _Codec]] | None = None,
+    ) -> Callable[[Dict[str, Any]], Any]:
+        gen: _Codegen = _Codegen(self.cls, scopes)
+        names: list[str] = list(self.init_args.keys())
+        values: list[str] = []
+        for i, (name, __type) in enumerate(self.init_args.items()):
+            if lazy and name in self.lazy_fields:
+                from .lazy import Thunk
+
+                expr: str | None = _decoder_expr(
+                    gen, __type, "__value", 0, lazy=True
+                )
+                decode: str = gen.helper("__value", [f"return {expr}"])
+                values.append(f"{gen.symbol(Thunk)}({decode}, __v{i})")
+                continue
+            expr = _decoder_expr(gen, __type, f"__v{i}", 0)
+            values.append(f"__v{i}" if expr is None else expr)
+        new: str = gen.symbol(self.lazy_cls, "lazy") if lazy else "_cls"
+        close: str = ""
+        if self.interner is not None:
+            new = f"{gen.symbol(self.interner, 'intern')}({new}"
+            close = ")"
+        if not names:
+            return gen.build("from_dict", "__d", [f"return {new}(){close}"])
+        if self.cls in _validating:
+            return gen.build(
+                "from_dict",
+                "__d",
+                _validated_decoder_body(
+                    gen, self.init_args, values, f"{new}(", close
+                ),
+            )
+        body: list[str] = ["try:"]
+        body += [f"    __v{i} = __d[{k!r}]" for i, k in enumerate(names)]
+        body += ["except KeyError:", "    __kwargs = {}"]
+        for i, k in enumerate(names):
+            body += [
+                f"    if {k!r} in __d:",
+                f"        __v{i} = __d[{k!r}]",
+                f"        __kwargs[{k!r}] = {values[i]}",
+            ]
+        body += [f"    return {new}(**__kwargs){close}"]
+        body += [
+            f"return {new}("
+            + ", ".join([f"{k}={values[i]}" for i, k in enumerate(names)])
+            + f"){close}"
+        ]
+        return gen.build("from_dict", "__d", body)
+
+
+def _validated_decoder_body(
+    gen: _Codegen,
+    init_args: dict[str, Any],
+    values: list[str],
+    new: str,
+    close: str,
+) -> list[str]:
+    names: list[str] = list(init_args)
+    error: str = gen.symbol(ValidationError)
+    nested_errors: str = gen.symbol(_nested_errors, "nested_errors")
+    raise_validation: str = gen.symbol(_raise_validation, "raise_validation")
+    missing: str = gen.symbol(MISSING, "missing")
+    body: list[str] = ["try:"]
+    body += [f"    __v{i} = __d[{k!r}]" for i, k in enumerate(names)]
+    body += ["except KeyError:", "    __kwargs = {}", "    __errors = None"]
+    for i, k in enumerate(names):
+        body += [f"    if {k!r} in __d:", f"        __v{i} = __d[{k!r}]"]
+        if not _is_nested_type(init_args[k]):
+            body += [f"        __kwargs[{k!r}] = {values[i]}"]
+            continue
+        body += [
+            "        try:",
+            f"            __kwargs[{k!r}] = {values[i]}",
+            f"        except {error} as __e:",
+            f"            __errors = {nested_errors}(__errors, {k!r}, __e)",
+        ]
+    body += [
+        "    if __errors is not None:",
+        f"        {raise_validation}(_cls, __kwargs, __errors)",
+        f"    return {new}**__kwargs){close}",
+        "__errors = None",
+    ]
+    for i, k in enumerate(names):
+        if not _is_nested_type(init_args[k]):
+            body += [f"__x{i} = {values[i]}"]
+            continue
+        body += [
+            "try:",
+            f"    __x{i} = {values[i]}",
+            f"except {error} as __e:",
+            f"    __x{i} = {missing}",
+            f"    __errors = {nested_errors}(__errors, {k!r}, __e)",
+        ]
+    kwargs: str = ", ".join([f"{k!r}: __x{i}" for i, k in enumerate(names)])
+    return body + [
+        "if __errors is not None:",
+        f"    {raise_validation}(_cls, {{{kwargs}}}, __errors)",
+        f"return {new}"
+        + ", ".join([f"{k}=__x{i}" for i, k in enumerate(names)])
+        + f"){close}",
+    ]
+
+
+def _nested_errors(
+    __errors: List[Dict[str, Any]] | None, name: str, error: ValidationError
+) -> List[Dict[str, Any]]:
+    nested: List[Dict[str, Any]] = [
+        {**x, "field": f"{name}.{x['field']}"} for x in error.errors
+    ]
+    return nested if __errors is None else __errors + nested
+
+
+def _raise_validation(
+    cls: Type[Classy],
+    __kwargs: Dict[str, Any],
+    __errors: List[Dict[str, Any]],
+) -> None:
+    plan: _ClassyPlan = _get_plan(cls)
+    try:
+        plan.validate({k: v for k, v in __kwargs.items() if v is not MISSING})
+    except ValidationError as error:
+        __errors = error.errors + __errors
+    order: list[str] = list(plan.init_args)
+    __errors.sort(key=lambda x: order.index(x["field"].partition(".")[0]))
+    raise ValidationError(_validation_message(cls, __errors), __errors)
+
+
+def _decoder_expr(
+    gen: _Codegen, __type: Any, var: str, depth: int, lazy: bool = False
+) -> str | None:
+    if isinstance(__type, GenericAlias):
+        collection_type: type = __type.__origin__
+        item_types: tuple[Any, ...] = get_args(__type)
+        item: str = f"__i{depth}"
+        if collection_type == list:
+            if len(item_types) != 1:
+                return gen.error("Invalid generic item type args for 'list'.")
+            expr: str | None = _decoder_expr(
+                gen, item_types[0], item, depth + 1, lazy
+            )
+            if expr is None:
+                return f"list({var})"
+            return f"[{expr} for {item} in {var}]"
+        if collection_type == tuple:
+            if len(item_types) == 2 and item_types[1] is Ellipsis:
+                expr = _decoder_expr(gen, item_types[0], item, depth + 1, lazy)
+                if expr is None:
+                    return f"tuple({var})"
+                return f"tuple([{expr} for {item} in {var}])"
+            items: list[str] = [f"__{i}" for i in range(len(item_types))]
+            exprs: list[str] = [
+                _decoder_expr(gen, t, items[i], 0, lazy) or items[i]
+                for i, t in enumerate(item_types)
+            ]
+            helper: str = gen.helper(
+                "__value",
+                [
+                    f"if len(__value) != {len(item_types)}:",
+                    "    "
+                    + gen.error(
+                        "Invalid generic item type args for 'tuple'. number of item args mismatched."
+                    ),
+                    *([f"{', '.join(items)}, = __value"] if items else []),
+                    f"return ({''.join([f'{x}, ' for x in exprs])})",
+                ],
+            )
+            return f"{helper}({var})"
+        if collection_type == dict:
+            if len(item_types) != 2:
+                return gen.error("Invalid generic type args for 'dict'.")
+            key: str = f"__k{depth}"
+            expr = _decoder_expr(gen, item_types[1], item, depth + 1, lazy)
+            return (
+                f"{{{key}: {expr or item} for {key}, {item} in {var}.items()"
+                f" if isinstance({key}, {gen.symbol(item_types[0])})}}"
+            )
+        return gen.error(
+            "Unsupported generic type detected in dataclass fields."
+        )
+    origin: Any = get_origin(__type)
+    if origin is Union:
+        return _union_decoder_expr(gen, __type, var, depth, lazy)
+    if origin is Literal:
+        values: dict[Any, Any] = {x: x for x in get_args(__type)}
+        values.update(
+            {x.value: x for x in get_args(__type) if isinstance(x, Enum)}
+        )
+        symbol: str = gen.symbol(values, "literal")
+        return f"{symbol}[{var}] if {var} in {symbol} else " + gen.error(
+            f"Invalid value for '{__type!r}'."
+        )
+    if not isinstance(__type, type):
+        return (
+            f"{var} if isinstance({var}, {gen.symbol(__type)}) else "
+            + gen.error("Unsupported type detected in dataclass fields.")
+        )
+    if issubclass(__type, Classy):
+        symbol = gen.symbol(__type)
+        decode_nested: str = _nested_decoder_call(
+            gen, symbol, [__type], var, lazy
+        )
+        return f"{var} if isinstance({var}, {symbol}) else {decode_nested}"
+    codec: _Codec | None = _resolve_codec(_scopes(gen), __type)
+    if codec is not None:
+        symbol = gen.symbol(__type)
+        decode: Callable[[Any], Any] | None = codec[1]
+        call: str = symbol if decode is None else gen.symbol(decode, "decode")
+        return f"{var} if isinstance({var}, {symbol}) else {call}({var})"
+    return None
+
+
+def _union_decoder_expr(
+    gen: _Codegen, __type: Any, var: str, depth: int, lazy: bool
+) -> str | None:
+    members: tuple[Any, ...] = get_args(__type)
+    options: list[Any] = [x for x in members if x is not type(None)]
+    if len(options) == 1:
+        expr: str | None = _decoder_expr(gen, options[0], var, depth, lazy)
+        if expr is None or len(members) == 1:
+            return expr
+        return f"None if {var} is None else {expr}"
+    types: list[type] = [x for x in members if isinstance(x, type)]
+    classes: list[Type[Classy]] = [x for x in types if issubclass(x, Classy)]
+    attempts: list[str] = []
+    for x in options:
+        if x in classes:
+            continue
+        expr = _decoder_expr(gen, x, "__value", depth + 1, lazy)
+        if expr is not None:
+            attempts += [
+                "try:",
+                f"    return {expr}",
+                "except (TypeError, ValueError, KeyError):",
+                "    pass",
+            ]
+    if not attempts and not classes:
+        return None
+    body: list[str] = []
+    if types:
+        symbol: str = gen.symbol(tuple(types), "members")
+        body += [f"if isinstance(__value, {symbol}):", "    return __value"]
+    message: str = f"The value does not match any type of '{__type!r}'."
+    discriminator: tuple[str, dict[Any, type]] | None = _discriminator(classes)
+    if discriminator is not None:
+        tag, table = discriminator
+        body += [
+            "if isinstance(__value, dict):",
+            f"    __cls = {gen.symbol(table, 'tags')}.get(__value.get({tag!r}))",
+            "    if __cls is not None:",
+            "        return "
+            + _nested_decoder_call(gen, "__cls", classes, "__value", lazy),
+        ]
+        if not attempts:
+            body += ["    " + gen.error(message), "return __value"]
+            return f"{gen.helper('__value', body)}({var})"
+    else:
+        for x in classes:
+            expr = _nested_decoder_call(
+                gen, gen.symbol(x), [x], "__value", lazy
+            )
+            attempts[:0] = [
+                "try:",
+                f"    return {expr}",
+                "except (TypeError, ValueError, KeyError):",
+                "    pass",
+            ]
+    body += attempts
+    if classes:
+        body += ["if isinstance(__value, dict):", "    " + gen.error(message)]
+    body += ["return __value"]
+    return f"{gen.helper('__value', body)}({var})"
+
+
+def _scopes(gen: _Codegen) -> list[dict[type, _Codec]]:
+    if gen.scopes is None:
+        gen.scopes = _get_plan(gen.cls).document_scopes
+    return gen.scopes
+
+
+def _nested_decoder_call(
+    gen: _Codegen, cls: str, classes: list[type], var: str, lazy: bool
+) -> str:
+    scopes: list[dict[type, _Codec]] = _scopes(gen)
+    if all(
+        _same_scopes(_get_plan(x).document_scopes, scopes) for x in classes
+    ):
+        return (
+            f"{cls}.from_dict({var}, defer=True)"
+            if lazy
+            else (f"{cls}.from_dict({var})")
+        )
+    return (
+        f"{gen.symbol(_decode_scoped)}({cls}, "
+        f"{gen.symbol(scopes, 'scopes')}, {lazy}, {var})"
+    )
+
+
+def _same_scopes(
+    __scopes: list[dict[type, _Codec]], __other: list[dict[type, _Codec]]
+) -> bool:
+    return len(__scopes) == len(__other) and all(
+        x is y for x, y in zip(__scopes, __other)
+    )
+
+
+def _decode_scoped(
+    cls: Type[Classy],
+    scopes: list[dict[type, _Codec]],
+    lazy: bool,
+    __value: Any,
+) -> Any:
+    return _get_plan(cls).scoped_from_dict(scopes, lazy)(__value)
+
+
+def _discriminator(
+    classes: list[Type[Classy]],
+) -> tuple[str, dict[Any, type]] | None:
+    if len(classes) < 2:
+        return None
+    tags: list[str] = [x.__classy_tag__ for x in classes if x.__classy_tag__]
+    if not tags:
+        tags = [
+            k
+            for k, t in _get_plan(classes[0]).field_types.items()
+            if get_origin(t) is Literal
+        ]
+    for tag in tags:
+        table: dict[Any, type] | None = _tag_table(classes, tag)
+        if table is not None:
+            return tag, table
+    return None
+
+
+def _tag_table(
+    classes: list[Type[Classy]], tag: str
+) -> dict[Any, type] | None:
+    table: dict[Any, type] = {}
+    for cls in classes:
+        __type: Any = _get_plan(cls).field_types.get(tag)
+        if get_origin(__type) is not Literal:
+            return None
+        for x in get_args(__type):
+            keys: list[Any] = [x, x.value] if isinstance(x, Enum) else [x]
+            if any(k in table for k in keys):
+                return None
+            table.update({k: cls for k in keys})
+    return table
+
+
+def _projection_expr(
+    gen: _Codegen,
+    __type: Any,
+    var: str,
+    depth: int,
+    include: tuple[str, ...] | None,
+    exclude: tuple[str, ...] | None,
+) -> str:
+    if isinstance(__type, type) and issubclass(__type, Classy):
+        project: Callable[[Any], Any] = _get_plan(__type).projection(
+            include, exclude
+        )
+        return f"{gen.symbol(project, 'project')}({var})"
+    item: str = f"__i{depth}"
+    item_types: tuple[Any, ...] = get_args(__type)
+    if get_origin(__type) is Union:
+        options: list[Any] = [x for x in item_types if x is not type(None)]
+        if len(options) == 1:
+            expr: str = _projection_expr(
+                gen, options[0], var, depth, include, exclude
+            )
+            return f"None if {var} is None else {expr}"
+        table: dict[type, Callable[[Any], Any]] = {
+            x: _get_plan(x).projection(
+                _member_mask(x, include), _member_mask(x, exclude)
+            )
+            for x in options
+            if isinstance(x, type) and issubclass(x, Classy)
+        }
+        if table:
+            return (
+                f"{gen.symbol(_project_member)}({var}, "
+                f"{gen.symbol(table, 'members')}, {include!r}, {exclude!r})"
+            )
+    elif isinstance(__type, GenericAlias):
+        collection_type: type = __type.__origin__
+        if collection_type in (list, tuple) and (
+            len(item_types) == 1
+            or len(item_types) == 2
+            and item_types[1] is Ellipsis
+        ):
+            expr = _projection_expr(
+                gen, item_types[0], item, depth + 1, include, exclude
+            )
+            if collection_type is list:
+                return f"[{expr} for {item} in {var}]"
+            return f"tuple([{expr} for {item} in {var}])"
+        if collection_type is dict and len(item_types) == 2:
+            key: str = f"__k{depth}"
+            expr = _projection_expr(
+                gen, item_types[1], item, depth + 1, include, exclude
+            )
+            return f"{{{key}: {expr} for {key}, {item} in {var}.items()}}"
+    return f"{gen.symbol(_project_value)}({var}, {include!r}, {exclude!r})"
+
+
+def _project_value(
+    __value: Any,
+    include: tuple[str, ...] | None,
+    exclude: tuple[str, ...] | None,
+) -> Any:
+    if isinstance(__value, Classy):
+        return _get_plan(type(__value)).projection(include, exclude)(__value)
+    if type(__value) is list:
+        return [_project_value(x, include, exclude) for x in __value]
+    if type(__value) is tuple:
+        return tuple([_project_value(x, include, exclude) for x in __value])
+    if type(__value) is dict:
+        return {
+            k: _project_value(v, include, exclude) for k, v in __value.items()
+        }
+    return _encode_value(__value)
+
+
+def _project_member(
+    __value: Any,
+    table: dict[type, Callable[[Any], Any]],
+    include: tuple[str, ...] | None,
+    exclude: tuple[str, ...] | None,
+) -> Any:
+    project: Callable[[Any], Any] | None = table.get(type(__value))
+    if project is None:
+        if not isinstance(__value, Classy):
+            return _project_value(__value, include, exclude)
+        cls: type = _get_plan(type(__value)).cls
+        project = _get_plan(cls).projection(
+            _member_mask(cls, include), _member_mask(cls, exclude)
+        )
+    return project(__value)
+
+
+def _member_mask(
+    cls: type, paths: tuple[str, ...] | None
+) -> tuple[str, ...] | None:
+    if paths is None:
+        return None
+    return tuple([x for x in paths if _has_path(cls, x)])
+
+
+def _mask(paths: Iterable[str] | None) -> tuple[str, ...] | None:
+    if paths is None:
+        return None
+    if isinstance(paths, str):
+        return (paths,)
+    return tuple(sorted(set(paths)))
+
+
+def _mask_tree(
+    cls: type, names: tuple[str, ...], paths: tuple[str, ...]
+) -> dict[str, tuple[str, ...] | None]:
+    tree: dict[str, list[str] | None] = {}
+    for path in paths:
+        name, _, rest = path.partition(".")
+        if name not in names:
+            raise ValueError(f"'{cls.__name__}' has no field '{name}'.")
+        if rest and not _has_path(_get_plan(cls).field_types[name], rest):
+            raise ValueError(f"'{cls.__name__}.{name}' has no field '{rest}'.")
+        if not rest:
+            tree[name] = None
+        elif tree.get(name, []) is not None:
+            tree.setdefault(name, []).append(rest)  # type: ignore
+    return {k: None if v is None else tuple(v) for k, v in tree.items()}
+
+
+def _holds_classy(__type: Any) -> bool:
+    if get_origin(__type) is Union:
+        return any(_holds_classy(x) for x in get_args(__type))
+    return isinstance(__type, type) and issubclass(__type, Classy)
+
+
+def _has_path(__type: Any, path: str) -> bool:
+    if isinstance(__type, type) and issubclass(__type, Classy):
+        plan: _ClassyPlan = _get_plan(__type)
+        name, _, rest = path.partition(".")
+        if name not in plan.public_fields:
+            return False
+        return not rest or _has_path(plan.field_types[name], rest)
+    item_types: tuple[Any, ...] = get_args(__type)
+    if get_origin(__type) is dict:
+        item_types = item_types[1:]
+    if get_origin(__type) in (Union, list, tuple, dict):
+        return any(_has_path(x, path) for x in item_types if x is not Ellipsis)
+    return False
+
+
+def _check_expr(
+    gen: _Codegen, __type: Any, var: str, depth: int, sample: int | None
+) -> str | None:
+    origin: Any = get_origin(__type)
+    item_types: tuple[Any, ...] = get_args(__type)
+    if origin is Union:
+        checks: list[str | None] = [
+            _check_expr(gen, x, var, depth, sample) for x in item_types
+        ]
+        if None in checks:
+            return None
+        return f"({' or '.join([str(x) for x in checks])})"
+    if origin is Literal:
+        return f"{var} in {gen.symbol(item_types, 'literal')}"
+    if isinstance(__type, GenericAlias):
+        collection_type: type = __type.__origin__
+        check: str = f"isinstance({var}, {gen.symbol(collection_type)})"
+        item: str = f"__i{depth}"
+        if collection_type in (list, tuple) and (
+            len(item_types) == 1
+            or len(item_types) == 2
+            and item_types[1] is Ellipsis
+        ):
+            expr: str | None = _check_expr(
+                gen, item_types[0], item, depth + 1, sample
+            )
+            if expr is None:
+                return check
+            values: str = var
+            if sample is not None:
+                values = f"{gen.symbol(_sample)}({var}, {sample})"
+            return f"{check} and all({expr} for {item} in {values})"
+        if collection_type is tuple:
+            exprs: list[str] = [
+                x
+                for i, t in enumerate(item_types)
+                if (x := _check_expr(gen, t, f"{var}[{i}]", depth, sample))
+            ]
+            return " and ".join(
+                [check, f"len({var}) == {len(item_types)}", *exprs]
+            )
+        if collection_type is dict and len(item_types) == 2:
+            key: str = f"__k{depth}"
+            key_check: str | None = _check_expr(
+                gen, item_types[0], key, depth + 1, sample
+            )
+            value_check: str | None = _check_expr(
+                gen, item_types[1], item, depth + 1, sample
+            )
+            if key_check is None and value_check is None:
+                return check
+            items: str = f"{var}.items()"
+            if sample is not None:
+                items = f"{gen.symbol(islice)}({items}, {sample})"
+            pair: str = " and ".join(
+                [f"({x})" for x in (key_check, value_check) if x is not None]
+            )
+            return f"{check} and all({pair} for {key}, {item} in {items})"
+        return check
+    if __type is float:
+        return f"isinstance({var}, {gen.symbol((int, float), 'number')})"
+    if isinstance(__type, type) and __type is not object:
+        return f"isinstance({var}, {gen.symbol(__type)})"
+    return None
+
+
+def _sample(__values: Any, size: int) -> Any:
+    if len(__values) <= size:
+        return __values
+    return __values[:: len(__values) // size]
+
+
+def _type_name(__type: Any) -> str:
+    origin: Any = get_origin(__type)
+    item_types: tuple[Any, ...] = get_args(__type)
+    if origin is Union or origin is UnionType:
+        return " | ".join([_type_name(x) for x in item_types])
+    if origin is Literal:
+        return f"Literal[{', '.join([repr(x) for x in item_types])}]"
+    if item_types:
+        items: list[str] = [
+            "..." if x is Ellipsis else _type_name(x) for x in item_types
+        ]
+        return f"{_type_name(origin)}[{', '.join(items)}]"
+    if __type is type(None):
+        return "None"
+    return getattr(__type, "__qualname__", repr(__type))
+
+
+def _validation_error(
+    __errors: List[Dict[str, Any]] | None,
+    name: str,
+    expected: str,
+    __value: Any,
+) -> List[Dict[str, Any]]:
+    error: Dict[str, Any] = {
+        "field": name,
+        "expected": expected,
+        "actual": type(__value).__qualname__,
+        "value": __value,
+    }
+    if __errors is None:
+        return [error]
+    __errors.append(error)
+    return __errors
+
+
+def _validation_message(cls: type, __errors: List[Dict[str, Any]]) -> str:
+    lines: list[str] = [
+        f"{len(__errors)} validation error{'s' if len(__errors) > 1 else ''}"
+        f" for '{cls.__name__}'"
+    ]
+    lines += [
+        f"  {x['field']}: expected {x['expected']}, got {x['actual']}"
+        for x in __errors
+    ]
+    return "\n".join(lines)
+
+
+def _default_expr(gen: _Codegen, __type: Any) -> str:
+    if isinstance(__type, GenericAlias):
+        collection_type: type = __type.__origin__
+        item_types: tuple[Any, ...] = get_args(__type)
+        if collection_type == list:
+            return "[]"
+        if collection_type == dict:
+            return "{}"
+        if collection_type == tuple:
+            if len(item_types) == 2 and item_types[1] is Ellipsis:
+                return "()"
+            items: list[str] = [_default_expr(gen, t) for t in item_types]
+            return f"({''.join([f'{x}, ' for x in items])})"
+        raise TypeError(
+            "Unsupported generic type detected in dataclass fields."
+        )
+    origin: Any = get_origin(__type)
+    if origin is Union:
+        if type(None) in get_args(__type):
+            return "None"
+        return _default_expr(gen, get_args(__type)[0])
+    if origin is Literal:
+        return gen.symbol(get_args(__type)[0], "literal")
+    if not isinstance(__type, type):
+        raise TypeError("Unsupported type detected in dataclass fields.")
+    if issubclass(__type, Classy):
+        return f"{gen.symbol(__type)}.default()"
+    if __type == UUID:
+        return f"{gen.symbol(uuid4)}()"
+    if __type == datetime:
+        return f"{gen.symbol(datetime)}.now()"
+    if __type == date:
+        return f"{gen.symbol(date)}.today()"
+    if __type == time:
+        return f"{gen.symbol(datetime)}.now().time()"
+    return f"{gen.symbol(__type)}()"
+
+
+def _is_pure_default(__type: Any) -> bool:
+    if isinstance(__type, GenericAlias):
+        if __type.__origin__ != tuple:
+            return False
+        item_types: tuple[Any, ...] = get_args(__type)
+        if len(item_types) == 2 and item_types[1] is Ellipsis:
+            return True
+        return all(_is_pure_default(x) for x in item_types)
+    origin: Any = get_origin(__type)
+    if origin is Union:
+        members: tuple[Any, ...] = get_args(__type)
+        return type(None) in members or _is_pure_default(members[0])
+    if origin is Literal:
+        return True
+    if __type in (str, int, float, bool, bytes, complex, tuple):
+        return True
+    if isinstance(__type, type) and issubclass(__type, Classy):
+        return (
+            getattr(__type.default, "__func__")
+            is getattr(Classy.default, "__func__")
+            and _get_plan(__type).shared_default
+        )
+    return False
+
+
+_ATOMIC_TYPES: frozenset[type] = frozenset(
+    [
+        str,
+        int,
+        float,
+        bool,
+        bytes,
+        complex,
+        type(None),
+        UUID,
+        datetime,
+        date,
+        time,
+    ]
+)
+
+
+def _encode_value(__value: Any) -> Any:
+    value_type: type = type(__value)
+    if value_type in _ATOMIC_TYPES:
+        return __value
+    if value_type is list:
+        return [_encode_value(x) for x in __value]
+    if value_type is dict:
+        return {_encode_value(k): _encode_value(v) for k, v in __value.items()}
+    if value_type is tuple:
+        return tuple([_encode_value(x) for x in __value])
+    if isinstance(__value, Classy):
+        return _get_plan(value_type).encode(__value)
+    if is_dataclass(__value) and not isinstance(__value, type):
+        return asdict(__value)
+    if isinstance(__value, tuple) and hasattr(__value, "_fields"):
+        return value_type(*[_encode_value(x) for x in __value])
+    if isinstance(__value, (list, tuple)):
+        return value_type(_encode_value(x) for x in __value)
+    if isinstance(__value, defaultdict):
+        return value_type(
+            __value.default_factory,
+            {_encode_value(k): _encode_value(v) for k, v in __value.items()},
+        )
+    if isinstance(__value, dict):
+        return value_type(
+            (_encode_value(k), _encode_value(v)) for k, v in __value.items()
+        )
+    return deepcopy(__value)
+
+
+def _copy_expr(gen: _Codegen, __type: Any, var: str) -> str:
+    if __type in _ATOMIC_TYPES:
+        return var
+    if isinstance(__type, GenericAlias) and all(
+        x is Ellipsis or x in _ATOMIC_TYPES for x in get_args(__type)
+    ):
+        if __type.__origin__ is tuple:
+            return var
+        if __type.__origin__ in (list, dict):
+            return f"{__type.__origin__.__name__}({var})"
+    return f"{gen.symbol(_copy_encoded)}({var})"
+
+
+def _copy_encoded(__value: Any) -> Any:
+    value_type: type = type(__value)
+    if value_type in _ATOMIC_TYPES:
+        return __value
+    if value_type is dict:
+        return {k: _copy_encoded(v) for k, v in __value.items()}
+    if value_type is list:
+        return [_copy_encoded(x) for x in __value]
+    if value_type is tuple:
+        return tuple([_copy_encoded(x) for x in __value])
+    return deepcopy(__value)
+
+
+def _json_expr(
+    gen: _Codegen, default: "_JsonDefault", __type: Any, var: str, depth: int
+) -> str | None:
+    if __type in _ATOMIC_TYPES:
+        return None
+    fallback: str = (
+        f"{gen.symbol(_json_value)}({var}, {gen.symbol(default, 'default')})"
+    )
+    item_types: tuple[Any, ...] = get_args(__type)
+    if isinstance(__type, GenericAlias):
+        collection_type: type = __type.__origin__
+        item: str = f"__i{depth}"
+        if collection_type in (list, tuple) and (
+            len(item_types) == 1
+            or len(item_types) == 2
+            and item_types[1] is Ellipsis
+        ):
+            expr: str | None = _json_expr(
+                gen, default, item_types[0], item, depth + 1
+            )
+            return None if expr is None else f"[{expr} for {item} in {var}]"
+        if collection_type is dict and len(item_types) == 2:
+            key: str = f"__k{depth}"
+            expr = _json_expr(gen, default, item_types[1], item, depth + 1)
+            if expr is None:
+                return None
+            return f"{{{key}: {expr} for {key}, {item} in {var}.items()}}"
+        return fallback
+    origin: Any = get_origin(__type)
+    if origin is Union:
+        options: list[Any] = [x for x in item_types if x is not type(None)]
+        if len(options) == 1:
+            expr = _json_expr(gen, default, options[0], var, depth)
+            return (
+                None if expr is None else f"None if {var} is None else {expr}"
+            )
+        if all(
+            _json_expr(gen, default, x, var, depth) is None for x in options
+        ):
+            return None
+        return fallback
+    if origin is Literal:
+        if all(type(x) in _ATOMIC_TYPES for x in item_types):
+            return None
+        return fallback
+    if not isinstance(__type, type) or issubclass(__type, Classy):
+        return fallback
+    encode: Callable[[Any], Any] | None = default.encoder(__type)
+    if encode is None:
+        return fallback
+    return (
+        f"{gen.symbol(encode, 'encode')}({var})"
+        f" if isinstance({var}, {gen.symbol(__type)}) else {var}"
+    )
+
+
+def _json_value(__value: Any, default: "_JsonDefault") -> Any:
+    value_type: type = type(__value)
+    if value_type in _ATOMIC_TYPES:
+        return __value
+    if value_type is list or value_type is tuple:
+        return [_json_value(x, default) for x in __value]
+    if value_type is dict:
+        return {k: _json_value(v, default) for k, v in __value.items()}
+    if isinstance(__value, Classy):
+        encode_classy: Callable[[Any], Dict[str, Any]] | None = (
+            default.classes.get(value_type)
+        )
+        if encode_classy is None:
+            encode_classy = _get_plan(value_type).json_encoder(default)
+            default.classes[value_type] = encode_classy
+        return encode_classy(__value)
+    encode: Callable[[Any], Any] | None = default.encoder(value_type)
+    if encode is not None:
+        return encode(__value)
+    return _encode_value(__value)
+
+
+def _is_frozen_type(__type: Any, seen: set[type]) -> bool:
+    if isinstance(__type, GenericAlias):
+        return __type.__origin__ in (tuple, frozenset) and all(
+            x is Ellipsis or _is_frozen_type(x, seen) for x in get_args(__type)
+        )
+    if get_origin(__type) is Union:
+        return all(_is_frozen_type(x, seen) for x in get_args(__type))
+    if not isinstance(__type, type):
+        return True
+    if issubclass(__type, (list, dict, set, bytearray)):
+        return False
+    if not issubclass(__type, Classy) or __type in seen:
+        return True
+    if not getattr(__type, "__dataclass_params__").frozen:
+        return False
+    seen.add(__type)
+    plan: _ClassyPlan = _get_plan(__type)
+    return all(
+        _is_frozen_type(plan.field_types[k], seen) for k in plan.public_fields
+    )
+
+
+def _is_flat_type(__type: Any) -> bool:
+    if isinstance(__type, GenericAlias):
+        return __type.__origin__ in (list, tuple, dict) and all(
+            x is Ellipsis or _is_flat_type(x) for x in get_args(__type)
+        )
+    origin: Any = get_origin(__type)
+    if origin is Union:
+        return all(_is_flat_type(x) for x in get_args(__type))
+    if origin is Literal:
+        return all(type(x) in _ATOMIC_TYPES for x in get_args(__type))
+    return __type in _ATOMIC_TYPES
+
+
+def _is_nested_type(__type: Any) -> bool:
+    if isinstance(__type, GenericAlias):
+        return True
+    if get_origin(__type) is Union:
+        return any(_is_nested_type(x) for x in get_args(__type))
+    return isinstance(__type, type) and issubclass(__type, Classy)
+
+
+def _normalize_type(__type: Any) -> Any:
+    origin: Any = get_origin(__type)
+    if origin is None or origin is Literal:
+        return __type
+    if origin is Annotated:
+        return _normalize_type(get_args(__type)[0])
+    args: tuple[Any, ...] = tuple(
+        [_normalize_type(x) for x in get_args(__type)]
+    )
+    if origin is Union or origin is UnionType:
+        return Union[args]
+    if origin in (list, tuple, dict):
+        if not args and not hasattr(__type, "__args__"):
+            return origin
+        return GenericAlias(origin, args)
+    return __type
+
+
+def _resolve_codec(
+    scopes: list[dict[type, _Codec]], __type: type
+) -> _Codec | None:
+    for t in getattr(__type, "__mro__", (__type,)):
+        for scope in scopes:
+            if t in scope:
+                return scope[t]
+    return None
+
+
+class _JsonDefault:
+    def __init__(
+        self,
+        scopes: list[dict[type, _Codec]],
+        encoders: dict[type, Callable[[Any], Any] | None] | None = None,
+    ) -> None:
+        self.scopes: list[dict[type, _Codec]] = scopes
+        self.encoders: dict[type, Callable[[Any], Any] | None] = (
+            {} if encoders is None else encoders
+        )
+        self.classes: dict[type, Callable[[Any], Dict[str, Any]]] = {}
+
+    def encoder(self, __type: type) -> Callable[[Any], Any] | None:
+        try:
+            return self.encoders[__type]
+        except KeyError:
+            codec: _Codec | None = _resolve_codec(self.scopes, __type)
+            encode: Callable[[Any], Any] | None = (
+                None if codec is None else codec[0]
+            )
+            self.encoders[__type] = encode
+            return encode
+
+    def __call__(self, obj: Any) -> Any:
+        encode: Callable[[Any], Any] | None = self.encoder(type(obj))
+        if encode is None:
+            raise TypeError(
+                f"Object of type {type(obj).__name__} is not JSON serializable"
+            )
+        return encode(obj)
+
+
+_json_default: _JsonDefault = _JsonDefault([_CODECS], _json_encoders)
+
+
+def _encode_bytes(__value: bytes) -> str:
+    return b64encode(__value).decode("ascii")
+
+
+def _encode_enum(__value: Enum) -> Any:
+    return __value.value
+
+
+_CODECS.update(
+    {
+        UUID: (str, None),
+        datetime: (datetime.isoformat, datetime.fromisoformat),
+        date: (date.isoformat, date.fromisoformat),
+        time: (time.isoformat, time.fromisoformat),
+        Decimal: (str, None),
+        Enum: (_encode_enum, None),
+        PurePath: (str, None),
+        bytes: (_encode_bytes, b64decode),
+    }
+)
+
+
+def _json_float(__value: float) -> str:
+    if __value != __value:
+        return "NaN"
+    if __value == float("inf"):
+        return "Infinity"
+    if __value == -float("inf"):
+        return "-Infinity"
+    return float.__repr__(__value)
+
+
+def _json_key(__key: Any) -> str:
+    if isinstance(__key, str):
+        return encode_basestring_ascii(__key)
+    if __key is None or isinstance(__key, (int, float)):
+        return f'"{_json_scalar(__key)}"'
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {type(__key).__name__}"
+    )
+
+
+def _json_scalar(
+    __value: Any, default: _JsonDefault = _json_default
+) -> str | None:
+    value_type: type = type(__value)
+    if value_type is str:
+        return encode_basestring_ascii(__value)
+    if __value is None:
+        return "null"
+    if __value is True:
+        return "true"
+    if __value is False:
+        return "false"
+    if value_type is int:
+        return int.__repr__(__value)
+    if value_type is float:
+        return _json_float(__value)
+    if isinstance(__value, (list, tuple, dict, Classy)) or is_dataclass(
+        __value
+    ):
+        return None
+    if default.encoder(value_type) is None:
+        if isinstance(__value, str):
+            return encode_basestring_ascii(__value)
+        if isinstance(__value, int):
+            return int.__repr__(__value)
+        if isinstance(__value, float):
+            return _json_float(__value)
+    converted: Any = default(__value)
+    scalar: str | None = _json_scalar(converted, default)
+    return (
+        "".join(_iter_json(converted, default)) if scalar is None else scalar
+    )
+
+
+def _iter_json(
+    __value: Any, default: _JsonDefault = _json_default
+) -> Iterator[str]:
+    scalar: str | None = _json_scalar(__value, default)
+    if scalar is not None:
+        yield scalar
+    elif isinstance(__value, (list, tuple)):
+        yield from _iter_json_array(__value, default)
+    else:
+        items: Iterable[tuple[str, Any]]
+        if isinstance(__value, Classy):
+            names: tuple[str, ...] = _get_plan(type(__value)).public_fields
+            items = ((k, getattr(__value, k)) for k in names)
+        elif isinstance(__value, dict):
+            items = __value.items()
+        else:
+            items = asdict(__value).items()
+        parts: list[str] = ["{"]
+        for i, (key, item) in enumerate(items):
+            parts.append(
+                f", {_json_key(key)}: " if i else f"{_json_key(key)}: "
+            )
+            scalar = _json_scalar(item, default)
+            if scalar is None:
+                yield "".join(parts)
+                parts.clear()
+                yield from _iter_json(item, default)
+            else:
+                parts.append(scalar)
+        parts.append("}")
+        yield "".join(parts)
+
+
+def _iter_json_array(
+    __value: list[Any] | tuple[Any, ...],
+    default: _JsonDefault = _json_default,
+) -> Iterator[str]:
+    batch: list[Any] = []
+    separator: str = "["
+    for item in __value:
+        item_type: type = type(item)
+        if item_type in _ATOMIC_TYPES:
+            batch.append(item)
+        elif isinstance(item, Classy) and _get_plan(item_type).flat:
+            batch.append(_get_plan(item_type).encode(item))
+        else:
+            if batch:
+                yield separator + json.dumps(batch, default=default)[1:-1]
+                batch.clear()
+                separator = ", "
+            yield separator
+            yield from _iter_json(item, default)
+            separator = ", "
+            continue
+        if len(batch) >= 256:
+            yield separator + json.dumps(batch, default=default)[1:-1]
+            batch.clear()
+            separator = ", "
+    if batch:
+        yield separator + json.dumps(batch, default=default)[1:-1]
+        separator = ", "
+    yield "[]" if separator == "[" else "]"
+
+
+def _slot_descriptor(cls: type, name: str) -> Any:
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            member: Any = klass.__dict__[name]
+            return member if isinstance(member, MemberDescriptorType) else None
+    return None
+
+
+_set_uuid_int: Callable[[UUID, int], None] = UUID.__dict__["int"].__set__
+_set_uuid_is_safe: Callable[[UUID, SafeUUID], None] = UUID.__dict__[
+    "is_safe"
+].__set__
+
+
+def _uuid_from_bytes(__bytes: bytes) -> UUID:
+    uuid: UUID = object.__new__(UUID)
+    _set_uuid_int(uuid, int.from_bytes(__bytes))
+    _set_uuid_is_safe(uuid, SafeUUID.unknown)
+    return uuid
+
+
+def _restore(
+    cls: Type[Classy],
+    names: tuple[str, ...],
+    state: tuple[Any, ...],
+    extra: dict[str, Any] | None = None,
+) -> Any:
+    plan: _ClassyPlan | None = cls.__classy_plan__
+    if plan is None or plan.cls is not cls:
+        plan = _get_plan(cls)
+    if names is not plan.loaded_names:
+        if names != plan.field_names:
+            state = _reorder_state(plan, dict(zip(names, state)))
+        else:
+            plan.loaded_names = names
+    restored: Any = plan.restore(state)
+    if extra is not None:
+        restored.__dict__.update(extra)
+    return restored
+
+
+def _reorder_state(plan: _ClassyPlan, __values: dict[str, Any]) -> tuple:
+    cls: type = plan.cls
+    state: list[Any] = []
+    for f in fields(cls):
+        if f.metadata.get(_INTERNAL):
+            continue
+        if f.name in __values:
+            state.append(__values[f.name])
+        elif f.default is not MISSING:
+            state.append(f.default)
+        elif f.default_factory is not MISSING:
+            state.append(f.default_factory())
+        else:
+            raise TypeError(
+                f"Cannot restore '{cls.__name__}': the pickled state has no field '{f.name}'."
+            )
+    return tuple(state)
+
+
+def _extra_state(__self: Any, names: frozenset[str]) -> dict[str, Any] | None:
+    attributes: dict[str, Any] | None = getattr(__self, "__dict__", None)
+    if attributes is None or attributes.keys() <= names:
+        return None
+    return {k: v for k, v in attributes.items() if k not in names}
+
+
+def _invalidate_plans(cls: type) -> None:
+    _json_encoders.clear()
+    _json_default.classes.clear()
+    for subclass in cls.__subclasses__():
+        if "__classy_plan__" in subclass.__dict__:
+            delattr(subclass, "__classy_plan__")
+        _invalidate_plans(subclass)
+
+
+def _nested_classy_types(cls: type) -> list[type]:
+    found: list[type] = [cls]
+    for current in found:
+        types: list[Any] = list(_get_plan(current).field_types.values())
+        while types:
+            t: Any = types.pop()
+            if isinstance(t, GenericAlias) or get_origin(t) is Union:
+                types += [x for x in get_args(t) if x is not Ellipsis]
+            elif isinstance(t, type) and issubclass(t, Classy):
+                if t not in found:
+                    found.append(t)
+    return found
+
+
+def _get_plan(cls: Type[Classy]) -> _ClassyPlan:
+    plan: _ClassyPlan | None = cls.__classy_plan__
+    if plan is None or plan.cls is not cls:
+        origin: type | None = cls.__dict__.get("__classy_origin__")
+        if origin is not None:
+            return _get_plan(origin)
+        plan = _ClassyPlan(cls)
+        cls.__classy_plan__ = plan
+    return plan
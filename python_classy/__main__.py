@@ -0,0 +1,25 @@
+import sys
+from argparse import ArgumentParser, Namespace
+from typing import Any
+from .compiler import write_precompiled
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser: ArgumentParser = ArgumentParser(prog="python -m python_classy")
+    commands: Any = parser.add_subparsers(dest="command", required=True)
+    compile_parser: ArgumentParser = commands.add_parser(
+        "compile",
+        help="write precompiled from_dict/dict/default functions next to model modules",
+    )
+    compile_parser.add_argument("modules", nargs="+", metavar="module")
+    args: Namespace = parser.parse_args(argv)
+    for name in args.modules:
+        path, skipped = write_precompiled(name)
+        print(f"{name} -> {path}")
+        for x in skipped:
+            print(f"  {x} is compiled at runtime", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+from asyncio import StreamReader, StreamWriter, get_running_loop, sleep
+from concurrent.futures import Executor
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Type, TypeVar
+from . import Classy
+
+_T = TypeVar("_T", bound=Classy)
+
+
+def _decode_json_lines(cls: Type[_T], lines: list[bytes]) -> list[_T]:
+    return cls.from_dicts([cls.deserialize(x.decode()) for x in lines])
+
+
+def _encode_json_lines(cls: Type[_T], objects: list[_T]) -> bytes:
+    return "".join([f"{x.json}\n" for x in objects]).encode()
+
+
+async def aiter_json_lines(
+    cls: Type[_T],
+    reader: StreamReader,
+    chunk_size: int = 256,
+    executor: Executor | None = None,
+) -> AsyncIterator[_T]:
+    lines: list[bytes] = []
+    while True:
+        line: bytes = await reader.readline()
+        if line.strip():
+            lines.append(line)
+        if lines and (len(lines) >= chunk_size or not line):
+            if executor is None:
+                decoded: list[_T] = _decode_json_lines(cls, lines)
+            else:
+                decoded = await get_running_loop().run_in_executor(
+                    executor, _decode_json_lines, cls, lines
+                )
+            lines = []
+            for x in decoded:
+                yield x
+            await sleep(0)
+        if not line:
+            return
+
+
+async def adump_json_lines(
+    cls: Type[_T],
+    objects: Iterable[_T] | AsyncIterable[_T],
+    writer: StreamWriter,
+    chunk_size: int = 256,
+    executor: Executor | None = None,
+) -> int:
+    count: int = 0
+    chunk: list[_T] = []
+    async for x in _aiter(objects):
+        chunk.append(x)
+        if len(chunk) >= chunk_size:
+            await _write_json_lines(cls, chunk, writer, executor)
+            count += len(chunk)
+            chunk = []
+    if chunk:
+        await _write_json_lines(cls, chunk, writer, executor)
+        count += len(chunk)
+    return count
+
+
+async def _write_json_lines(
+    cls: Type[_T],
+    objects: list[_T],
+    writer: StreamWriter,
+    executor: Executor | None,
+) -> None:
+    if executor is None:
+        data: bytes = _encode_json_lines(cls, objects)
+    else:
+        data = await get_running_loop().run_in_executor(
+            executor, _encode_json_lines, cls, objects
+        )
+    writer.write(data)
+    await writer.drain()
+    await sleep(0)
+
+
+async def _aiter(
+    objects: Iterable[Any] | AsyncIterable[Any],
+) -> AsyncIterator[Any]:
+    if isinstance(objects, AsyncIterable):
+        async for x in objects:
+            yield x
+    else:
+        for x in objects:
+            yield x
@@ -0,0 +1,438 @@
+from datetime import date, datetime, time, timedelta, timezone
+from hashlib import blake2b
+from struct import Struct, error as StructError, pack, unpack_from
+from types import GenericAlias
+from typing import Any, Callable, Type, get_args
+from uuid import UUID
+from . import Classy, _Codegen, _get_plan, _uuid_from_bytes
+
+Writer = Callable[[bytearray, Any], None]
+Reader = Callable[[memoryview, int], tuple[Any, int]]
+
+_LENGTH: Struct = Struct("<I")
+_FINGERPRINT_SIZE: int = 8
+_PRIMITIVES: dict[type, str] = {int: "q", float: "d", bool: "?"}
+_EPOCH: datetime = datetime(1970, 1, 1)
+_EPOCH_UTC: datetime = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND: timedelta = timedelta(microseconds=1)
+_DATETIME: Struct = Struct("<?q")
+_OFFSET: Struct = Struct("<i")
+_DATE: Struct = Struct("<i")
+_TIME: Struct = Struct("<?q")
+_TRUNCATED: str = "Truncated or corrupted binary payload"
+
+
+class BinaryCodec:
+    def __init__(self, cls: Type[Classy]) -> None:
+        plan: Any = _get_plan(cls)
+        self.cls: Type[Classy] = cls
+        self.field_types: dict[str, Any] = plan.field_types
+        self.fields: list[tuple[str, Writer, Reader]] = [
+            (k, *_codec(t)) for k, t in self.field_types.items()
+        ]
+        self.fingerprint: bytes = blake2b(
+            _schema(cls, set()).encode(), digest_size=_FINGERPRINT_SIZE
+        ).digest()
+        self.write: Writer = self.__compile_writer()
+        self.read: Reader = self.__compile_reader(plan.restore)
+
+    def encode(self, __value: Any) -> bytes:
+        buffer: bytearray = bytearray(self.fingerprint)
+        try:
+            self.write(buffer, __value)
+        except StructError as error:
+            raise ValueError(
+                f"Field '{self.locate(__value)}' of '{self.cls.__name__}' cannot be written as binary: {error}."
+            ) from error
+        return bytes(buffer)
+
+    def locate(self, __value: Any) -> str:
+        for k, write, _ in self.fields:
+            try:
+                write(bytearray(), getattr(__value, k))
+            except StructError:
+                t: Any = self.field_types[k]
+                if isinstance(t, type) and issubclass(t, Classy):
+                    nested: str = _get_plan(t).binary.locate(
+                        getattr(__value, k)
+                    )
+                    return f"{k}.{nested}"
+                return k
+        return "?"
+
+    def decode(self, data: bytes | bytearray | memoryview) -> Any:
+        view: memoryview = memoryview(data)
+        if view[:_FINGERPRINT_SIZE] != self.fingerprint:
+            raise ValueError(
+                f"Binary payload does not match the schema of '{self.cls.__name__}'."
+            )
+        try:
+            value, offset = self.read(view, _FINGERPRINT_SIZE)
+        except StructError as error:
+            raise ValueError(f"{_TRUNCATED}.") from error
+        if offset > len(view):
+            raise ValueError(f"{_TRUNCATED}.")
+        if offset != len(view):
+            raise ValueError("Unexpected trailing bytes in binary payload.")
+        return value
+
+    def __groups(self) -> list[list[str]]:
+        groups: list[list[str]] = []
+        for k, t in self.field_types.items():
+            if (
+                _is_primitive(t)
+                and groups
+                and _is_primitive(self.field_types[groups[-1][-1]])
+            ):
+                groups[-1].append(k)
+            else:
+                groups.append([k])
+        return groups
+
+    def __packer(self, group: list[str]) -> Struct:
+        return Struct(
+            "<" + "".join([_PRIMITIVES[self.field_types[k]] for k in group])
+        )
+
+    def __compile_writer(self) -> Writer:
+        gen: _Codegen = _Codegen(self.cls)
+        writers: dict[str, Writer] = {k: w for k, w, _ in self.fields}
+        length: str = gen.symbol(_LENGTH.pack, "length")
+        body: list[str] = []
+        for group in self.__groups():
+            k: str = group[0]
+            t: Any = self.field_types[k]
+            if _is_primitive(t):
+                packer: str = gen.symbol(self.__packer(group).pack, "pack")
+                values: str = ", ".join([f"__self.{x}" for x in group])
+                body += [f"__buffer += {packer}({values})"]
+            elif t is str:
+                body += [
+                    f"__b = __self.{k}.encode()",
+                    f"__buffer += {length}(len(__b))",
+                    "__buffer += __b",
+                ]
+            elif t is UUID:
+                body += [f"__buffer += __self.{k}.bytes"]
+            else:
+                writer: str = gen.symbol(writers[k], f"write_{k}")
+                body += [f"{writer}(__buffer, __self.{k})"]
+        return gen.build("write", "__buffer, __self", body or ["pass"])
+
+    def __compile_reader(
+        self, restore: Callable[[tuple[Any, ...]], Any]
+    ) -> Reader:
+        gen: _Codegen = _Codegen(self.cls)
+        readers: dict[str, Reader] = {k: r for k, _, r in self.fields}
+        index: dict[str, int] = {k: i for i, k in enumerate(readers)}
+        length: str = gen.symbol(_LENGTH.unpack_from, "length")
+        size: int = _LENGTH.size
+        body: list[str] = []
+        for group in self.__groups():
+            k: str = group[0]
+            t: Any = self.field_types[k]
+            v: str = f"__v{index[k]}"
+            if _is_primitive(t):
+                packer: Struct = self.__packer(group)
+                unpack: str = gen.symbol(packer.unpack_from, "unpack")
+                values: str = "".join([f"__v{index[x]}, " for x in group])
+                body += [
+                    f"{values}= {unpack}(__view, __o)",
+                    f"__o += {packer.size}",
+                ]
+            elif t is str:
+                body += [
+                    f"__n = {length}(__view, __o)[0] + __o + {size}",
+                    f"{v} = str(__view[__o + {size}:__n], 'utf-8')",
+                    "__o = __n",
+                ]
+            elif t is UUID:
+                body += [f"{v} = bytes(__view[__o:__o + 16])", "__o += 16"]
+            else:
+                reader: str = gen.symbol(readers[k], f"read_{k}")
+                body += [f"{v}, __o = {reader}(__view, __o)"]
+        values = "".join([f"__v{i}, " for i in range(len(index))])
+        body += [f"return {gen.symbol(restore, 'restore')}(({values})), __o"]
+        return gen.build("read", "__view, __o", body)
+
+
+def _is_primitive(__type: Any) -> bool:
+    return type(__type) is type and __type in _PRIMITIVES
+
+
+def _schema(__type: Any, seen: set[type]) -> str:
+    if isinstance(__type, GenericAlias):
+        args: str = ",".join(
+            [
+                "..." if x is Ellipsis else _schema(x, seen)
+                for x in get_args(__type)
+            ]
+        )
+        return f"{__type.__origin__.__name__}[{args}]"
+    if isinstance(__type, type) and issubclass(__type, Classy):
+        if __type in seen:
+            return __type.__qualname__
+        seen = seen | {__type}
+        fields: str = ",".join(
+            [
+                f"{k}:{_schema(t, seen)}"
+                for k, t in _get_plan(__type).field_types.items()
+            ]
+        )
+        return f"{__type.__qualname__}({fields})"
+    return getattr(__type, "__qualname__", repr(__type))
+
+
+def _codec(__type: Any) -> tuple[Writer, Reader]:
+    if isinstance(__type, GenericAlias):
+        return _generic_codec(__type)
+    if _is_primitive(__type):
+        return _struct_codec(Struct("<" + _PRIMITIVES[__type]))
+    if __type is str:
+        return _write_str, _read_str
+    if __type is bytes:
+        return _write_bytes, _read_bytes
+    if __type is UUID:
+        return _write_uuid, _read_uuid
+    if __type is datetime:
+        return _write_datetime, _read_datetime
+    if __type is date:
+        return _write_date, _read_date
+    if __type is time:
+        return _write_time, _read_time
+    if isinstance(__type, type) and issubclass(__type, Classy):
+        return _classy_codec(__type)
+    raise TypeError(
+        f"Unsupported type '{__type!r}' detected in binary serialization."
+    )
+
+
+def _generic_codec(__type: GenericAlias) -> tuple[Writer, Reader]:
+    collection_type: type = __type.__origin__
+    item_types: tuple[Any, ...] = get_args(__type)
+    if collection_type is list and len(item_types) == 1:
+        return _sequence_codec(item_types[0], list)
+    if collection_type is tuple and len(item_types) == 2:
+        if item_types[1] is Ellipsis:
+            return _sequence_codec(item_types[0], tuple)
+    if collection_type is tuple:
+        return _tuple_codec(item_types)
+    if collection_type is dict and len(item_types) == 2:
+        return _dict_codec(item_types[0], item_types[1])
+    raise TypeError(
+        f"Unsupported generic type '{__type!r}' detected in binary serialization."
+    )
+
+
+def _struct_codec(packer: Struct) -> tuple[Writer, Reader]:
+    size: int = packer.size
+
+    def write(buffer: bytearray, __value: Any) -> None:
+        buffer += packer.pack(__value)
+
+    def read(view: memoryview, offset: int) -> tuple[Any, int]:
+        return packer.unpack_from(view, offset)[0], offset + size
+
+    return write, read
+
+
+def _write_bytes(buffer: bytearray, __value: bytes) -> None:
+    buffer += _LENGTH.pack(len(__value))
+    buffer += __value
+
+
+def _read_bytes(view: memoryview, offset: int) -> tuple[bytes, int]:
+    size: int = _LENGTH.unpack_from(view, offset)[0]
+    offset += _LENGTH.size
+    return bytes(view[offset : offset + size]), offset + size
+
+
+def _write_str(buffer: bytearray, __value: str) -> None:
+    _write_bytes(buffer, __value.encode())
+
+
+def _read_str(view: memoryview, offset: int) -> tuple[str, int]:
+    size: int = _LENGTH.unpack_from(view, offset)[0]
+    offset += _LENGTH.size
+    return str(view[offset : offset + size], "utf-8"), offset + size
+
+
+def _write_uuid(buffer: bytearray, __value: UUID) -> None:
+    buffer += __value.bytes
+
+
+def _read_uuid(view: memoryview, offset: int) -> tuple[UUID, int]:
+    return _uuid_from_bytes(bytes(view[offset : offset + 16])), offset + 16
+
+
+def _write_datetime(buffer: bytearray, __value: datetime) -> None:
+    offset: timedelta | None = __value.utcoffset()
+    if offset is None:
+        buffer += _DATETIME.pack(False, (__value - _EPOCH) // _MICROSECOND)
+        return
+    buffer += _DATETIME.pack(True, (__value - _EPOCH_UTC) // _MICROSECOND)
+    buffer += _OFFSET.pack(offset // timedelta(seconds=1))
+
+
+def _read_datetime(view: memoryview, offset: int) -> tuple[datetime, int]:
+    aware, micros = _DATETIME.unpack_from(view, offset)
+    offset += _DATETIME.size
+    if not aware:
+        return _EPOCH + timedelta(microseconds=micros), offset
+    seconds: int = _OFFSET.unpack_from(view, offset)[0]
+    zone: timezone = timezone(timedelta(seconds=seconds))
+    value: datetime = _EPOCH_UTC + timedelta(microseconds=micros)
+    return value.astimezone(zone), offset + _OFFSET.size
+
+
+def _write_date(buffer: bytearray, __value: date) -> None:
+    buffer += _DATE.pack(__value.toordinal())
+
+
+def _read_date(view: memoryview, offset: int) -> tuple[date, int]:
+    return (
+        date.fromordinal(_DATE.unpack_from(view, offset)[0]),
+        offset + _DATE.size,
+    )
+
+
+def _write_time(buffer: bytearray, __value: time) -> None:
+    micros: int = (
+        (__value.hour * 60 + __value.minute) * 60 + __value.second
+    ) * 1000000 + __value.microsecond
+    offset: timedelta | None = __value.utcoffset()
+    buffer += _TIME.pack(offset is not None, micros)
+    if offset is not None:
+        buffer += _OFFSET.pack(offset // timedelta(seconds=1))
+
+
+def _read_time(view: memoryview, offset: int) -> tuple[time, int]:
+    aware, micros = _TIME.unpack_from(view, offset)
+    offset += _TIME.size
+    seconds, microsecond = divmod(micros, 1000000)
+    minutes, second = divmod(seconds, 60)
+    hour, minute = divmod(minutes, 60)
+    zone: timezone | None = None
+    if aware:
+        zone = timezone(
+            timedelta(seconds=_OFFSET.unpack_from(view, offset)[0])
+        )
+        offset += _OFFSET.size
+    return time(hour, minute, second, microsecond, tzinfo=zone), offset
+
+
+def _sequence_codec(
+    item_type: Any, collection_type: type
+) -> tuple[Writer, Reader]:
+    if _is_primitive(item_type):
+        code: str = _PRIMITIVES[item_type]
+        size: int = Struct(code).size
+
+        def write_primitives(buffer: bytearray, __value: Any) -> None:
+            buffer += _LENGTH.pack(len(__value))
+            buffer += pack(f"<{len(__value)}{code}", *__value)
+
+        def read_primitives(view: memoryview, offset: int) -> tuple[Any, int]:
+            count: int = _LENGTH.unpack_from(view, offset)[0]
+            offset += _LENGTH.size
+            values: tuple[Any, ...] = unpack_from(
+                f"<{count}{code}", view, offset
+            )
+            return collection_type(values), offset + count * size
+
+        return write_primitives, read_primitives
+    write_item, read_item = _codec(item_type)
+
+    def write(buffer: bytearray, __value: Any) -> None:
+        buffer += _LENGTH.pack(len(__value))
+        for x in __value:
+            write_item(buffer, x)
+
+    def read(view: memoryview, offset: int) -> tuple[Any, int]:
+        count: int = _LENGTH.unpack_from(view, offset)[0]
+        offset += _LENGTH.size
+        values: list[Any] = []
+        for _ in range(count):
+            value, offset = read_item(view, offset)
+            values.append(value)
+        return collection_type(values), offset
+
+    def read_strings(view: memoryview, offset: int) -> tuple[Any, int]:
+        count: int = _LENGTH.unpack_from(view, offset)[0]
+        offset += _LENGTH.size
+        values: list[str] = []
+        for _ in range(count):
+            end: int = _LENGTH.unpack_from(view, offset)[0] + offset + 4
+            values.append(str(view[offset + 4 : end], "utf-8"))
+            offset = end
+        return collection_type(values), offset
+
+    return write, read_strings if item_type is str else read
+
+
+def _tuple_codec(item_types: tuple[Any, ...]) -> tuple[Writer, Reader]:
+    codecs: list[tuple[Writer, Reader]] = [_codec(t) for t in item_types]
+
+    def write(buffer: bytearray, __value: Any) -> None:
+        if len(__value) != len(codecs):
+            raise TypeError(
+                "Invalid generic item type args for 'tuple'. number of item args mismatched."
+            )
+        for (write_item, _), x in zip(codecs, __value):
+            write_item(buffer, x)
+
+    def read(view: memoryview, offset: int) -> tuple[Any, int]:
+        values: list[Any] = []
+        for _, read_item in codecs:
+            value, offset = read_item(view, offset)
+            values.append(value)
+        return tuple(values), offset
+
+    return write, read
+
+
+def _dict_codec(key_type: Any, value_type: Any) -> tuple[Writer, Reader]:
+    write_key, read_key = _codec(key_type)
+    write_value, read_value = _codec(value_type)
+
+    def write(buffer: bytearray, __value: Any) -> None:
+        buffer += _LENGTH.pack(len(__value))
+        for k, v in __value.items():
+            write_key(buffer, k)
+            write_value(buffer, v)
+
+    def read(view: memoryview, offset: int) -> tuple[Any, int]:
+        count: int = _LENGTH.unpack_from(view, offset)[0]
+        offset += _LENGTH.size
+        values: dict[Any, Any] = {}
+        for _ in range(count):
+            key, offset = read_key(view, offset)
+            values[key], offset = read_value(view, offset)
+        return values, offset
+
+    return write, read
+
+
+def _classy_codec(cls: Type[Classy]) -> tuple[Writer, Reader]:
+    def write(buffer: bytearray, __value: Any) -> None:
+        start: int = len(buffer)
+        buffer += _LENGTH.pack(0)
+        _get_plan(cls).binary.write(buffer, __value)
+        _LENGTH.pack_into(buffer, start, len(buffer) - start - _LENGTH.size)
+
+    def read(view: memoryview, offset: int) -> tuple[Any, int]:
+        try:
+            size: int = _LENGTH.unpack_from(view, offset)[0]
+            offset += _LENGTH.size
+            value, end = _get_plan(cls).binary.read(view, offset)
+        except StructError as error:
+            raise ValueError(
+                f"{_TRUNCATED} for nested '{cls.__name__}'."
+            ) from error
+        if end != offset + size or end > len(view):
+            raise ValueError(
+                f"Corrupted binary payload for nested '{cls.__name__}'."
+            )
+        return value, end
+
+    return write, read
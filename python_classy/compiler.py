@@ -0,0 +1,254 @@
+from dataclasses import fields
+from enum import Enum
+from hashlib import blake2b
+from importlib import import_module
+from importlib.util import find_spec
+from pathlib import Path
+from types import (
+    BuiltinFunctionType,
+    FunctionType,
+    MemberDescriptorType,
+    ModuleType,
+)
+from typing import Any, Literal, Union, get_args, get_origin
+from . import Classy, _ClassyPlan, _INTERNAL, _resolve_codec
+
+_FORMAT: int = 1
+_SUFFIX: str = "_classy"
+_PARTS: tuple[str, ...] = ("from_dict", "encode", "default_factory")
+_LITERALS: tuple[type, ...] = (type(None), bool, int, float, str, bytes)
+_tables: dict[str, dict[str, Any] | None] = {}
+
+
+def fingerprint(plan: _ClassyPlan) -> str:
+    cls: type = plan.cls
+    scopes: list[dict[type, Any]] = plan.document_scopes
+    schema: list[Any] = [
+        _FORMAT,
+        getattr(cls, "__dataclass_params__").frozen,
+        "__slots__" in cls.__dict__,
+        hasattr(cls, "__post_init__"),
+        plan.interner is not None,
+        [(f.name, f.init, _INTERNAL in f.metadata) for f in fields(cls)],
+        [
+            (k, _describe(t, scopes, False))
+            for k, t in plan.field_types.items()
+        ],
+    ]
+    return blake2b(repr(schema).encode(), digest_size=8).hexdigest()
+
+
+def load_precompiled(plan: _ClassyPlan) -> dict[str, Any]:
+    cls: type = plan.cls
+    if cls.__module__ not in _tables:
+        _tables[cls.__module__] = _import_table(cls.__module__)
+    table: dict[str, Any] | None = _tables[cls.__module__]
+    entry: tuple[str, dict[str, Any]] | None = (
+        None if table is None else table.get(cls.__qualname__)
+    )
+    if entry is None or entry[0] != fingerprint(plan):
+        return {}
+    return {k: v(_ref) if callable(v) else v for k, v in entry[1].items()}
+
+
+def compile_module(name: str) -> tuple[str, list[str]]:
+    module: ModuleType = import_module(name)
+    writer: _ModuleWriter = _ModuleWriter()
+    entries: list[str] = []
+    skipped: list[str] = []
+    for cls in _classy_types(module):
+        plan: _ClassyPlan = _ClassyPlan(cls)
+        plan.__dict__["precompiled"] = {}
+        parts: list[str] = []
+        for part in _PARTS:
+            builder: str | None = writer.function(getattr(plan, part), plan)
+            if builder is None:
+                skipped.append(f"{cls.__qualname__}.{part}")
+            else:
+                parts.append(f"            {part!r}: {builder},")
+        parts.append(f"            'shared_default': {plan.shared_default!r},")
+        entries += [
+            f"    {cls.__qualname__!r}: (",
+            f"        {fingerprint(plan)!r},",
+            "        {",
+            *parts,
+            "        },",
+            "    ),",
+        ]
+    source: str = "\n".join(
+        [
+            f"# Generated by `python -m python_classy compile {name}`.",
+            "# Do not edit. Classes changed since then are compiled at runtime.",
+            *writer.builders,
+            "",
+            "",
+            "__classy_precompiled__ = {",
+            *entries,
+            "}",
+            "",
+        ]
+    )
+    return source, skipped
+
+
+def write_precompiled(name: str) -> tuple[Path, list[str]]:
+    source, skipped = compile_module(name)
+    path: Path = _precompiled_path(import_module(name))
+    path.write_text(source, encoding="utf-8")
+    _tables.pop(name, None)
+    return path, skipped
+
+
+class _ModuleWriter:
+    def __init__(self) -> None:
+        self.builders: list[str] = []
+        self.__built: dict[int, tuple[Any, str]] = {}
+
+    def function(self, function: Any, plan: _ClassyPlan) -> str | None:
+        if id(function) in self.__built:
+            return self.__built[id(function)][1]
+        source: str | None = getattr(function, "__classy_source__", None)
+        if source is None:
+            return None
+        namespace: dict[str, Any] = function.__globals__
+        body: list[str] = []
+        for k, v in namespace.items():
+            defined: bool = getattr(v, "__globals__", None) is namespace
+            if k == "__builtins__" or defined:
+                continue
+            expr: str | None = self.reference(v, plan)
+            if expr is None:
+                return None
+            body.append(f"{k} = {expr}")
+        body += [*source.splitlines(), f"return {function.__name__}"]
+        name: str = f"_build_{len(self.builders)}"
+        self.builders.append(
+            "\n".join(
+                [
+                    "",
+                    "",
+                    f"def {name}(_ref):",
+                    *[f"    {x}" if x else "" for x in body],
+                ]
+            )
+        )
+        self.__built[id(function)] = (function, name)
+        return name
+
+    def reference(self, obj: Any, plan: _ClassyPlan) -> str | None:
+        if type(obj) in _LITERALS:
+            return repr(obj)
+        if obj is type(None):
+            return "type(None)"
+        if type(obj) is tuple:
+            items: list[str | None] = [self.reference(x, plan) for x in obj]
+            if None in items:
+                return None
+            return f"({''.join([f'{x}, ' for x in items])})"
+        if type(obj) is dict:
+            pairs: list[tuple[str | None, str | None]] = [
+                (self.reference(k, plan), self.reference(v, plan))
+                for k, v in obj.items()
+            ]
+            if any(k is None or v is None for k, v in pairs):
+                return None
+            return f"{{{', '.join([f'{k}: {v}' for k, v in pairs])}}}"
+        if isinstance(obj, Enum):
+            owner: str | None = self.reference(type(obj), plan)
+            return None if owner is None else f"{owner}[{obj.name!r}]"
+        if hasattr(obj, "__classy_source__"):
+            builder: str | None = self.function(obj, plan)
+            return None if builder is None else f"{builder}(_ref)"
+        if obj is plan.interner and obj is not None:
+            owner = self.reference(plan.cls, plan)
+            return None if owner is None else f"{owner}.__classy_interner__"
+        module: Any = getattr(obj, "__module__", None)
+        qualname: Any = getattr(obj, "__qualname__", None)
+        if isinstance(obj, (type, FunctionType, BuiltinFunctionType)):
+            if isinstance(module, str) and isinstance(qualname, str):
+                try:
+                    if _ref(module, qualname) is obj:
+                        return f"_ref({module!r}, {qualname!r})"
+                except (ImportError, AttributeError):
+                    pass
+        name: Any = getattr(obj, "__name__", None)
+        if isinstance(obj, MemberDescriptorType):
+            owner = self.reference(obj.__objclass__, plan)
+            return None if owner is None else f"{owner}.__dict__[{name!r}]"
+        bound: Any = getattr(obj, "__self__", None)
+        if bound is None or isinstance(bound, ModuleType):
+            bound = getattr(obj, "__objclass__", None)
+        if bound is not None and isinstance(name, str):
+            owner = self.reference(bound, plan)
+            if owner is not None and getattr(bound, name, None) == obj:
+                return f"{owner}.{name}"
+        return None
+
+
+def _ref(module: str, qualname: str) -> Any:
+    value: Any = import_module(module)
+    for name in qualname.split("."):
+        value = getattr(value, name)
+    return value
+
+
+def _describe(__type: Any, scopes: list[dict[type, Any]], union: bool) -> Any:
+    origin: Any = get_origin(__type)
+    if origin is Literal:
+        return repr(__type)
+    args: tuple[Any, ...] = get_args(__type)
+    if args:
+        return (
+            repr(origin),
+            [_describe(x, scopes, origin is Union) for x in args],
+        )
+    if not isinstance(__type, type):
+        return repr(__type)
+    if issubclass(__type, Classy):
+        if not union:
+            return _name(__type)
+        cls: type = __type
+        return (
+            _name(__type),
+            __type.__classy_tag__,
+            [(f.name, repr(f.type)) for f in fields(cls)],
+        )
+    codec: Any = _resolve_codec(scopes, __type)
+    return (_name(__type), codec and [_name(x) for x in codec])
+
+
+def _name(obj: Any) -> str:
+    if obj is None:
+        return ""
+    return (
+        f"{getattr(obj, '__module__', '')}.{getattr(obj, '__qualname__', obj)}"
+    )
+
+
+def _classy_types(module: ModuleType) -> list[type]:
+    return [
+        x
+        for x in vars(module).values()
+        if isinstance(x, type)
+        and issubclass(x, Classy)
+        and x.__classy_decorated__ is x
+        and x.__module__ == module.__name__
+        and getattr(module, x.__qualname__, None) is x
+    ]
+
+
+def _precompiled_path(module: ModuleType) -> Path:
+    path: Path = Path(str(module.__file__))
+    if path.stem == "__init__":
+        return path.parent.with_name(f"{path.parent.name}{_SUFFIX}.py")
+    return path.with_name(f"{path.stem}{_SUFFIX}.py")
+
+
+def _import_table(name: str) -> dict[str, Any] | None:
+    try:
+        if find_spec(f"{name}{_SUFFIX}") is None:
+            return None
+        module: ModuleType = import_module(f"{name}{_SUFFIX}")
+    except (ImportError, ValueError):
+        return None
+    return getattr(module, "__classy_precompiled__", None)
@@ -0,0 +1,55 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable
+from weakref import WeakKeyDictionary, ref
+
+
+class WeakInterner:
+    def __init__(self) -> None:
+        self.__table: WeakKeyDictionary[Any, Callable[[], Any]] = (
+            WeakKeyDictionary()
+        )
+        self.__lock: Lock = Lock()
+
+    def __call__(self, __value: Any) -> Any:
+        with self.__lock:
+            canonical_ref: Callable[[], Any] | None = self.__table.get(__value)
+            canonical: Any = None if canonical_ref is None else canonical_ref()
+            if canonical is None:
+                self.__table[__value] = ref(__value)
+                return __value
+            return canonical
+
+    def __len__(self) -> int:
+        return len(self.__table)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__table.clear()
+
+
+class LruInterner:
+    def __init__(self, maxsize: int) -> None:
+        if maxsize <= 0:
+            raise ValueError("'intern_maxsize' must be a positive integer.")
+        self.maxsize: int = maxsize
+        self.__table: OrderedDict[Any, Any] = OrderedDict()
+        self.__lock: Lock = Lock()
+
+    def __call__(self, __value: Any) -> Any:
+        with self.__lock:
+            canonical: Any = self.__table.get(__value)
+            if canonical is None:
+                self.__table[__value] = __value
+                if len(self.__table) > self.maxsize:
+                    self.__table.popitem(last=False)
+                return __value
+            self.__table.move_to_end(canonical)
+            return canonical
+
+    def __len__(self) -> int:
+        return len(self.__table)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__table.clear()
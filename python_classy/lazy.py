@@ -0,0 +1,66 @@
+from typing import Any, Callable
+from . import Classy, _slot_descriptor
+
+
+class Thunk:
+    __slots__ = ("decode", "value")
+
+    def __init__(self, decode: Callable[[Any], Any], __value: Any) -> None:
+        self.decode: Callable[[Any], Any] = decode
+        self.value: Any = __value
+
+
+class LazyField:
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        values: dict[str, Any] = instance.__dict__
+        value: Any = values[self.name]
+        if type(value) is Thunk:
+            value = values[self.name] = value.decode(value.value)
+        return value
+
+    def __set__(self, instance: Any, __value: Any) -> None:
+        instance.__dict__[self.name] = __value
+
+
+class LazySlotField:
+    __slots__ = ("name", "member")
+
+    def __init__(self, name: str, member: Any) -> None:
+        self.name: str = name
+        self.member: Any = member
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        value: Any = self.member.__get__(instance, owner)
+        if type(value) is Thunk:
+            value = value.decode(value.value)
+            self.member.__set__(instance, value)
+        return value
+
+    def __set__(self, instance: Any, __value: Any) -> None:
+        self.member.__set__(instance, __value)
+
+
+def lazy_type(cls: type[Classy], names: list[str]) -> type[Classy]:
+    namespace: dict[str, Any] = {
+        "__slots__": (),
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "__classy_origin__": cls,
+    }
+    for k in names:
+        member: Any = _slot_descriptor(cls, k)
+        namespace[k] = (
+            LazyField(k) if member is None else LazySlotField(k, member)
+        )
+    lazy: type[Classy] = type(cls.__name__, (cls,), namespace)
+    setattr(lazy, "__classy_decorated__", lazy)
+    return lazy
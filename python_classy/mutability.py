@@ -1,7 +1,361 @@
-from typing import Type, TypeVar, dataclass_transform
-from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Literal,
+    Type,
+    TypeVar,
+    dataclass_transform,
+    overload,
+)
+from dataclasses import Field, dataclass, field, fields
+from functools import wraps
+from inspect import signature
+from os import environ
+from weakref import WeakSet
 
 _T = TypeVar("_T")
+_defaults: dict[str, Any] = {
+    "slots": False,
+    "validate": environ.get("CLASSY_VALIDATE", "").lower()
+    not in ("", "0", "false", "no", "off"),
+    "validation_sample": None,
+}
+_INTERNAL: str = "classy.internal"
+_following: WeakSet[type] = WeakSet()
+_validating: WeakSet[type] = WeakSet()
+
+
+def set_default_slots(enabled: bool) -> None:
+    _defaults["slots"] = enabled
+
+
+def set_validation(enabled: bool, sample_size: int | None = None) -> None:
+    if sample_size is not None and sample_size <= 0:
+        raise ValueError("'sample_size' must be a positive integer.")
+    _defaults["validate"] = enabled
+    _defaults["validation_sample"] = sample_size
+    for cls in list(_validating):
+        _invalidate_plan(cls)
+    for cls in list(_following):
+        if enabled:
+            _install_validation(cls)
+        else:
+            _remove_validation(cls)
+
+
+def _invalidate_plan(cls: type) -> None:
+    if "__classy_plan__" in cls.__dict__:
+        delattr(cls, "__classy_plan__")
+
+
+def _decorated(cls: Type[_T]) -> Type[_T]:
+    setattr(cls, "__classy_decorated__", cls)
+    return cls
+
+
+def _update_class_cells(old: type, new: type) -> None:
+    for member in new.__dict__.values():
+        if isinstance(member, (classmethod, staticmethod)):
+            member = member.__func__
+        if isinstance(member, property):
+            functions: list[Any] = [member.fget, member.fset, member.fdel]
+        else:
+            functions = [member]
+        for function in functions:
+            closure: Any = getattr(function, "__closure__", None)
+            names: tuple[str, ...] = getattr(
+                getattr(function, "__code__", None), "co_freevars", ()
+            )
+            for name, cell in zip(names, closure or ()):
+                if name == "__class__" and cell.cell_contents is old:
+                    cell.cell_contents = new
+
+
+def _add_internal_field(cls: type, name: str, __type: Any) -> None:
+    cls.__annotations__[name] = __type
+    setattr(
+        cls,
+        name,
+        field(
+            default=None,
+            init=False,
+            repr=False,
+            compare=False,
+            metadata={_INTERNAL: True},
+        ),
+    )
+
+
+def _cache_hash(cls: type) -> None:
+    compute_hash: Callable[[Any], int] = cls.compute_hash  # type: ignore
+    set_hash: Callable[[Any, str, Any], None] = object.__setattr__
+
+    def cached_compute_hash(self: Any) -> int:
+        value: int | None = self._classy_hash
+        if value is None:
+            value = compute_hash(self)
+            set_hash(self, "_classy_hash", value)
+        return value
+
+    setattr(cls, "compute_hash", cached_compute_hash)
+
+
+def _cache_json(cls: type) -> None:
+    encode: Callable[[Any], str] = getattr(cls, "json").fget
+    set_json: Callable[[Any, str, Any], None] = object.__setattr__
+
+    def json(self: Any) -> str:
+        value: str | None = self._classy_json
+        if value is None:
+            value = encode(self)
+            set_json(self, "_classy_json", value)
+        return value
+
+    setattr(cls, "json", property(json))
+
+
+def _check_frozen_fields(cls: type) -> None:
+    from . import _get_plan, _is_frozen_type
+
+    plan: Any = _get_plan(cls)
+    for k in plan.public_fields:
+        if not _is_frozen_type(plan.field_types[k], {cls}):
+            raise TypeError(
+                f"Field '{k}' of '{cls.__name__}' can be changed in place, so its encoding cannot be cached. Use tuples and @immutable models instead of lists, dicts and @mutable models."
+            )
+    _invalidate_plan(cls)
+
+
+def _equality_fields(
+    cls: type, identity: tuple[str, ...] | None, value_equality: bool
+) -> tuple[str, ...] | None:
+    if identity is None and not value_equality:
+        return None
+    if identity is not None and value_equality:
+        raise TypeError(
+            "'identity' and 'value_equality' cannot be used together."
+        )
+    for name in ["equals", "compute_hash"]:
+        if name in cls.__dict__:
+            raise TypeError(
+                f"'{cls.__name__}' already implements {name}(). Remove it or drop the generated equality option."
+            )
+    candidates: list[Field[Any]] = [
+        f for f in fields(cls) if not f.metadata.get(_INTERNAL)
+    ]
+    if identity is None:
+        return tuple([f.name for f in candidates if f.compare])
+    names: set[str] = {f.name for f in candidates}
+    for name in identity:
+        if name not in names:
+            raise TypeError(
+                f"Identity field '{name}' is not a field of '{cls.__name__}'."
+            )
+    return tuple(identity)
+
+
+def _generate_equality(
+    cls: type, names: tuple[str, ...], hashable: bool
+) -> None:
+    from . import _Codegen
+
+    gen: Any = _Codegen(cls)
+    origin: str = gen.symbol(_origin)
+    comparison: str = " and ".join([f"__self.{k} == __o.{k}" for k in names])
+    setattr(
+        cls,
+        "equals",
+        gen.build(
+            "equals",
+            "__self, __o",
+            [
+                "if __o is __self:",
+                "    return True",
+                "if type(__o) is not type(__self) and "
+                f"{origin}(type(__o)) is not {origin}(type(__self)):",
+                "    return False",
+                f"return {comparison or 'True'}",
+            ],
+        ),
+    )
+    if not hashable:
+        return
+    if len(names) == 1:
+        value: str = f"__self.{names[0]}"
+    else:
+        value = f"({''.join([f'__self.{k}, ' for k in names])})"
+    setattr(
+        cls,
+        "compute_hash",
+        gen.build("compute_hash", "__self", [f"return hash({value})"]),
+    )
+
+
+def _origin(cls: type) -> type:
+    return cls.__dict__.get("__classy_origin__", cls)
+
+
+def _intern(cls: type, maxsize: int | None) -> None:
+    from . import Classy
+    from .interning import LruInterner, WeakInterner
+
+    if (
+        getattr(cls, "compute_hash") is Classy.compute_hash
+        or getattr(cls, "equals") is Classy.equals
+    ):
+        raise TypeError(
+            f"'{cls.__name__}' has to implement equals() and compute_hash() to be interned."
+        )
+    interner: Any = WeakInterner() if maxsize is None else LruInterner(maxsize)
+    setattr(cls, "__classy_interner__", interner)
+
+
+def _track_changes(cls: type) -> None:
+    tracked: frozenset[str] = frozenset(
+        [
+            f.name
+            for f in fields(cls)
+            if not f.metadata.get(_INTERNAL) and not f.name.startswith("_")
+        ]
+    )
+    init: Callable[..., None] = cls.__init__  # type: ignore
+    set_value: Callable[[Any, str, Any], None] = object.__setattr__
+
+    def __init__(self: Any, *args: Any, **kwargs: Any) -> None:
+        set_value(self, "_classy_dirty", None)
+        init(self, *args, **kwargs)
+        set_value(self, "_classy_dirty", None)
+
+    def __setattr__(self: Any, name: str, __value: Any) -> None:
+        set_value(self, name, __value)
+        if name in tracked:
+            dirty: set[str] | None = self._classy_dirty
+            if dirty is None:
+                set_value(self, "_classy_dirty", {name})
+            else:
+                dirty.add(name)
+
+    __init__ = wraps(init)(__init__)
+    setattr(__init__, "__signature__", signature(init))
+    setattr(cls, "__init__", __init__)
+    setattr(cls, "__setattr__", __setattr__)
+
+
+def _install_validation(cls: type) -> None:
+    from . import _get_plan
+
+    if cls in _validating:
+        return
+    init: Callable[..., None] = cls.__init__  # type: ignore
+
+    def __init__(self: Any, *args: Any, **kwargs: Any) -> None:
+        _get_plan(type(self)).validate(kwargs)
+        init(self, *args, **kwargs)
+
+    __init__ = wraps(init)(__init__)
+    setattr(__init__, "__signature__", signature(init))
+    setattr(cls, "__init__", __init__)
+    _validating.add(cls)
+    _invalidate_plan(cls)
+
+
+def _remove_validation(cls: type) -> None:
+    if cls not in _validating:
+        return
+    setattr(cls, "__init__", getattr(cls, "__init__").__wrapped__)
+    _validating.discard(cls)
+    _invalidate_plan(cls)
+
+
+def _set_tag(cls: type, tag: str) -> None:
+    if tag not in {f.name for f in fields(cls)}:
+        raise TypeError(f"'{cls.__name__}' has no tag field '{tag}'.")
+    setattr(cls, "__classy_tag__", tag)
+
+
+def _decorate(
+    cls: Type[_T],
+    mutability: str,
+    frozen: bool,
+    slots: bool | None,
+    cache_hash: bool = False,
+    identity: tuple[str, ...] | None = None,
+    value_equality: bool = False,
+    interned: bool = False,
+    intern_maxsize: int | None = None,
+    track_changes: bool = False,
+    tag: str | None = None,
+    cache_encoding: bool | Literal["dict", "json"] = False,
+    validate: bool | None = None,
+) -> Type[_T]:
+    _invalidate_plan(cls)
+    setattr(cls, f"_{cls.__name__}__{mutability}_object", True)
+    if slots is None:
+        slots = _defaults["slots"]
+    if cache_hash:
+        _add_internal_field(cls, "_classy_hash", int | None)
+    inherited: dict[str, Any] = getattr(cls, "__dataclass_fields__", {})
+    track_changes = track_changes or "_classy_dirty" in inherited
+    if track_changes and "_classy_dirty" not in inherited:
+        _add_internal_field(cls, "_classy_dirty", set[str] | None)
+    if cache_encoding not in (False, True, "dict", "json"):
+        raise ValueError(
+            f"cache_encoding has to be a bool, 'dict' or 'json', not {cache_encoding!r}."
+        )
+    if cache_encoding in (True, "dict"):
+        _add_internal_field(cls, "_classy_dict", dict[str, Any] | None)
+    if cache_encoding in (True, "json"):
+        _add_internal_field(cls, "_classy_json", str | None)
+    interned = interned or intern_maxsize is not None
+    decorated: Type[_T] = dataclass(
+        eq=False,
+        kw_only=True,
+        frozen=frozen,
+        slots=slots,
+        weakref_slot=slots and interned,
+    )(cls)
+    if decorated is not cls:
+        _update_class_cells(cls, decorated)
+    names: tuple[str, ...] | None = _equality_fields(
+        decorated, identity, value_equality
+    )
+    if names is not None:
+        _generate_equality(
+            decorated, names, hashable=frozen or identity is not None
+        )
+    if cache_hash:
+        _cache_hash(decorated)
+    if interned:
+        _intern(decorated, intern_maxsize)
+    if track_changes:
+        _track_changes(decorated)
+    if tag is not None:
+        _set_tag(decorated, tag)
+    if cache_encoding:
+        _check_frozen_fields(decorated)
+    if cache_encoding in (True, "json"):
+        _cache_json(decorated)
+    if validate is None:
+        _following.add(decorated)
+    if _defaults["validate"] if validate is None else validate:
+        _install_validation(decorated)
+    return _decorated(decorated)
+
+
+@overload
+def mutable(cls: Type[_T], /) -> Type[_T]: ...
+
+
+@overload
+def mutable(
+    *,
+    slots: bool | None = None,
+    identity: tuple[str, ...] | None = None,
+    value_equality: bool = False,
+    track_changes: bool = False,
+    tag: str | None = None,
+    validate: bool | None = None,
+) -> Callable[[Type[_T]], Type[_T]]: ...
 
 
 @dataclass_transform(
@@ -9,9 +363,50 @@ _T = TypeVar("_T")
     kw_only_default=True,
     frozen_default=False,
 )
-def mutable(cls: Type[_T]) -> Type[_T]:
-    setattr(cls, f"_{cls.__name__}__mutable_object", True)
-    return dataclass(eq=False, kw_only=True, frozen=False)(cls)
+def mutable(
+    cls: Type[_T] | None = None,
+    /,
+    *,
+    slots: bool | None = None,
+    identity: tuple[str, ...] | None = None,
+    value_equality: bool = False,
+    track_changes: bool = False,
+    tag: str | None = None,
+    validate: bool | None = None,
+) -> Type[_T] | Callable[[Type[_T]], Type[_T]]:
+    def wrap(cls: Type[_T]) -> Type[_T]:
+        return _decorate(
+            cls,
+            "mutable",
+            frozen=False,
+            slots=slots,
+            identity=identity,
+            value_equality=value_equality,
+            track_changes=track_changes,
+            tag=tag,
+            validate=validate,
+        )
+
+    return wrap if cls is None else wrap(cls)
+
+
+@overload
+def immutable(cls: Type[_T], /) -> Type[_T]: ...
+
+
+@overload
+def immutable(
+    *,
+    slots: bool | None = None,
+    cache_hash: bool = False,
+    identity: tuple[str, ...] | None = None,
+    value_equality: bool = False,
+    interned: bool = False,
+    intern_maxsize: int | None = None,
+    tag: str | None = None,
+    cache_encoding: bool | Literal["dict", "json"] = False,
+    validate: bool | None = None,
+) -> Callable[[Type[_T]], Type[_T]]: ...
 
 
 @dataclass_transform(
@@ -19,6 +414,34 @@ def mutable(cls: Type[_T]) -> Type[_T]:
     kw_only_default=True,
     frozen_default=True,
 )
-def immutable(cls: Type[_T]) -> Type[_T]:
-    setattr(cls, f"_{cls.__name__}__immutable_object", True)
-    return dataclass(eq=False, kw_only=True, frozen=True)(cls)
+def immutable(
+    cls: Type[_T] | None = None,
+    /,
+    *,
+    slots: bool | None = None,
+    cache_hash: bool = False,
+    identity: tuple[str, ...] | None = None,
+    value_equality: bool = False,
+    interned: bool = False,
+    intern_maxsize: int | None = None,
+    tag: str | None = None,
+    cache_encoding: bool | Literal["dict", "json"] = False,
+    validate: bool | None = None,
+) -> Type[_T] | Callable[[Type[_T]], Type[_T]]:
+    def wrap(cls: Type[_T]) -> Type[_T]:
+        return _decorate(
+            cls,
+            "immutable",
+            frozen=True,
+            slots=slots,
+            cache_hash=cache_hash,
+            identity=identity,
+            value_equality=value_equality,
+            interned=interned,
+            intern_maxsize=intern_maxsize,
+            tag=tag,
+            cache_encoding=cache_encoding,
+            validate=validate,
+        )
+
+    return wrap if cls is None else wrap(cls)
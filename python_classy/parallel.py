@@ -0,0 +1,46 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import chain
+from os import cpu_count
+from typing import Any, Callable, Sequence, Type, TypeVar
+from . import Classy
+
+_T = TypeVar("_T", bound=Classy)
+_MIN_CHUNK_SIZE: int = 2048
+
+
+def decode_dicts(cls: Type[_T], chunk: Sequence[dict[str, Any]]) -> list[_T]:
+    return cls.from_dicts(chunk)
+
+
+def decode_json(cls: Type[_T], chunk: Sequence[str]) -> list[_T]:
+    return cls.from_dicts([cls.deserialize(x) for x in chunk])
+
+
+def decode_many(
+    cls: Type[_T],
+    decode: Callable[[Type[_T], Sequence[Any]], list[_T]],
+    payloads: Sequence[Any],
+    workers: int | None,
+    chunk_size: int | None,
+    executor: Executor | None,
+) -> list[_T]:
+    if workers is None:
+        workers = cpu_count() or 1
+    if workers <= 1 and executor is None:
+        return decode(cls, payloads)
+    if chunk_size is None:
+        chunk_size = max(
+            _MIN_CHUNK_SIZE, -(-len(payloads) // (max(workers, 1) * 4))
+        )
+    chunks: list[Sequence[Any]] = [
+        payloads[i : i + chunk_size]
+        for i in range(0, len(payloads), chunk_size)
+    ]
+    if len(chunks) <= 1 and executor is None:
+        return decode(cls, payloads)
+    if executor is not None:
+        results: Any = executor.map(decode, [cls] * len(chunks), chunks)
+        return list(chain.from_iterable(results))
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        results = pool.map(decode, [cls] * len(chunks), chunks)
+        return list(chain.from_iterable(results))
@@ -0,0 +1,173 @@
+import mmap
+import os
+from struct import Struct
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    Iterable,
+    Iterator,
+    Type,
+    TypeVar,
+)
+from . import Classy, _get_plan
+from .binary import BinaryCodec, Reader
+
+_T = TypeVar("_T", bound=Classy)
+
+_MAGIC: bytes = b"CLSYREC1"
+_HEADER: Struct = Struct("<8s8sQQ")
+_OFFSET: Struct = Struct("<Q")
+_FIELD_OFFSET: Struct = Struct("<I")
+
+
+class RecordField:
+    __slots__ = ("name", "offset", "read")
+
+    def __init__(self, name: str, index: int, read: Reader) -> None:
+        self.name: str = name
+        self.offset: int = index * _FIELD_OFFSET.size
+        self.read: Reader = read
+
+    def __get__(self, view: Any, owner: type | None = None) -> Any:
+        if view is None:
+            return self
+        data: memoryview = view._records.view
+        start: int = view._offset
+        field_offset: int = _FIELD_OFFSET.unpack_from(
+            data, start + self.offset
+        )[0]
+        return self.read(data, start + field_offset)[0]
+
+    def __set__(self, view: Any, __value: Any) -> None:
+        raise AttributeError(f"cannot assign to field '{self.name}'")
+
+
+class RecordView(Generic[_T]):
+    __slots__ = ("_records", "_offset")
+
+    def __init__(self, records: "RecordFile[_T]", offset: int) -> None:
+        self._records: RecordFile[_T] = records
+        self._offset: int = offset
+
+    def materialize(self) -> _T:
+        records: RecordFile[_T] = self._records
+        start: int = self._offset + records.table_size
+        return records.codec.read(records.view, start)[0]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(offset={self._offset})"
+
+    if TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any: ...
+
+
+class RecordFile(Generic[_T]):
+    def __init__(self, cls: Type[_T], path: str | os.PathLike[str]) -> None:
+        _check_immutable(cls)
+        self.cls: Type[_T] = cls
+        self.codec: BinaryCodec = _get_plan(cls).binary
+        self.table_size: int = len(self.codec.fields) * _FIELD_OFFSET.size
+        self.view_type: Type[RecordView[_T]] = _get_plan(cls).record_view
+        with open(path, "rb") as fp:
+            self.__mmap: mmap.mmap = mmap.mmap(
+                fp.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        self.view: memoryview = memoryview(self.__mmap)
+        try:
+            magic, fingerprint, count, index = _HEADER.unpack_from(self.view)
+            if magic != _MAGIC:
+                raise ValueError(f"'{path}' is not a Classy record file.")
+            if fingerprint != self.codec.fingerprint:
+                raise ValueError(
+                    f"Record file does not match the schema of '{cls.__name__}'."
+                )
+        except Exception:
+            self.close()
+            raise
+        self.__count: int = count
+        self.__index: int = index
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def __getitem__(self, index: int) -> RecordView[_T]:
+        if index < 0:
+            index += self.__count
+        if not 0 <= index < self.__count:
+            raise IndexError("record index out of range")
+        offset: int = _OFFSET.unpack_from(
+            self.view, self.__index + index * _OFFSET.size
+        )[0]
+        return self.view_type(self, offset)
+
+    def __iter__(self) -> Iterator[RecordView[_T]]:
+        view_type: Type[RecordView[_T]] = self.view_type
+        unpack: Any = _OFFSET.unpack_from
+        for i in range(
+            self.__index,
+            self.__index + self.__count * _OFFSET.size,
+            _OFFSET.size,
+        ):
+            yield view_type(self, unpack(self.view, i)[0])
+
+    def close(self) -> None:
+        self.view.release()
+        self.__mmap.close()
+
+    def __enter__(self) -> "RecordFile[_T]":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def write_records(
+    cls: Type[_T], objects: Iterable[_T], path: str | os.PathLike[str]
+) -> int:
+    _check_immutable(cls)
+    codec: BinaryCodec = _get_plan(cls).binary
+    field_count: int = len(codec.fields)
+    offsets: bytearray = bytearray()
+    position: int = _HEADER.size
+    with open(path, "wb") as fp:
+        fp.write(bytes(_HEADER.size))
+        for x in objects:
+            buffer: bytearray = bytearray(field_count * _FIELD_OFFSET.size)
+            for i, (k, write, _) in enumerate(codec.fields):
+                _FIELD_OFFSET.pack_into(
+                    buffer, i * _FIELD_OFFSET.size, len(buffer)
+                )
+                write(buffer, getattr(x, k))
+            offsets += _OFFSET.pack(position)
+            position += len(buffer)
+            fp.write(buffer)
+        fp.write(offsets)
+        fp.seek(0)
+        fp.write(
+            _HEADER.pack(
+                _MAGIC,
+                codec.fingerprint,
+                len(offsets) // _OFFSET.size,
+                position,
+            )
+        )
+    return len(offsets) // _OFFSET.size
+
+
+def record_view_type(cls: Type[Classy]) -> type:
+    codec: BinaryCodec = _get_plan(cls).binary
+    namespace: dict[str, Any] = {
+        k: RecordField(k, i, read)
+        for i, (k, _, read) in enumerate(codec.fields)
+    }
+    namespace["__slots__"] = ()
+    return type(f"{cls.__name__}View", (RecordView,), namespace)
+
+
+def _check_immutable(cls: Type[Classy]) -> None:
+    if not getattr(cls, f"_{cls.__name__}__immutable_object", False):
+        raise TypeError(
+            f"Record files require an @immutable class, but '{cls.__name__}' is not."
+        )
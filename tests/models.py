@@ -0,0 +1,48 @@
+from datetime import datetime
+from uuid import UUID, uuid4
+from python_classy import Classy, immutable, mutable
+
+
+@immutable(slots=True, value_equality=True)
+class Tag(Classy):
+    label: str
+
+
+@immutable(value_equality=True)
+class Student(Classy):
+    id: UUID
+    name: str
+    age: int
+    enrolled_at: datetime
+    tags: tuple[Tag, ...]
+
+
+@mutable(value_equality=True)
+class Class(Classy):
+    title: str
+    leader: Student
+    students: list[Student]
+    students_by_name: dict[str, Student]
+
+
+def make_students(count: int) -> list[Student]:
+    return [
+        Student(
+            id=uuid4(),
+            name=f"student-{i}",
+            age=20 + i,
+            enrolled_at=datetime(2023, 3, 2, 9, i),
+            tags=(Tag(label=f"tag-{i}"), Tag(label="shared")),
+        )
+        for i in range(count)
+    ]
+
+
+def make_class(size: int = 3) -> Class:
+    students: list[Student] = make_students(size)
+    return Class(
+        title="Software Engineering",
+        leader=students[0],
+        students=students,
+        students_by_name={x.name: x for x in students},
+    )
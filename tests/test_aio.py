@@ -0,0 +1,82 @@
+import asyncio
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator
+from uuid import UUID, uuid4
+from python_classy import Classy, immutable
+
+
+@immutable
+class Event(Classy):
+    id: UUID
+    name: str
+
+    def compute_hash(self) -> int:
+        return hash(self.id)
+
+    def equals(self, __o: object) -> bool:
+        if not isinstance(__o, Event):
+            return False
+        return self.id == __o.id and self.name == __o.name
+
+
+_streams: list[object] = []
+
+
+async def _stream_pair() -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    left, right = socket.socketpair()
+    reader, reader_side = await asyncio.open_connection(sock=left)
+    writer_side, writer = await asyncio.open_connection(sock=right)
+    _streams.extend([reader_side, writer_side])
+    return reader, writer
+
+
+def test_async_json_lines_round_trip() -> None:
+    events: list[Event] = [
+        Event(id=uuid4(), name=f"event-{i}") for i in range(1000)
+    ]
+
+    async def run() -> list[Event]:
+        reader, writer = await _stream_pair()
+
+        async def produce() -> None:
+            assert await Event.adump_json_lines(
+                events, writer, chunk_size=64
+            ) == len(events)
+            writer.close()
+            await writer.wait_closed()
+
+        producer: asyncio.Task = asyncio.create_task(produce())
+        decoded: list[Event] = [
+            x async for x in Event.aiter_json_lines(reader, chunk_size=64)
+        ]
+        await producer
+        return decoded
+
+    assert asyncio.run(run()) == events
+
+
+def test_async_json_lines_with_executor_and_async_source() -> None:
+    events: list[Event] = [
+        Event(id=uuid4(), name=f"event-{i}") for i in range(100)
+    ]
+
+    async def source() -> AsyncIterator[Event]:
+        for x in events:
+            yield x
+
+    async def run() -> list[Event]:
+        reader, writer = await _stream_pair()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            await Event.adump_json_lines(
+                source(), writer, chunk_size=16, executor=executor
+            )
+            writer.write_eof()
+            return [
+                x
+                async for x in Event.aiter_json_lines(
+                    reader, chunk_size=16, executor=executor
+                )
+            ]
+
+    assert asyncio.run(run()) == events
@@ -0,0 +1,97 @@
+import pytest
+from datetime import date, datetime, time, timedelta, timezone
+from python_classy import Classy, immutable, mutable
+from .models import Class, Tag, make_class
+
+
+def test_binary_round_trip() -> None:
+    value: Class = make_class()
+    restored: Class = Class.from_bytes(value.to_bytes())
+    assert type(restored) is Class
+    assert restored == value
+    assert type(restored.students[0].tags[0]) is Tag
+
+
+def test_binary_round_trip_of_supported_types() -> None:
+    @mutable(value_equality=True)
+    class Profile(Classy):
+        active: bool
+        enrolled_at: datetime
+        birthday: date
+        wake_up: time
+        avatar: bytes
+        scores: list[int]
+        tags: dict[str, Tag]
+        location: tuple[float, float]
+        aliases: tuple[str, ...]
+
+    value: Profile = Profile(
+        active=True,
+        enrolled_at=datetime(
+            2023, 3, 2, 9, 30, 15, 123, tzinfo=timezone(timedelta(hours=9))
+        ),
+        birthday=date(2003, 5, 17),
+        wake_up=time(7, 15, 30, 500),
+        avatar=b"\x00\x01\xff",
+        scores=[90, -3, 1 << 40],
+        tags={"학생": Tag(label="x")},
+        location=(37.5, 127.0),
+        aliases=("kim", "lee"),
+    )
+    restored: Profile = Profile.from_bytes(value.to_bytes())
+    assert restored == value
+    assert restored.enrolled_at.utcoffset() == timedelta(hours=9)
+    value.enrolled_at = datetime(1960, 1, 1, 0, 0, 1)
+    assert Profile.from_bytes(value.to_bytes()) == value
+
+
+def test_binary_is_positional_and_compact() -> None:
+    value: Class = make_class()
+    data: bytes = value.to_bytes()
+    assert b"title" not in data and b"label" not in data
+    assert value.leader.id.bytes in data
+
+
+def test_binary_rejects_mismatched_schema() -> None:
+    @immutable
+    class Label(Classy):
+        label: str
+
+    data: bytes = Label(label="x").to_bytes()
+    with pytest.raises(ValueError):
+        Tag.from_bytes(data)
+    with pytest.raises(ValueError):
+        Label.from_bytes(data + b"\x00")
+
+
+def test_binary_rejects_unsupported_types() -> None:
+    @immutable
+    class Holder(Classy):
+        value: set[int]
+
+    with pytest.raises(TypeError):
+        Holder(value={1}).to_bytes()
+
+
+def test_binary_rejects_truncated_payloads() -> None:
+    data: bytes = make_class().to_bytes()
+    for size in range(8, len(data)):
+        with pytest.raises(ValueError):
+            Class.from_bytes(data[:size])
+
+
+def test_binary_names_out_of_range_fields() -> None:
+    @immutable
+    class Counter(Classy):
+        label: str
+        count: int
+
+    @immutable
+    class Stats(Classy):
+        total: int
+        counter: Counter
+
+    with pytest.raises(ValueError, match="'count' of 'Counter'"):
+        Counter(label="a", count=1 << 63).to_bytes()
+    with pytest.raises(ValueError, match="'counter.count' of 'Stats'"):
+        Stats(total=1, counter=Counter(label="a", count=-(1 << 64))).to_bytes()
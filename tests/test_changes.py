@@ -0,0 +1,137 @@
+import copy
+import pytest
+from uuid import UUID, uuid4
+from python_classy import Classy, immutable, mutable
+
+
+def test_new_objects_are_clean() -> None:
+    @mutable(slots=True, track_changes=True)
+    class Course(Classy):
+        title: str
+
+        def __post_init__(self) -> None:
+            self.title = self.title.strip()
+
+    value: Course = Course(title=" Software Engineering ")
+    assert value.title == "Software Engineering"
+    assert value.changes() == {}
+    assert copy.deepcopy(value).changes() == {}
+    assert Course.from_dict(value.dict).changes() == {}
+
+
+def test_changes_include_nested_children() -> None:
+    @mutable(slots=True, track_changes=True)
+    class Student(Classy):
+        id: UUID
+        name: str
+        age: int
+
+    @mutable(track_changes=True)
+    class Course(Classy):
+        title: str
+        leader: Student
+
+    value: Course = Course(
+        title="Software Engineering",
+        leader=Student(id=uuid4(), name="Sarah", age=20),
+    )
+    value.title = "Data Structures"
+    value.leader.age = 30
+    assert value.changes() == {"title": "Data Structures", "leader.age": 30}
+    value.mark_clean()
+    assert value.changes() == {}
+    assert value.leader.changes() == {}
+    leader: Student = Student(id=uuid4(), name="John", age=29)
+    value.leader = leader
+    leader.age = 31
+    assert value.changes() == {
+        "leader": {"id": leader.id, "name": "John", "age": 31}
+    }
+
+
+def test_changes_include_optional_children() -> None:
+    @mutable(track_changes=True)
+    class Student(Classy):
+        name: str
+
+    @mutable(track_changes=True)
+    class Course(Classy):
+        title: str
+        leader: Student | None = None
+        students: list[Student]
+
+    value: Course = Course(
+        title="Software Engineering",
+        leader=Student(name="Sarah"),
+        students=[Student(name="John")],
+    )
+    value.leader.name = "Anna"
+    value.students[0].name = "Paul"
+    assert value.changes() == {"leader.name": "Anna"}
+    value.mark_clean()
+    assert value.leader.changes() == {}
+    value.leader = None
+    assert value.changes() == {"leader": None}
+    value.mark_clean()
+    assert value.changes() == {}
+
+
+def test_subclasses_of_tracked_models_are_tracked() -> None:
+    @mutable(track_changes=True)
+    class Student(Classy):
+        name: str
+
+    @mutable(slots=True)
+    class Leader(Student):
+        team: str
+
+    value: Leader = Leader(name="Sarah", team="A")
+    assert value.changes() == {}
+    value.team = "B"
+    value.name = "Anna"
+    assert value.changes() == {"name": "Anna", "team": "B"}
+    assert Student(name="John").changes() == {}
+
+
+def test_apply_patch() -> None:
+    @mutable(track_changes=True)
+    class Student(Classy):
+        id: UUID
+        name: str
+
+    @mutable(track_changes=True)
+    class Course(Classy):
+        title: str
+        leader: Student
+        students: list[Student]
+
+    students: list[Student] = [
+        Student(id=uuid4(), name=f"student-{i}") for i in range(3)
+    ]
+    source: Course = Course(
+        title="Software Engineering", leader=students[0], students=students
+    )
+    target: Course = Course.from_dict(source.dict)
+    source.title = "Data Structures"
+    source.leader.name = "Sarah"
+    source.students = source.students[:1]
+    patch: dict = source.changes()
+    assert (
+        Course.apply_patch(target, Course.deserialize(source.serialize(patch)))
+        is target
+    )
+    assert target.dict == source.dict
+    assert isinstance(target.students[0], Student)
+    with pytest.raises(TypeError):
+        Course.apply_patch(target, {"leader.missing": 1})
+    with pytest.raises(TypeError):
+        Student.apply_patch(target, {})
+
+
+def test_changes_requires_tracking() -> None:
+    @immutable
+    class Plain(Classy):
+        name: str
+
+    with pytest.raises(TypeError):
+        Plain(name="x").changes()
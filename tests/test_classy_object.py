@@ -1,4 +1,8 @@
+import io
+import json
+from dataclasses import dataclass
 from datetime import date, datetime, time
+from typing import Any
 from uuid import UUID, uuid4
 from python_classy import Classy, mutable, immutable
 import pytest
@@ -35,8 +39,7 @@ def test_classy_object_with_not_mutability_decorator_raises_error() -> None:
     class ButDefinesInit(Classy):
         name: str
 
-        def __init__(self) -> None:
-            ...
+        def __init__(self) -> None: ...
 
         def compute_hash(self) -> int:
             return super().compute_hash()
@@ -528,3 +531,299 @@ def test_default_hash() -> None:
     d1: DefaultHash = DefaultHash(name="John")
     with pytest.raises(NotImplementedError):
         hash(d1)
+
+
+def test_from_dict_plan_is_cached_per_class() -> None:
+    @mutable
+    class Parent(Classy):
+        name: str
+
+    @mutable
+    class Child(Parent):
+        id: UUID
+
+    id: UUID = uuid4()
+    assert Parent.from_dict({"name": "John"}).name == "John"
+    child: Child = Child.from_dict({"name": "John", "id": str(id)})
+    assert type(child) is Child
+    assert child.id == id
+    assert Parent.__classy_plan__ is not Child.__classy_plan__
+    assert Parent.__classy_plan__ is Parent.__dict__["__classy_plan__"]
+
+
+def test_from_dict_ignores_unknown_keys_and_keeps_defaults() -> None:
+    @immutable
+    class WithDefault(Classy):
+        name: str
+        age: int = 0
+
+    decoded: WithDefault = WithDefault.from_dict(
+        {"name": "John", "unknown": 1}
+    )
+    assert decoded.name == "John"
+    assert decoded.age == 0
+    with pytest.raises(TypeError):
+        WithDefault.from_dict({"age": 1})
+
+
+def test_decode_variadic_tuple() -> None:
+    @immutable
+    class HasIds(Classy):
+        ids: tuple[UUID, ...]
+
+    ids: list[UUID] = [uuid4(), uuid4()]
+    assert HasIds.from_dict({"ids": [str(x) for x in ids]}).ids == tuple(ids)
+
+
+def test_dict_skips_private_fields_and_copies_containers() -> None:
+    @mutable
+    class Student(Classy):
+        name: str
+        _secret: str = "secret"
+
+    @mutable
+    class Class(Classy):
+        leader: Student
+        students: list[Student]
+        scores: dict[str, list[int]]
+        _internal: int = 0
+
+    value: Class = Class(
+        leader=Student(name="Sarah", _secret="leader"),
+        students=[Student(name="John")],
+        scores={"John": [1, 2]},
+    )
+    encoded: dict[str, Any] = value.dict
+    assert encoded == {
+        "leader": {"name": "Sarah"},
+        "students": [{"name": "John"}],
+        "scores": {"John": [1, 2]},
+    }
+    assert "secret" not in value.json
+    assert Class.from_dict(encoded).leader._secret == "secret"
+    encoded["scores"]["John"].append(3)
+    assert value.scores == {"John": [1, 2]}
+
+
+def test_dict_encodes_plain_dataclass_values() -> None:
+    @dataclass
+    class Point:
+        x: int
+        y: int
+
+    @immutable
+    class Shape(Classy):
+        points: tuple[Point, ...]
+
+    assert Shape(points=(Point(x=0, y=1),)).dict == {
+        "points": ({"x": 0, "y": 1},)
+    }
+
+
+def test_batch_decode_and_encode() -> None:
+    @immutable
+    class Student(Classy):
+        id: UUID
+        name: str
+
+        def compute_hash(self) -> int:
+            return hash(self.id)
+
+        def equals(self, __o: object) -> bool:
+            if not isinstance(__o, Student):
+                return False
+            return self.id == __o.id and self.name == __o.name
+
+    rows: list[dict[str, Any]] = [
+        {"id": str(uuid4()), "name": f"student-{i}"} for i in range(10)
+    ]
+    students: list[Student] = Student.from_dicts(rows)
+    assert students == [Student.from_dict(x) for x in rows]
+    lazy = Student.from_dicts(iter(rows), lazy=True)
+    assert not isinstance(lazy, list)
+    assert list(lazy) == students
+    assert Student.to_dicts(students) == [x.dict for x in students]
+    assert list(Student.to_dicts(students, lazy=True)) == [
+        x.dict for x in students
+    ]
+    assert Student.from_json_array(Student.to_json_array(students)) == (
+        students
+    )
+    assert Student.to_json_array([]) == "[]"
+    assert Student.from_json_array("[]") == []
+
+
+def test_json_lines_round_trip() -> None:
+    @immutable
+    class Event(Classy):
+        id: UUID
+        name: str
+
+        def compute_hash(self) -> int:
+            return hash(self.id)
+
+        def equals(self, __o: object) -> bool:
+            if not isinstance(__o, Event):
+                return False
+            return self.id == __o.id and self.name == __o.name
+
+    events: list[Event] = [
+        Event(id=uuid4(), name=f"event-{i}") for i in range(100)
+    ]
+    buffer: io.StringIO = io.StringIO()
+    assert Event.dump_json_lines(iter(events), buffer, buffer_size=64) == 100
+    assert buffer.getvalue().count("\n") == 100
+    buffer.write("\n")
+    buffer.seek(0)
+    decoded = Event.iter_json_lines(buffer)
+    assert not isinstance(decoded, list)
+    assert list(decoded) == events
+    assert list(
+        Event.iter_json_lines(io.BytesIO(buffer.getvalue().encode()))
+    ) == (events)
+
+
+def test_json_lines_use_serializer_overrides() -> None:
+    @immutable
+    class Upper(Classy):
+        name: str
+
+        def serialize(self, dictionary: dict[str, Any]) -> str:
+            return json.dumps(dictionary).upper()
+
+        @classmethod
+        def deserialize(cls, json_string: str) -> dict[str, Any]:
+            return {k.lower(): v for k, v in json.loads(json_string).items()}
+
+    buffer: io.StringIO = io.StringIO()
+    Upper.dump_json_lines([Upper(name="john")], buffer)
+    assert buffer.getvalue() == '{"NAME": "JOHN"}\n'
+    buffer.seek(0)
+    assert [x.name for x in Upper.iter_json_lines(buffer)] == ["JOHN"]
+
+
+def test_iter_encode_matches_json() -> None:
+    @immutable
+    class Student(Classy):
+        id: UUID
+        name: str
+        score: float
+        _secret: str = "secret"
+
+    @immutable
+    class Class(Classy):
+        name: str
+        students: list[Student]
+        by_name: dict[str, Student]
+        extra: dict[int, tuple[bool, None, float]]
+
+    students: list[Student] = [
+        Student(id=uuid4(), name=f"student-é{i}", score=i / 3)
+        for i in range(100)
+    ]
+    value: Class = Class(
+        name="Software Engineering",
+        students=students,
+        by_name={x.name: x for x in students},
+        extra={1: (True, None, float("inf"))},
+    )
+    chunks: list[str] = list(value.iter_encode(chunk_size=256))
+    assert len(chunks) > 1
+    assert "".join(chunks) == value.json
+    buffer: io.StringIO = io.StringIO()
+    value.dump(buffer)
+    assert buffer.getvalue() == value.json
+
+
+def test_iter_encode_rejects_unknown_types() -> None:
+    @immutable
+    class HasSet(Classy):
+        values: frozenset[int]
+
+    with pytest.raises(TypeError):
+        "".join(HasSet(values=frozenset([1])).iter_encode())
+
+
+def test_evolve_shares_unchanged_children() -> None:
+    @immutable(slots=True, value_equality=True, cache_hash=True)
+    class Student(Classy):
+        name: str
+        age: int
+
+    @immutable(value_equality=True)
+    class Class(Classy):
+        title: str
+        leader: Student
+        students: list[Student]
+
+    leader: Student = Student(name="John", age=29)
+    value: Class = Class(title="A", leader=leader, students=[leader])
+    hash(leader)
+    renamed: Class = value.evolve(title="B")
+    assert renamed.title == "B" and value.title == "A"
+    assert renamed.leader is leader and renamed.students is value.students
+    evolved: Class = value.evolve(**{"leader.name": "Sarah", "leader.age": 30})
+    assert evolved.leader == Student(name="Sarah", age=30)
+    assert hash(evolved.leader) == hash(("Sarah", 30))
+    assert evolved.students is value.students
+    assert leader.evolve() == leader and leader.evolve() is not leader
+    with pytest.raises(TypeError):
+        value.evolve(missing=1)
+    with pytest.raises(TypeError):
+        value.evolve(**{"title.name": "x"})
+    with pytest.raises(TypeError):
+        value.evolve(leader=leader, **{"leader.name": "x"})
+
+
+def test_evolve_runs_post_init() -> None:
+    @mutable
+    class Named(Classy):
+        name: str
+
+        def __post_init__(self) -> None:
+            self.name = self.name.strip()
+
+    assert Named(name="a").evolve(name=" b ").name == "b"
+
+
+def test_default_is_compiled_and_shares_pure_prototypes() -> None:
+    @immutable
+    class Tag(Classy):
+        label: str
+        weight: float
+
+    @immutable
+    class Tagged(Classy):
+        tag: Tag
+        aliases: tuple[str, ...]
+        pair: tuple[Tag, int]
+
+    @immutable
+    class WithId(Classy):
+        id: UUID
+        tag: Tag
+
+    @mutable
+    class Draft(Classy):
+        tag: Tag
+        names: list[str]
+
+    assert Tagged.default() is Tagged.default()
+    assert Tagged.default().aliases == ()
+    assert Tagged.default().pair == (Tag.default(), 0)
+    assert Tagged.default().tag is Tag.default()
+    assert WithId.default() is not WithId.default()
+    assert WithId.default().id != WithId.default().id
+    assert WithId.default().tag is Tag.default()
+    assert Draft.default() is not Draft.default()
+    assert Draft.default().names is not Draft.default().names
+
+
+def test_default_of_recursive_models() -> None:
+    @immutable
+    class Node(Classy):
+        name: str
+        children: tuple["Node", ...]
+
+    assert Node.default() is Node.default()
+    assert Node.default().children == ()
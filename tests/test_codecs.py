@@ -0,0 +1,225 @@
+import io
+import json
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum, IntEnum
+from pathlib import Path
+from uuid import UUID, uuid4
+from python_classy import Classy, immutable, mutable
+
+
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class Level(IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+class Money:
+    def __init__(self, cents: int) -> None:
+        self.cents: int = cents
+
+    def __eq__(self, __o: object) -> bool:
+        return isinstance(__o, Money) and self.cents == __o.cents
+
+    def __hash__(self) -> int:
+        return hash(self.cents)
+
+
+class Point:
+    def __init__(self, x: int, y: int) -> None:
+        self.x: int = x
+        self.y: int = y
+
+    def __eq__(self, __o: object) -> bool:
+        return isinstance(__o, Point) and (self.x, self.y) == (__o.x, __o.y)
+
+
+@immutable
+class Item(Classy):
+    id: UUID
+    price: Decimal
+    color: Color
+    level: Level
+    path: Path
+    payload: bytes
+    created_at: datetime
+
+
+@mutable
+class Wallet(Classy):
+    owner: str
+    balance: Money
+    history: list[Money]
+
+
+@mutable
+class Shape(Classy):
+    name: str
+    origin: Point
+
+
+@mutable
+class Drawing(Classy):
+    title: str
+    shapes: list[Shape]
+
+
+@mutable
+class Marker(Classy):
+    origin: Point
+
+
+Classy.register_codec(Money, lambda x: x.cents, Money)
+Shape.register_codec(Point, lambda x: [x.x, x.y], lambda v: Point(v[0], v[1]))
+
+
+def _make_item() -> Item:
+    return Item(
+        id=uuid4(),
+        price=Decimal("12.30"),
+        color=Color.BLUE,
+        level=Level.HIGH,
+        path=Path("/tmp/classy"),
+        payload=b"\x00\xffclassy",
+        created_at=datetime(2023, 1, 1, 9, 30),
+    )
+
+
+def test_builtin_codecs_round_trip() -> None:
+    value: Item = _make_item()
+    encoded: dict = json.loads(value.json)
+    assert encoded["price"] == "12.30"
+    assert encoded["color"] == "blue"
+    assert encoded["level"] == 2
+    assert encoded["path"] == "/tmp/classy"
+    assert encoded["payload"] == "AP9jbGFzc3k="
+    decoded: Item = Item.from_json(value.json)
+    assert decoded.dict == value.dict
+    assert type(decoded.color) is Color
+    assert type(decoded.level) is Level
+    assert "".join(value.iter_encode()) == value.json
+
+
+def test_global_codec() -> None:
+    value: Wallet = Wallet(
+        owner="John", balance=Money(100), history=[Money(1), Money(2)]
+    )
+    assert json.loads(value.json) == {
+        "owner": "John",
+        "balance": 100,
+        "history": [1, 2],
+    }
+    assert Wallet.from_json(value.json).dict == value.dict
+    balance: Money = Money(5)
+    assert (
+        Wallet.from_dict(
+            {"owner": "John", "balance": balance, "history": []}
+        ).balance
+        is balance
+    )
+
+
+def test_class_scoped_codec_applies_to_nested_models() -> None:
+    value: Drawing = Drawing(
+        title="plan", shapes=[Shape(name="dot", origin=Point(1, 2))]
+    )
+    assert json.loads(value.json)["shapes"][0]["origin"] == [1, 2]
+    assert "".join(value.iter_encode()) == value.json
+    decoded: Drawing = Drawing.from_json(value.json)
+    assert decoded.shapes[0].origin == Point(1, 2)
+    with pytest.raises(TypeError):
+        Marker(origin=Point(1, 2)).json
+
+
+def test_register_codec_invalidates_compiled_plans() -> None:
+    class Celsius:
+        def __init__(self, degrees: float) -> None:
+            self.degrees: float = degrees
+
+    @mutable
+    class Reading(Classy):
+        value: Celsius
+
+    with pytest.raises(TypeError):
+        Reading(value=Celsius(21.5)).json
+    Reading.register_codec(
+        Celsius, lambda x: x.degrees, lambda v: Celsius(float(v))
+    )
+    assert Reading(value=Celsius(21.5)).json == '{"value": 21.5}'
+    assert Reading.from_dict({"value": 3}).value.degrees == 3.0
+
+
+def test_class_scoped_codec_round_trips_the_whole_document() -> None:
+    @mutable
+    class Line(Classy):
+        price: Money | None
+
+    @mutable
+    class Order(Classy):
+        lines: list[Line]
+
+    @mutable
+    class Canvas(Classy):
+        anchor: Point
+        shapes: list[Shape]
+
+    Order.register_codec(Money, lambda x: -x.cents, lambda v: Money(-v))
+    order: Order = Order(lines=[Line(price=Money(5))])
+    assert json.loads(order.json) == {"lines": [{"price": -5}]}
+    for defer in [False, True]:
+        decoded: Order = Order.from_json(order.json, defer=defer)
+        assert decoded.lines[0].price == Money(5)
+    assert Line.from_dict({"price": Money(5)}).price == Money(5)
+    canvas: Canvas = Canvas(
+        anchor=Point(1, 2), shapes=[Shape(name="dot", origin=Point(3, 4))]
+    )
+    assert json.loads(canvas.json)["anchor"] == [1, 2]
+    decoded_canvas: Canvas = Canvas.from_json(canvas.json)
+    assert decoded_canvas.anchor == Point(1, 2)
+    assert decoded_canvas.shapes[0].origin == Point(3, 4)
+
+
+def test_codecs_for_json_native_subclasses() -> None:
+    class Code(str):
+        pass
+
+    @mutable
+    class Ticket(Classy):
+        level: Level
+        code: Code
+        history: list[Level]
+        fallback: Level | None = None
+
+    Ticket.register_codec(Level, lambda x: x.name, lambda v: Level[v])
+    Ticket.register_codec(Code, lambda x: f"#{x}", lambda v: Code(v[1:]))
+    value: Ticket = Ticket(
+        level=Level.HIGH,
+        code=Code("a1"),
+        history=[Level.LOW],
+        fallback=Level.LOW,
+    )
+    assert json.loads(value.json) == {
+        "level": "HIGH",
+        "code": "#a1",
+        "history": ["LOW"],
+        "fallback": "LOW",
+    }
+    decoded: Ticket = Ticket.from_json(value.json)
+    assert decoded.dict == value.dict
+    assert type(decoded.code) is Code
+    assert "".join(value.iter_encode()) == value.json
+    assert json.loads(value.to_json(include=["level", "code"])) == {
+        "level": "HIGH",
+        "code": "#a1",
+    }
+    assert [
+        x.dict for x in Ticket.from_json_array(value.to_json_array([value]))
+    ] == [value.dict]
+    buffer: io.StringIO = io.StringIO()
+    Ticket.dump_json_lines([value], buffer)
+    assert buffer.getvalue() == f"{value.json}\n"
@@ -0,0 +1,107 @@
+import sys
+import pytest
+from pathlib import Path
+from typing import Any, Iterator
+from uuid import uuid4
+from python_classy import _get_plan, compiler
+from python_classy.__main__ import main
+
+_MODELS: str = """
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+from python_classy import Classy, immutable, mutable
+
+
+@immutable(value_equality=True, interned=True, cache_encoding=True)
+class Tag(Classy):
+    name: str
+
+
+@immutable(slots=True)
+class Created(Classy):
+    type: Literal["created"]
+    at: datetime
+
+
+@immutable
+class Deleted(Classy):
+    type: Literal["deleted"]
+
+
+@mutable(track_changes=True)
+class Item(Classy):
+    id: UUID
+    tags: list[Tag]
+    event: Created | Deleted | None
+{extra}
+"""
+
+
+def _import_models(path: Path, extra: str = "") -> Any:
+    (path / "aot_models.py").write_text(_MODELS.format(extra=extra))
+    for name in ["aot_models", "aot_models_classy"]:
+        sys.modules.pop(name, None)
+    compiler._tables.clear()
+    return __import__("aot_models")
+
+
+@pytest.fixture
+def models_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[Path]:
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    monkeypatch.setattr(compiler, "_tables", {})
+    yield tmp_path
+    for name in ["aot_models", "aot_models_classy"]:
+        sys.modules.pop(name, None)
+
+
+def test_precompiled_module_is_used(
+    models_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    _import_models(models_path)
+    assert main(["compile", "aot_models"]) == 0
+    assert (models_path / "aot_models_classy.py").exists()
+    assert "aot_models_classy.py" in capsys.readouterr().out
+    models: Any = _import_models(models_path)
+    plan: Any = _get_plan(models.Item)
+    assert plan.from_dict.__module__ == "aot_models_classy"
+    assert plan.encode.__module__ == "aot_models_classy"
+    assert _get_plan(models.Tag).default_factory.__module__ == (
+        "aot_models_classy"
+    )
+    payload: dict[str, Any] = {
+        "id": str(uuid4()),
+        "tags": [{"name": "a"}, {"name": "a"}],
+        "event": {"type": "created", "at": "2023-01-01T09:30:00"},
+    }
+    item: Any = models.Item.from_dict(payload)
+    assert item.tags[0] is item.tags[1]
+    assert type(item.event) is models.Created
+    assert models.Item.from_json(item.json).dict == item.dict
+    assert item.changes() == {}
+    assert models.Tag.default() is models.Tag.default()
+
+
+def test_stale_classes_are_compiled_at_runtime(models_path: Path) -> None:
+    _import_models(models_path)
+    compiler.write_precompiled("aot_models")
+    models: Any = _import_models(models_path, "    name: str = ''")
+    assert hasattr(_get_plan(models.Item).from_dict, "__classy_source__")
+    assert _get_plan(models.Tag).from_dict.__module__ == "aot_models_classy"
+    item: Any = models.Item.from_dict(
+        {"id": str(uuid4()), "tags": [], "event": None, "name": "x"}
+    )
+    assert item.name == "x"
+
+
+def test_unresolvable_parts_are_skipped(models_path: Path) -> None:
+    _import_models(
+        models_path,
+        "\n\nItem.register_codec(UUID, str, lambda v: UUID(v))",
+    )
+    source, skipped = compiler.compile_module("aot_models")
+    compile(source, "aot_models_classy.py", "exec")
+    assert skipped == ["Item.from_dict"]
@@ -0,0 +1,65 @@
+import gc
+import pickle
+import pytest
+from typing import Any
+from python_classy import Classy, immutable
+
+
+@immutable(value_equality=True, interned=True)
+class Currency(Classy):
+    code: str
+
+
+@immutable(slots=True, value_equality=True, intern_maxsize=2)
+class Country(Classy):
+    code: str
+    currency: Currency
+
+
+def test_interned_decoding_returns_canonical_instances() -> None:
+    a: Currency = Currency.from_dict({"code": "KRW"})
+    assert Currency.from_json('{"code": "KRW"}') is a
+    assert Currency.intern(Currency(code="KRW")) is a
+    assert Currency.from_bytes(a.to_bytes()) is a
+    assert pickle.loads(pickle.dumps(a)) is a
+    assert Currency.from_dict({"code": "USD"}) is not a
+    countries: list[Country] = Country.from_dicts(
+        [{"code": "KR", "currency": {"code": "KRW"}}] * 3
+    )
+    assert countries[0] is countries[1] is countries[2]
+    assert countries[0].currency is a
+
+
+def test_weak_interning_releases_unreferenced_instances() -> None:
+    interner: Any = Currency.__classy_interner__
+    size: int = len(interner)
+    value: Currency = Currency.from_dict({"code": "GBP"})
+    assert len(interner) == size + 1
+    del value
+    gc.collect()
+    assert len(interner) == size
+
+
+def test_bounded_interning_evicts_least_recently_used() -> None:
+    krw: Currency = Currency(code="KRW")
+    kr: Country = Country.intern(Country(code="KR", currency=krw))
+    us: Country = Country.intern(Country(code="US", currency=krw))
+    assert Country.intern(Country(code="KR", currency=krw)) is kr
+    Country.intern(Country(code="JP", currency=krw))
+    assert Country.intern(Country(code="KR", currency=krw)) is kr
+    assert Country.intern(Country(code="US", currency=krw)) is not us
+
+
+def test_interning_requires_equality() -> None:
+    with pytest.raises(TypeError):
+
+        @immutable(interned=True)
+        class Tag(Classy):
+            label: str
+
+    @immutable(value_equality=True)
+    class Plain(Classy):
+        label: str
+
+    with pytest.raises(TypeError):
+        Plain.intern(Plain(label="x"))
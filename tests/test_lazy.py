@@ -0,0 +1,82 @@
+import pickle
+import pytest
+from dataclasses import FrozenInstanceError
+from typing import Any
+from python_classy import Classy, immutable, mutable
+
+
+@immutable(slots=True, value_equality=True)
+class Student(Classy):
+    student_name: str
+
+
+@immutable(value_equality=True)
+class Class(Classy):
+    class_title: str
+    leader: Student
+    students: list[Student]
+    students_by_name: dict[str, Student]
+
+
+@mutable(slots=True)
+class Draft(Classy):
+    title: str
+    classes: tuple[Class, ...]
+
+
+def _payload() -> dict[str, Any]:
+    students: list[dict[str, Any]] = [
+        {"student_name": "John"},
+        {"student_name": "Sarah"},
+    ]
+    return {
+        "class_title": "Software Engineering",
+        "leader": students[0],
+        "students": students,
+        "students_by_name": {x["student_name"]: x for x in students},
+    }
+
+
+def test_lazy_from_dict_decodes_on_first_access() -> None:
+    value: Class = Class.from_dict(_payload(), defer=True)
+    assert isinstance(value, Class)
+    assert type(value) is not Class and type(value).__name__ == "Class"
+    assert vars(value)["students"].__class__.__name__ == "Thunk"
+    assert value.class_title == "Software Engineering"
+    students: list[Student] = value.students
+    assert value.students is students
+    assert students == [
+        Student(student_name="John"),
+        Student(student_name="Sarah"),
+    ]
+    assert value == Class.from_dict(_payload())
+    assert value.dict == Class.from_dict(_payload()).dict
+    restored: Class = pickle.loads(pickle.dumps(value))
+    assert type(restored) is Class and restored == value
+    with pytest.raises(FrozenInstanceError):
+        value.leader = Student(student_name="Sarah")  # type: ignore
+
+
+def test_lazy_from_dict_nested_and_slotted() -> None:
+    draft: Draft = Draft.from_json(
+        Draft(title="x", classes=(Class.from_dict(_payload()),)).json,
+        defer=True,
+    )
+    assert not hasattr(draft, "__dict__")
+    nested: Class = draft.classes[0]
+    assert vars(nested)["leader"].__class__.__name__ == "Thunk"
+    assert nested.leader == Student(student_name="John")
+    draft.classes = ()
+    assert draft.classes == ()
+
+
+def test_deferred_batches() -> None:
+    values: list[Class] = Class.from_dicts([_payload()] * 2, defer=True)
+    assert [vars(x)["students"].__class__.__name__ for x in values] == [
+        "Thunk",
+        "Thunk",
+    ]
+    array: str = Class.to_json_array(Class.from_dicts([_payload()]))
+    deferred: Any = next(Class.from_json_array(array, lazy=True, defer=True))
+    assert vars(deferred)["leader"].__class__.__name__ == "Thunk"
+    assert deferred == Class.from_dict(_payload())
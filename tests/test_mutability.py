@@ -1,5 +1,8 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import FrozenInstanceError
-from python_classy import Classy, mutable, immutable
+from typing import Any
+from python_classy import Classy, mutable, immutable, set_default_slots
 import pytest
 
 
@@ -36,3 +39,331 @@ def test_immutable_object_cannot_mutate_its_field() -> None:
     with pytest.raises(FrozenInstanceError):
         test.name = "Sarah"  # type: ignore
         assert test.name == "Sarah"
+
+
+def test_undecorated_subclass_cannot_be_constructed() -> None:
+    @mutable
+    class Parent(Classy):
+        name: str
+
+    class Child(Parent):
+        age: int
+
+    assert Parent(name="John").name == "John"
+    with pytest.raises(TypeError):
+        Child(name="John")
+
+
+def test_construction_does_not_write_class_state() -> None:
+    @immutable
+    class Payload(Classy):
+        data: list[int]
+
+    Payload(data=[0] * 1000)
+    assert "args" not in Payload.__dict__
+    assert "kwargs" not in Payload.__dict__
+
+
+def test_concurrent_construction() -> None:
+    @immutable
+    class Item(Classy):
+        index: int
+        name: str
+
+    def build(offset: int) -> bool:
+        return all(
+            x.index == i and x.name == str(i)
+            for i, x in [
+                (i, Item(index=i, name=str(i)))
+                for i in range(offset, offset + 2000)
+            ]
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(build, range(0, 64000, 2000)))
+
+
+def test_slotted_objects_have_no_instance_dict() -> None:
+    @immutable(slots=True)
+    class Slotted(Classy):
+        name: str
+        tags: tuple[str, str]
+
+        def compute_hash(self) -> int:
+            return hash((self.name, self.tags))
+
+        def equals(self, __o: object) -> bool:
+            if not isinstance(__o, Slotted):
+                return False
+            return self.name == __o.name and self.tags == __o.tags
+
+    @mutable(slots=True)
+    class MutableSlotted(Classy):
+        name: str
+
+    value: Slotted = Slotted(name="John", tags=("a", "b"))
+    assert not hasattr(value, "__dict__")
+    assert getattr(Slotted, "_Slotted__immutable_object") == True
+    with pytest.raises(FrozenInstanceError):
+        value.name = "Sarah"  # type: ignore
+    assert Slotted.from_dict({"name": "John", "tags": ["a", "b"]}) == value
+    assert value.dict == {"name": "John", "tags": ("a", "b")}
+    assert Slotted.default().tags == ("", "")
+
+    mutable_value: MutableSlotted = MutableSlotted(name="John")
+    mutable_value.name = "Sarah"
+    assert mutable_value.name == "Sarah"
+    assert not hasattr(mutable_value, "__dict__")
+    with pytest.raises(AttributeError):
+        mutable_value.age = 29  # type: ignore
+
+
+def test_slotted_objects_can_inherit() -> None:
+    @mutable(slots=True)
+    class Parent(Classy):
+        name: str
+
+        def compute_hash(self) -> int:
+            return hash(self.name)
+
+    @mutable(slots=True)
+    class Child(Parent):
+        age: int
+
+        def compute_hash(self) -> int:
+            return super().compute_hash() ^ hash(self.age)
+
+    child: Child = Child.from_dict({"name": "John", "age": 29})
+    assert not hasattr(child, "__dict__")
+    assert child.dict == {"name": "John", "age": 29}
+    assert hash(child) == hash("John") ^ hash(29)
+    with pytest.raises(TypeError):
+
+        class Undecorated(Child):
+            pass
+
+        Undecorated(name="John", age=29)
+
+
+def test_default_slots() -> None:
+    set_default_slots(True)
+    try:
+
+        @immutable
+        class Slotted(Classy):
+            name: str
+
+    finally:
+        set_default_slots(False)
+
+    @immutable
+    class NotSlotted(Classy):
+        name: str
+
+    assert not hasattr(Slotted(name="John"), "__dict__")
+    assert hasattr(NotSlotted(name="John"), "__dict__")
+
+
+_hash_calls: list[str] = []
+
+
+@immutable(cache_hash=True)
+class CachedHash(Classy):
+    name: str
+    tags: tuple[str, ...]
+
+    def compute_hash(self) -> int:
+        _hash_calls.append(self.name)
+        return hash((self.name, self.tags))
+
+
+@immutable(slots=True, cache_hash=True)
+class SlottedCachedHash(Classy):
+    name: str
+    tags: tuple[str, ...]
+
+    def compute_hash(self) -> int:
+        _hash_calls.append(self.name)
+        return hash((self.name, self.tags))
+
+
+@pytest.mark.parametrize("cls", [CachedHash, SlottedCachedHash])
+def test_cache_hash(cls: type[Any]) -> None:
+    _hash_calls.clear()
+    value: Any = cls(name="John", tags=("a", "b"))
+    assert hash(value) == hash(value) == hash(("John", ("a", "b")))
+    assert {value: 1}[value] == 1
+    assert _hash_calls == ["John"]
+    assert value.dict == {"name": "John", "tags": ("a", "b")}
+    assert "_classy_hash" not in repr(value)
+    restored: Any = pickle.loads(pickle.dumps(value))
+    assert restored._classy_hash is None
+    assert hash(restored) == hash(value)
+    assert cls.from_bytes(value.to_bytes()).tags == ("a", "b")
+    with pytest.raises(TypeError):
+        cls(name="John", tags=(), _classy_hash=1)
+
+
+def test_generated_identity_equality() -> None:
+    @immutable(slots=True, identity=("id",))
+    class Entity(Classy):
+        id: int
+        name: str
+
+    a: Entity = Entity(id=1, name="John")
+    assert a == Entity(id=1, name="Sarah")
+    assert a != Entity(id=2, name="John")
+    assert a != 1
+    assert hash(a) == hash(1)
+    assert "__o.id" in Entity.equals.__classy_source__
+
+
+def test_generated_value_equality() -> None:
+    @immutable(value_equality=True, cache_hash=True)
+    class Value(Classy):
+        name: str
+        tags: tuple[str, ...]
+
+    @mutable(value_equality=True)
+    class Draft(Classy):
+        name: str
+
+    assert Value(name="a", tags=("x",)) == Value(name="a", tags=("x",))
+    assert Value(name="a", tags=("x",)) != Value(name="a", tags=("y",))
+    assert hash(Value(name="a", tags=("x",))) == hash(("a", ("x",)))
+    assert Draft(name="a") == Draft(name="a")
+    with pytest.raises(NotImplementedError):
+        hash(Draft(name="a"))
+
+
+def test_generated_equality_compares_exact_classes() -> None:
+    @immutable(value_equality=True)
+    class Base(Classy):
+        name: str
+        tags: tuple[str, ...]
+
+    @immutable(value_equality=True)
+    class Derived(Base):
+        age: int
+
+    @immutable
+    class Plain(Base):
+        pass
+
+    base: Base = Base(name="a", tags=("x",))
+    assert base != Derived(name="a", tags=("x",), age=1)
+    assert Derived(name="a", tags=("x",), age=1) != base
+    assert base != Plain(name="a", tags=("x",))
+    assert Plain(name="a", tags=("x",)) == Plain(name="a", tags=("x",))
+    lazy: Base = Base.from_dict(base.dict, defer=True)
+    assert type(lazy) is not Base
+    assert lazy == base and base == lazy
+    assert hash(lazy) == hash(Base(name="a", tags=("x",)))
+
+
+def test_generated_equality_is_explicit() -> None:
+    with pytest.raises(TypeError):
+
+        @immutable(value_equality=True)
+        class Explicit(Classy):
+            name: str
+
+            def equals(self, __o: object) -> bool:
+                return True
+
+    with pytest.raises(TypeError):
+
+        @immutable(identity=("missing",))
+        class Missing(Classy):
+            name: str
+
+    with pytest.raises(TypeError):
+
+        @immutable(identity=("name",), value_equality=True)
+        class Both(Classy):
+            name: str
+
+
+@immutable(cache_encoding=True)
+class CachedLeaf(Classy):
+    name: str
+    tags: tuple[str, ...]
+
+
+@immutable(slots=True, cache_encoding=True)
+class CachedTree(Classy):
+    name: str
+    leaves: tuple[CachedLeaf, ...]
+    scores: tuple[tuple[str, int], ...]
+
+
+@pytest.mark.parametrize("cls", [CachedLeaf, CachedTree])
+def test_cache_encoding_returns_copies(cls: type[Any]) -> None:
+    leaf: CachedLeaf = CachedLeaf(name="leaf", tags=("a",))
+    value: Any = (
+        leaf
+        if cls is CachedLeaf
+        else CachedTree(name="tree", leaves=(leaf,), scores=(("a", 1),))
+    )
+    first: dict[str, Any] = value.dict
+    assert value._classy_dict == first
+    first["name"] = "changed"
+    if cls is CachedTree:
+        first["leaves"][0]["name"] = "changed"
+    assert value.dict == cls.from_dict(value.dict).dict
+    assert value.dict["name"] == value.name
+    if cls is CachedTree:
+        assert value.dict["leaves"][0]["name"] == "leaf"
+    assert value.json is value.json
+    assert cls.from_json(value.json).dict == value.dict
+    assert "_classy_json" not in repr(value)
+    restored: Any = pickle.loads(pickle.dumps(value))
+    assert restored._classy_dict is None and restored._classy_json is None
+    assert value.evolve(name="new").json != value.json
+
+
+def test_cache_encoding_reuses_cached_children() -> None:
+    leaf: CachedLeaf = CachedLeaf(name="leaf", tags=("a",))
+    leaf.dict
+    cached: dict[str, Any] = leaf._classy_dict
+    CachedTree(name="tree", leaves=(leaf, leaf), scores=()).dict
+    assert leaf._classy_dict is cached
+
+
+def test_cache_encoding_options() -> None:
+    @immutable(cache_encoding="json")
+    class JsonOnly(Classy):
+        name: str
+
+    value: JsonOnly = JsonOnly(name="John")
+    assert value.json is value.json
+    assert not hasattr(value, "_classy_dict")
+    with pytest.raises(ValueError):
+
+        @immutable(cache_encoding="yaml")  # type: ignore
+        class Invalid(Classy):
+            name: str
+
+
+def test_cache_encoding_requires_deeply_immutable_fields() -> None:
+    @mutable
+    class Draft(Classy):
+        name: str
+
+    @immutable
+    class Shallow(Classy):
+        tags: list[str]
+
+    for field_type in [list[str], dict[str, int], Draft, Shallow | None]:
+        with pytest.raises(TypeError, match="cannot be cached"):
+
+            @immutable(cache_encoding=True)
+            class Invalid(Classy):
+                value: field_type  # type: ignore
+
+    @immutable(cache_encoding="json")
+    class Node(Classy):
+        name: str
+        children: tuple["Node", ...]
+
+    assert Node(name="a", children=()).json == '{"name": "a", "children": []}'
@@ -0,0 +1,59 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from uuid import UUID, uuid4
+from python_classy import Classy, immutable, parallel
+
+
+@immutable
+class Row(Classy):
+    id: UUID
+    index: int
+
+    def compute_hash(self) -> int:
+        return hash(self.id)
+
+    def equals(self, __o: object) -> bool:
+        if not isinstance(__o, Row):
+            return False
+        return self.id == __o.id and self.index == __o.index
+
+
+def test_from_dict_many_keeps_order() -> None:
+    rows: list[dict] = [{"id": str(uuid4()), "index": i} for i in range(500)]
+    expected: list[Row] = Row.from_dicts(rows)
+    assert Row.from_dict_many(rows, workers=2, chunk_size=64) == expected
+    assert Row.from_dict_many(iter(rows), workers=1) == expected
+
+
+def test_from_json_many_keeps_order() -> None:
+    rows: list[Row] = [Row(id=uuid4(), index=i) for i in range(500)]
+    payloads: list[str] = [x.json for x in rows]
+    assert Row.from_json_many(payloads, workers=2) == rows
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert (
+            Row.from_json_many(payloads, chunk_size=100, executor=executor)
+            == rows
+        )
+
+
+def test_small_batches_are_decoded_serially(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pools: list[int] = []
+
+    class Pool(ThreadPoolExecutor):
+        def __init__(self, max_workers: int) -> None:
+            pools.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(parallel, "cpu_count", lambda: 8)
+    monkeypatch.setattr(parallel, "ProcessPoolExecutor", Pool)
+    rows: list[dict[str, Any]] = [
+        {"id": str(uuid4()), "index": i} for i in range(5000)
+    ]
+    assert len(Row.from_dict_many(rows[:2])) == 2
+    assert len(Row.from_dict_many(rows[:2048], workers=4)) == 2048
+    assert pools == []
+    assert Row.from_dict_many(rows) == Row.from_dicts(rows)
+    assert pools == [3]
@@ -0,0 +1,108 @@
+import copy
+import pickle
+import sys
+import pytest
+from dataclasses import field
+from typing import Any
+from python_classy import Classy, immutable, mutable
+from .models import Class, make_class
+
+
+@immutable
+class User(Classy):
+    first: str
+    last: str
+
+
+@mutable
+class Sentence(Classy):
+    text: str
+
+    def __post_init__(self) -> None:
+        self.words: list[str] = self.text.split()
+
+
+def test_pickle_round_trip() -> None:
+    value: Class = make_class()
+    for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+        restored: Class = pickle.loads(pickle.dumps(value, protocol))
+        assert type(restored) is Class
+        assert restored == value
+        assert restored.students[0] is restored.leader
+
+
+def test_pickle_is_positional() -> None:
+    data: bytes = pickle.dumps(make_class())
+    for name in ["title", "students_by_name", "enrolled_at", "label"]:
+        assert data.count(name.encode()) == 1
+
+
+def _replace(monkeypatch: pytest.MonkeyPatch, name: str, cls: type) -> None:
+    cls.__qualname__ = name
+    monkeypatch.setattr(sys.modules[__name__], name, cls)
+
+
+def test_reordered_fields_are_restored_by_name(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    data: bytes = pickle.dumps(User(first="Ada", last="Lovelace"))
+
+    @immutable
+    class Reordered(Classy):
+        last: str
+        first: str
+
+    _replace(monkeypatch, "User", Reordered)
+    restored: Any = pickle.loads(data)
+    assert type(restored) is Reordered
+    assert (restored.first, restored.last) == ("Ada", "Lovelace")
+
+
+def test_added_fields_get_their_defaults(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    data: bytes = pickle.dumps(User(first="Ada", last="Lovelace"))
+
+    @immutable
+    class Extended(Classy):
+        first: str
+        last: str
+        nickname: str = ""
+        roles: list[str] = field(default_factory=list)
+
+    _replace(monkeypatch, "User", Extended)
+    restored: Any = pickle.loads(data)
+    assert (restored.first, restored.last) == ("Ada", "Lovelace")
+    assert restored.nickname == "" and restored.roles == []
+
+    @immutable
+    class Required(Classy):
+        first: str
+        last: str
+        email: str
+
+    _replace(monkeypatch, "User", Required)
+    with pytest.raises(TypeError, match="email"):
+        pickle.loads(data)
+
+
+def test_attributes_outside_fields_are_kept() -> None:
+    value: Sentence = Sentence(text="hello classy world")
+    for restored in [
+        pickle.loads(pickle.dumps(value)),
+        copy.copy(value),
+        copy.deepcopy(value),
+    ]:
+        assert restored.words == ["hello", "classy", "world"]
+        assert restored.text == value.text
+
+
+def test_copy_and_deepcopy() -> None:
+    value: Class = make_class()
+    shallow: Class = copy.copy(value)
+    deep: Class = copy.deepcopy(value)
+    assert shallow == value and deep == value
+    assert shallow.students is value.students
+    assert deep.students is not value.students
+    deep.title = "Changed"
+    assert value.title == "Software Engineering"
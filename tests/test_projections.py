@@ -0,0 +1,114 @@
+import json
+import pytest
+from typing import Literal
+from uuid import UUID, uuid4
+from python_classy import Classy, immutable
+from .models import Class, Student, make_class
+
+
+def test_include_nested_paths() -> None:
+    value: Class = make_class()
+    assert value.to_dict(include=["title", "students.name"]) == {
+        "title": "Software Engineering",
+        "students": [{"name": x.name} for x in value.students],
+    }
+    assert value.to_dict(include=("leader.age", "students_by_name.age")) == {
+        "leader": {"age": 20},
+        "students_by_name": {x.name: {"age": x.age} for x in value.students},
+    }
+    assert value.to_dict(include=["students", "students.name"]) == {
+        "students": value.dict["students"]
+    }
+    assert value.to_dict(include=["leader.tags.label"]) == {
+        "leader": {"tags": ({"label": "tag-0"}, {"label": "shared"})}
+    }
+    assert value.to_dict() == value.dict
+
+
+def test_exclude_nested_paths() -> None:
+    value: Class = make_class()
+    projected: dict = value.to_dict(
+        exclude=[
+            "students_by_name",
+            "leader",
+            "students.id",
+            "students.enrolled_at",
+            "students.tags",
+        ]
+    )
+    assert projected == {
+        "title": "Software Engineering",
+        "students": [{"name": x.name, "age": x.age} for x in value.students],
+    }
+    leader: dict = dict(value.dict["leader"])
+    del leader["age"]
+    assert value.to_dict(include=["leader"], exclude=["leader.age"]) == {
+        "leader": leader
+    }
+    assert json.loads(value.to_json(include="leader.name")) == {
+        "leader": {"name": "student-0"}
+    }
+
+
+def test_projection_handles_none_and_lazy_objects() -> None:
+    @immutable
+    class Team(Classy):
+        id: UUID
+        leader: Student | None
+
+    empty: Team = Team(id=uuid4(), leader=None)
+    assert empty.to_dict(include=["leader.name"]) == {"leader": None}
+    value: Class = make_class()
+    lazy: Class = Class.from_dict(value.dict, defer=True)
+    assert lazy.to_dict(include=["students.age"]) == {
+        "students": [{"age": x.age} for x in value.students]
+    }
+
+
+def test_projection_rejects_unknown_fields() -> None:
+    value: Class = make_class()
+    with pytest.raises(ValueError):
+        value.to_dict(include=["name"])
+    with pytest.raises(ValueError):
+        value.to_dict(exclude=["students.title"])
+    for path in ["title.x", "leader.id.hex", "students_by_name.age.real"]:
+        with pytest.raises(ValueError, match="has no field"):
+            value.to_dict(include=[path])
+        with pytest.raises(ValueError, match="has no field"):
+            value.to_dict(exclude=[path])
+
+
+def test_projection_of_union_fields() -> None:
+    @immutable
+    class Created(Classy):
+        kind: Literal["created"]
+        at: int
+
+    @immutable
+    class Deleted(Classy):
+        kind: Literal["deleted"]
+        at: int
+        reason: str
+
+    @immutable
+    class Entry(Classy):
+        id: UUID
+        event: Created | Deleted
+
+    created: Entry = Entry(id=uuid4(), event=Created(kind="created", at=1))
+    deleted: Entry = Entry(
+        id=uuid4(), event=Deleted(kind="deleted", at=2, reason="spam")
+    )
+    assert deleted.to_dict(include=["event.reason"]) == {
+        "event": {"reason": "spam"}
+    }
+    assert created.to_dict(include=["event.reason"]) == {"event": {}}
+    assert created.to_dict(exclude=["id", "event.reason"]) == {
+        "event": {"kind": "created", "at": 1}
+    }
+    lazy: Entry = Entry.from_dict(deleted.dict, defer=True)
+    assert lazy.to_dict(include=["event.reason", "event.at"]) == {
+        "event": {"at": 2, "reason": "spam"}
+    }
+    with pytest.raises(ValueError, match="has no field"):
+        created.to_dict(include=["event.missing"])
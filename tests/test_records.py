@@ -0,0 +1,38 @@
+import os
+import pytest
+from python_classy import Classy, mutable
+from .models import Student, Tag, make_students
+
+
+def test_records_random_access(tmp_path: os.PathLike[str]) -> None:
+    path: str = os.path.join(tmp_path, "students.bin")
+    students: list[Student] = make_students(10)
+    assert Student.write_records(iter(students), path) == 10
+    with Student.open_records(path) as records:
+        assert len(records) == 10
+        assert records[3].name == "student-3"
+        assert records[-1].id == students[-1].id
+        assert records[5].tags == students[5].tags
+        assert not isinstance(records[7], Student)
+        assert records[7].materialize() == students[7]
+        assert [x.age for x in records] == [x.age for x in students]
+        with pytest.raises(IndexError):
+            records[10]
+        with pytest.raises(AttributeError):
+            records[0].age = 1  # type: ignore
+
+
+def test_records_reject_mismatched_files(
+    tmp_path: os.PathLike[str],
+) -> None:
+    path: str = os.path.join(tmp_path, "tags.bin")
+    Tag.write_records([Tag(label="x")], path)
+    with pytest.raises(ValueError):
+        Student.open_records(path)
+
+    @mutable
+    class Draft(Classy):
+        title: str
+
+    with pytest.raises(TypeError):
+        Draft.write_records([Draft(title="x")], path)
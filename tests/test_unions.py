@@ -0,0 +1,143 @@
+import pytest
+from datetime import datetime
+from enum import Enum
+from typing import Dict, List, Literal, Optional, Tuple, Union
+from uuid import UUID, uuid4
+from python_classy import Classy, immutable, mutable
+
+
+class Kind(Enum):
+    PAUSED = "paused"
+
+
+@immutable(value_equality=True)
+class Student(Classy):
+    id: UUID
+    name: str
+
+
+@immutable
+class Roster(Classy):
+    leader: Optional[Student]
+    deputy: Student | None
+    students: List[Student]
+    by_name: Dict[str, Student]
+    pair: Tuple[Student, int]
+    level: Literal["low", "high"]
+
+
+@immutable
+class Created(Classy):
+    type: Literal["created"]
+    name: str
+
+
+@immutable
+class Renamed(Classy):
+    type: Literal["renamed"]
+    old: str
+    new: str
+
+
+@immutable
+class Paused(Classy):
+    type: Literal[Kind.PAUSED]
+    at: datetime
+
+
+@immutable(tag="kind")
+class Opened(Classy):
+    id: int
+    kind: Literal["opened"]
+
+
+@immutable(tag="kind")
+class Closed(Classy):
+    id: int
+    kind: Literal["closed"]
+
+
+@mutable
+class Stream(Classy):
+    events: list[Created | Renamed | Paused]
+    door: Union[Opened, Closed, None]
+    value: int | UUID
+
+
+@mutable
+class Shelf(Classy):
+    left: Student | Roster
+
+
+def _student() -> Student:
+    return Student(id=uuid4(), name="John")
+
+
+def test_optional_and_typing_aliases() -> None:
+    student: Student = _student()
+    payload: dict = {
+        "leader": None,
+        "deputy": student.dict,
+        "students": [student.dict],
+        "by_name": {"John": student.dict},
+        "pair": [student.dict, 1],
+        "level": "high",
+    }
+    value: Roster = Roster.from_dict(payload)
+    assert value.leader is None
+    assert value.deputy == student
+    assert value.students == [student]
+    assert value.by_name == {"John": student}
+    assert value.pair == (student, 1)
+    assert Roster.from_json(value.json).dict == value.dict
+    lazy: Roster = Roster.from_dict(payload, defer=True)
+    assert lazy.deputy == student and lazy.leader is None
+
+
+def test_literal_rejects_unknown_values() -> None:
+    with pytest.raises(TypeError):
+        Created.from_dict({"type": "deleted", "name": "John"})
+
+
+def test_discriminated_union() -> None:
+    events: list[dict] = [
+        {"type": "created", "name": "John"},
+        {"type": "renamed", "old": "John", "new": "Sarah"},
+        {"type": "paused", "at": "2023-01-01T09:30:00"},
+    ]
+    value: Stream = Stream.from_dict(
+        {"events": events, "door": {"id": 1, "kind": "closed"}, "value": 3}
+    )
+    assert [type(x) for x in value.events] == [Created, Renamed, Paused]
+    assert value.events[2].type is Kind.PAUSED
+    assert type(value.door) is Closed
+    assert Stream.from_json(value.json).dict == value.dict
+    value = Stream.from_dict(
+        {"events": [], "door": None, "value": "%s" % uuid4()}
+    )
+    assert value.door is None and type(value.value) is UUID
+    with pytest.raises(TypeError):
+        Stream.from_dict(
+            {"events": [{"type": "deleted"}], "door": None, "value": 1}
+        )
+
+
+def test_union_without_tag_tries_each_member() -> None:
+    student: Student = _student()
+    assert Shelf.from_dict({"left": student.dict}).left == student
+
+
+def test_default_of_unions_and_literals() -> None:
+    roster: Roster = Roster.default()
+    assert roster.leader is None and roster.deputy is None
+    assert roster.level == "low"
+    assert Created.default() is Created.default()
+    assert type(Stream.default().value) is int
+
+
+def test_tag_has_to_be_a_field() -> None:
+    with pytest.raises(TypeError):
+
+        @immutable(tag="kind")
+        class Invalid(Classy):
+            name: str
@@ -0,0 +1,173 @@
+import pickle
+import pytest
+from typing import Any, Iterator, Literal
+from python_classy import (
+    Classy,
+    ValidationError,
+    immutable,
+    mutable,
+    set_validation,
+)
+
+
+@immutable(value_equality=True)
+class Tag(Classy):
+    name: str
+
+
+@mutable(validate=True)
+class Product(Classy):
+    name: str
+    price: float
+    tags: list[Tag]
+    stock: dict[str, int]
+    parent: Tag | None = None
+    state: Literal["draft", "live"] = "draft"
+
+
+@immutable(validate=False)
+class Unchecked(Classy):
+    count: int
+
+
+@immutable
+class Following(Classy):
+    count: int
+
+
+@pytest.fixture
+def validation() -> Iterator[None]:
+    set_validation(True)
+    yield
+    set_validation(False)
+
+
+def test_all_errors_are_reported_together() -> None:
+    with pytest.raises(ValidationError) as error:
+        Product(
+            name=1,
+            price="free",
+            tags=[Tag(name="a"), "b"],
+            stock={"kr": "1"},
+            state="sold",
+        )
+    assert str(error.value).startswith("5 validation errors for 'Product'")
+    assert [x["field"] for x in error.value.errors] == [
+        "name",
+        "price",
+        "tags",
+        "stock",
+        "state",
+    ]
+    assert error.value.errors[0] == {
+        "field": "name",
+        "expected": "str",
+        "actual": "int",
+        "value": 1,
+    }
+    assert isinstance(error.value, TypeError)
+
+
+def test_valid_values_are_accepted() -> None:
+    product: Product = Product(
+        name="pen", price=1, tags=[Tag(name="a")], stock={"kr": 1}
+    )
+    assert product.price == 1
+    assert Product.from_dict(product.dict).dict == product.dict
+
+
+def test_from_dict_is_validated() -> None:
+    with pytest.raises(ValidationError, match="price: expected float"):
+        Product.from_dict(
+            {"name": "pen", "price": "1", "tags": [], "stock": {}}
+        )
+
+
+def test_lazy_fields_are_not_forced() -> None:
+    product: Any = Product.from_dict(
+        {
+            "name": "pen",
+            "price": 1.0,
+            "tags": [{"name": "a"}],
+            "stock": {},
+            "parent": {"name": "b"},
+        },
+        defer=True,
+    )
+    assert type(product.__dict__["tags"]).__name__ == "Thunk"
+    assert product.tags == [Tag(name="a")]
+
+
+def test_evolve_validates_changed_fields() -> None:
+    product: Product = Product(name="pen", price=1.0, tags=[], stock={})
+    product.name = 1  # type: ignore
+    assert product.evolve(price=2.0).price == 2.0
+    with pytest.raises(ValidationError, match="1 validation error "):
+        product.evolve(price="2")
+
+
+def test_global_toggle(validation: None) -> None:
+    with pytest.raises(ValidationError):
+        Following(count="1")
+    assert Unchecked(count="1").count == "1"
+    set_validation(False)
+    assert not hasattr(Following.__init__, "__wrapped__")
+    assert Following(count="1").count == "1"
+    with pytest.raises(ValidationError):
+        Product(name="pen", price=None, tags=[], stock={})
+
+
+def test_sampled_collections(validation: None) -> None:
+    set_validation(True, sample_size=2)
+    tags: list[Any] = [Tag(name="a")] * 9 + ["b"]
+    assert Product(name="pen", price=1.0, tags=tags, stock={})
+    with pytest.raises(ValidationError):
+        Product(name="pen", price=1.0, tags=["b", *tags], stock={})
+    with pytest.raises(ValueError):
+        set_validation(True, sample_size=0)
+
+
+def test_validation_error_is_picklable() -> None:
+    with pytest.raises(ValidationError) as error:
+        Product(name="pen", price=1.0, tags=[], stock=[])
+    restored: ValidationError = pickle.loads(pickle.dumps(error.value))
+    assert str(restored) == str(error.value)
+    assert restored.errors == error.value.errors
+
+
+def test_nested_errors_are_reported_with_the_parent() -> None:
+    @immutable(validate=True)
+    class Student(Classy):
+        name: str
+        age: int
+
+    @immutable(validate=True)
+    class Course(Classy):
+        title: str
+        leader: Student
+        students: list[Student]
+
+    with pytest.raises(ValidationError) as error:
+        Course.from_dict(
+            {
+                "title": 1,
+                "leader": {"name": 3, "age": "x"},
+                "students": [{"name": "a", "age": 1}],
+            }
+        )
+    assert [x["field"] for x in error.value.errors] == [
+        "title",
+        "leader.name",
+        "leader.age",
+    ]
+    assert str(error.value).startswith("3 validation errors for 'Course'")
+    assert "  leader.name: expected str, got int" in str(error.value)
+    with pytest.raises(ValidationError) as error:
+        Course.from_dict(
+            {
+                "title": "x",
+                "leader": {"name": "a", "age": 1},
+                "students": [{"name": "b", "age": None}],
+            }
+        )
+    assert [x["field"] for x in error.value.errors] == ["students.age"]